@@ -42,14 +42,21 @@ class BacktestEngine:
         
         self.logger.info("백테스팅 엔진 초기화 완료")
     
-    def run_backtest(self, symbol: str, start_date: str, end_date: str, 
-                    strategy: str = 'integrated') -> Dict[str, Any]:
-        """단일 코인 백테스팅 실행"""
+    def prepare_data(self, symbol: str, start_date: str, end_date: str) -> pd.DataFrame:
+        """백테스팅용 캔들 데이터를 한 번 로드해 반환 (여러 전략 실행 시 run_backtest(data=...) 로 재사용)"""
+        return self._load_data(symbol, start_date, end_date)
+    
+    def run_backtest(self, symbol: str, start_date: Optional[str] = None, end_date: Optional[str] = None, 
+                    strategy: str = 'integrated', data: Optional[pd.DataFrame] = None) -> Dict[str, Any]:
+        """단일 코인 백테스팅 실행 (data 가 주어지면 DB 로드를 건너뜀)"""
         try:
-            self.logger.info(f"{symbol} 백테스팅 시작: {start_date} ~ {end_date}")
-            
             # 데이터 로드
-            df = self._load_data(symbol, start_date, end_date)
+            if data is None:
+                self.logger.info(f"{symbol} 백테스팅 시작: {start_date} ~ {end_date}")
+                df = self._load_data(symbol, start_date, end_date)
+            else:
+                self.logger.info(f"{symbol} 백테스팅 시작: 준비된 데이터 {len(data)}개 캔들 ({strategy})")
+                df = data
             if df.empty:
                 return {'error': '데이터 없음'}
             
@@ -3,9 +3,63 @@
 """
 
 import os
-from typing import Optional
+import sys
+import functools
+from typing import Optional, Tuple, Dict, Any
 from dataclasses import dataclass
 
+def _env_bool(value: str) -> bool:
+    """'true' (대소문자 무관) 만 참"""
+    return value.lower() == 'true'
+
+# from_env() 환경 변수 표 - (환경 변수, 필드, 변환 함수, 미설정 시 기본값)
+_ENV_SPEC = (
+    # Binance API 설정
+    ('BINANCE_API_KEY', 'binance_api_key', str, ''),
+    ('BINANCE_SECRET_KEY', 'binance_secret_key', str, ''),
+    ('BINANCE_TESTNET', 'binance_testnet', _env_bool, 'false'),
+    ('BINANCE_API_URL', 'binance_api_url', str, 'https://api.binance.com'),
+    
+    # 데이터베이스 설정
+    ('DATABASE_PATH', 'database_path', str, './data/trading_bot.db'),
+    
+    # 로깅 설정
+    ('LOG_LEVEL', 'log_level', str, 'INFO'),
+    ('LOG_FILE', 'log_file', str, './logs/trading_bot.log'),
+    
+    # 거래 설정
+    ('TRADING_SYMBOL', 'trading_symbol', str, 'BTCUSDT'),
+    ('INITIAL_CAPITAL', 'initial_capital', float, '3000000'),
+    ('MAX_POSITION_SIZE', 'max_position_size', float, '0.1'),
+    ('STOP_LOSS_PERCENT', 'stop_loss_percent', float, '0.02'),
+    ('TAKE_PROFIT_PERCENT', 'take_profit_percent', float, '0.04'),
+    
+    # 알림 설정 (미설정 시 None)
+    ('TELEGRAM_BOT_TOKEN', 'telegram_bot_token', str, None),
+    ('TELEGRAM_CHAT_ID', 'telegram_chat_id', str, None),
+    
+    # 개발 환경 설정
+    ('DEBUG_MODE', 'debug_mode', _env_bool, 'true'),
+    ('BACKTEST_MODE', 'backtest_mode', _env_bool, 'false'),
+    
+    # 50개 코인 설정
+    ('SELECTED_COINS_FILE', 'selected_coins_file', str, './selected_coins.json'),
+    ('MAX_COINS', 'max_coins', int, '50'),
+)
+
+# from_env() 캐시 키 순서
+_ENV_KEYS = tuple(spec[0] for spec in _ENV_SPEC)
+
+@functools.lru_cache(maxsize=32)
+def _parse_env(values: Tuple[Optional[str], ...]) -> Dict[str, Any]:
+    """환경 변수 값 튜플 -> Config 인자 (같은 환경이면 변환 결과 재사용)"""
+    kwargs = {}
+    for (key, field, cast, default), value in zip(_ENV_SPEC, values):
+        if value is None:
+            value = default
+        kwargs[field] = None if value is None else cast(value)
+    return kwargs
+
 @dataclass
 class Config:
     """봇 설정 클래스"""
@@ -44,40 +98,8 @@ class Config:
     
     @classmethod
     def from_env(cls) -> 'Config':
-        """환경 변수에서 설정 로드"""
-        return cls(
-            # Binance API 설정
-            binance_api_key=os.getenv('BINANCE_API_KEY', ''),
-            binance_secret_key=os.getenv('BINANCE_SECRET_KEY', ''),
-            binance_testnet=os.getenv('BINANCE_TESTNET', 'false').lower() == 'true',
-            binance_api_url=os.getenv('BINANCE_API_URL', 'https://api.binance.com'),
-            
-            # 데이터베이스 설정
-            database_path=os.getenv('DATABASE_PATH', './data/trading_bot.db'),
-            
-            # 로깅 설정
-            log_level=os.getenv('LOG_LEVEL', 'INFO'),
-            log_file=os.getenv('LOG_FILE', './logs/trading_bot.log'),
-            
-            # 거래 설정
-            trading_symbol=os.getenv('TRADING_SYMBOL', 'BTCUSDT'),
-            initial_capital=float(os.getenv('INITIAL_CAPITAL', '3000000')),
-            max_position_size=float(os.getenv('MAX_POSITION_SIZE', '0.1')),
-            stop_loss_percent=float(os.getenv('STOP_LOSS_PERCENT', '0.02')),
-            take_profit_percent=float(os.getenv('TAKE_PROFIT_PERCENT', '0.04')),
-            
-            # 알림 설정
-            telegram_bot_token=os.getenv('TELEGRAM_BOT_TOKEN'),
-            telegram_chat_id=os.getenv('TELEGRAM_CHAT_ID'),
-            
-            # 개발 환경 설정
-            debug_mode=os.getenv('DEBUG_MODE', 'true').lower() == 'true',
-            backtest_mode=os.getenv('BACKTEST_MODE', 'false').lower() == 'true',
-            
-            # 50개 코인 설정
-            selected_coins_file=os.getenv('SELECTED_COINS_FILE', './selected_coins.json'),
-            max_coins=int(os.getenv('MAX_COINS', '50'))
-        )
+        """환경 변수에서 설정 로드 (변환 결과는 환경 값 기준으로 캐시, 인스턴스는 매번 새로 생성)"""
+        return cls(**_parse_env(tuple(os.environ.get(key) for key in _ENV_KEYS)))
     
     def validate_required(self) -> bool:
         """필수 설정 검증"""
@@ -89,19 +111,22 @@ class Config:
         return all(field for field in required_fields)
     
     def print_config_summary(self):
-        """설정 요약 출력"""
-        print("="*50)
-        print("🤖 트레이딩 봇 설정 요약")
-        print("="*50)
-        print(f"거래 심볼: {self.trading_symbol}")
-        print(f"초기 자본: {self.initial_capital:,.0f} KRW")
-        print(f"최대 포지션 크기: {self.max_position_size*100:.1f}%")
-        print(f"손절 비율: {self.stop_loss_percent*100:.1f}%")
-        print(f"익절 비율: {self.take_profit_percent*100:.1f}%")
-        print(f"데버그 모드: {self.debug_mode}")
-        print(f"백테스트 모드: {self.backtest_mode}")
-        print(f"50개 코인 파일: {self.selected_coins_file}")
-        print("="*50)
+        """설정 요약 출력 (한 번에 모아서 기록)"""
+        lines = [
+            "="*50,
+            "🤖 트레이딩 봇 설정 요약",
+            "="*50,
+            f"거래 심볼: {self.trading_symbol}",
+            f"초기 자본: {self.initial_capital:,.0f} KRW",
+            f"최대 포지션 크기: {self.max_position_size*100:.1f}%",
+            f"손절 비율: {self.stop_loss_percent*100:.1f}%",
+            f"익절 비율: {self.take_profit_percent*100:.1f}%",
+            f"데버그 모드: {self.debug_mode}",
+            f"백테스트 모드: {self.backtest_mode}",
+            f"50개 코인 파일: {self.selected_coins_file}",
+            "="*50
+        ]
+        sys.stdout.write("\n".join(lines) + "\n")
 
 # 사용 예시
 if __name__ == "__main__":
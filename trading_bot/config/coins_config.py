@@ -5,6 +5,7 @@
 
 import json
 import os
+import sys
 from typing import List, Dict, Any
 
 class CoinsConfig:
@@ -52,11 +53,10 @@ class CoinsConfig:
         return len(self.coins)
     
     def print_coins_summary(self):
-        """코인 요약 출력"""
-        print(f"📊 총 {len(self.coins)}개 코인 등록됨")
-        print("상위 10개 코인:")
-        for i, coin in enumerate(self.coins[:10], 1):
-            print(f"  {i:2d}. {coin.replace('USDT', '')}")
+        """코인 요약 출력 (한 번에 모아서 기록)"""
+        lines = [f"📊 총 {len(self.coins)}개 코인 등록됨", "상위 10개 코인:"]
+        lines.extend(f"  {i:2d}. {coin.replace('USDT', '')}" for i, coin in enumerate(self.coins[:10], 1))
+        sys.stdout.write("\n".join(lines) + "\n")
 
 # 사용 예시
 if __name__ == "__main__":
@@ -3,7 +3,10 @@ SQLite 데이터베이스 관리 클래스
 """
 
 import sqlite3
+import threading
+from itertools import chain
 import pandas as pd
+from contextlib import contextmanager
 from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 import logging
@@ -12,6 +15,12 @@ import os
 class Database:
     """SQLite 데이터베이스 관리 클래스"""
     
+    # 다중 VALUES INSERT 한 번에 넣는 캔들 수 (6컬럼 × 166 = 996, 구버전 SQLite 바인딩 변수 한도 999 이하)
+    INSERT_BATCH_ROWS = 166
+    
+    # 테이블 구조를 바꾸면 올릴 것 - PRAGMA user_version 이 같으면 init_database 가 테이블 생성을 건너뜀
+    SCHEMA_VERSION = 1
+    
     def __init__(self, db_path: str = None):
         """데이터베이스 초기화"""
         if db_path is None:
@@ -22,9 +31,16 @@ class Database:
         self.db_path = db_path
         self.logger = logging.getLogger(__name__)
         
-        # 데이터베이스 디렉토리 생성 (기존 파일이 있으면 건너뛰기)
+        # bulk() 블록 안에서 저장 메서드들이 공유하는 연결과 블록 밖에서 재사용하는 연결 (스레드별)
+        self._bulk = threading.local()
+        
+        # 모든 스레드의 재사용 연결 (close() 가 다른 스레드의 연결까지 닫을 수 있도록 인스턴스에서 추적)
+        self._connections = set()
+        self._connections_lock = threading.Lock()
+        
+        # 데이터베이스 디렉토리 생성 (기존 파일이 있거나 "file:" URI 면 건너뛰기)
         dir_path = os.path.dirname(db_path)
-        if not os.path.exists(dir_path):
+        if dir_path and not db_path.startswith("file:") and not os.path.exists(dir_path):
             os.makedirs(dir_path, exist_ok=True)
         
         # 데이터베이스 연결 및 테이블 생성
@@ -33,9 +49,14 @@ class Database:
     def init_database(self):
         """데이터베이스 초기화 및 테이블 생성"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self.connect() as conn:
                 cursor = conn.cursor()
                 
+                # 이미 현재 스키마로 초기화된 DB면 750개 테이블 DDL을 다시 실행하지 않음
+                cursor.execute("PRAGMA user_version")
+                if cursor.fetchone()[0] == self.SCHEMA_VERSION:
+                    return
+                
                 # 기본 가격 데이터 테이블
                 cursor.execute("""
                     CREATE TABLE IF NOT EXISTS price_data (
@@ -72,26 +93,26 @@ class Database:
                     '1d', '3d', '1w', '1month'  # 일봉, 주봉, 월봉
                 ]
                 
-                # 코인별 간격별 테이블 생성
-                for coin in coins:
-                    for interval in intervals:
-                        table_name = f"{coin}_{interval}"
-                        cursor.execute(f"""
-                            CREATE TABLE IF NOT EXISTS {table_name} (
-                                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                                timestamp INTEGER NOT NULL,
-                                open_price REAL NOT NULL,
-                                high_price REAL NOT NULL,
-                                low_price REAL NOT NULL,
-                                close_price REAL NOT NULL,
-                                volume REAL NOT NULL,
-                                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                                UNIQUE(timestamp)
-                            )
-                        """)
-                        
-                        # 인덱스 생성
-                        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_{table_name}_timestamp ON {table_name}(timestamp)")
+                # 코인별 간격별 테이블/인덱스 생성 - DDL 하나씩 자동 커밋하지 않고
+                # 전체를 한 스크립트로 묶어 단일 트랜잭션에서 실행
+                coin_tables_sql = "\n".join(
+                    f"""
+                    CREATE TABLE IF NOT EXISTS {coin}_{interval} (
+                        id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        timestamp INTEGER NOT NULL,
+                        open_price REAL NOT NULL,
+                        high_price REAL NOT NULL,
+                        low_price REAL NOT NULL,
+                        close_price REAL NOT NULL,
+                        volume REAL NOT NULL,
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        UNIQUE(timestamp)
+                    );
+                    CREATE INDEX IF NOT EXISTS idx_{coin}_{interval}_timestamp ON {coin}_{interval}(timestamp);"""
+                    for coin in coins
+                    for interval in intervals
+                )
+                cursor.executescript(f"BEGIN IMMEDIATE;\n{coin_tables_sql}\nCOMMIT;")
                 
                 # 감정 데이터 테이블
                 cursor.execute("""
@@ -144,6 +165,7 @@ class Database:
                     )
                 """)
                 
+                cursor.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
                 conn.commit()
                 self.logger.info("데이터베이스 초기화 완료")
                 
@@ -151,10 +173,101 @@ class Database:
             self.logger.error(f"데이터베이스 초기화 실패: {e}")
             raise
     
+    @contextmanager
+    def session(self):
+        """블록 안의 저장/조회 호출이 연결 하나를 재사용 (커밋은 호출마다 그대로)"""
+        conn = getattr(self._bulk, 'conn', None)
+        if conn is not None:
+            # 중첩된 session()/bulk() 안이면 바깥 연결 재사용
+            yield conn
+            return
+        
+        conn = self.connect()
+        self._bulk.conn = conn
+        self._bulk.batch = False
+        try:
+            yield conn
+        finally:
+            self._bulk.conn = None
+            conn.close()
+    
+    @contextmanager
+    def bulk(self):
+        """여러 저장 호출을 하나의 연결과 트랜잭션으로 묶음 (블록 종료 시 커밋, 예외 시 롤백)"""
+        if getattr(self._bulk, 'batch', False):
+            # 중첩된 bulk() 는 바깥 트랜잭션에 합류
+            yield self._bulk.conn.cursor()
+            return
+        
+        with self.session() as conn:
+            if conn.in_transaction:
+                # session() 연결에 호출자가 커밋하지 않은 변경이 있으면 대신 커밋하지 않음
+                raise RuntimeError("커밋되지 않은 트랜잭션이 열린 연결에서는 bulk() 를 시작할 수 없습니다")
+            conn.execute("BEGIN IMMEDIATE")
+            self._bulk.batch = True
+            try:
+                yield conn.cursor()
+                conn.commit()
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._bulk.batch = False
+    
+    @contextmanager
+    def _connection(self):
+        """session()/bulk() 블록 안이면 공유 연결, 아니면 스레드별로 재사용하는 연결"""
+        conn = getattr(self._bulk, 'conn', None)
+        if conn is not None and self._bulk.batch:
+            yield conn
+            return
+        
+        if conn is None:
+            conn = self._thread_connection()
+        
+        # 재사용 연결에서도 실패한 호출의 변경은 그 호출 안에서 되돌림
+        try:
+            yield conn
+        except BaseException:
+            conn.rollback()
+            raise
+    
+    def _thread_connection(self) -> sqlite3.Connection:
+        """스레드마다 처음 한 번만 열고 이후 호출에서 재사용하는 연결 (페이지/문장 캐시 유지)"""
+        conn = getattr(self._bulk, 'cached', None)
+        if conn is None or conn not in self._connections:
+            # 처음 사용하거나 close() 로 닫힌 경우 새로 열기 (close() 는 다른 스레드에서 호출될 수 있음)
+            conn = self.connect(check_same_thread=False)
+            with self._connections_lock:
+                self._connections.add(conn)
+            self._bulk.cached = conn
+        return conn
+    
+    def close(self):
+        """모든 스레드의 재사용 연결 닫기 (각 스레드의 다음 호출 시 다시 열림)
+        
+        다른 스레드가 연결을 사용하는 중에는 호출하지 않아야 합니다.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, set()
+        for conn in connections:
+            conn.close()
+    
+    def _commit(self, conn: sqlite3.Connection):
+        """bulk() 블록 밖에서만 커밋 (블록 안에서는 블록 종료 시 한 번에 커밋)"""
+        if not getattr(self._bulk, 'batch', False):
+            conn.commit()
+    
+    def _read_frame(self, conn: sqlite3.Connection, query: str, params: tuple) -> pd.DataFrame:
+        """조회 결과를 커서에서 바로 DataFrame으로 변환 (pd.read_sql_query 의 추가 처리 없이)"""
+        cursor = conn.execute(query, params)
+        columns = [column[0] for column in cursor.description]
+        return pd.DataFrame.from_records(cursor.fetchall(), columns=columns)
+    
     def save_price_data(self, symbol: str, data: Dict[str, Any]):
         """가격 데이터 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -171,32 +284,39 @@ class Database:
                     data['volume']
                 ))
                 
-                conn.commit()
+                self._commit(conn)
                 
         except Exception as e:
             self.logger.error(f"가격 데이터 저장 실패: {e}")
     
+    def _insert_candles(self, cursor: sqlite3.Cursor, table_name: str, data: List[Dict[str, Any]]):
+        """캔들 목록을 INSERT_BATCH_ROWS 행씩 다중 VALUES INSERT 로 저장"""
+        for start in range(0, len(data), self.INSERT_BATCH_ROWS):
+            batch = data[start:start + self.INSERT_BATCH_ROWS]
+            values = ", ".join(["(?, ?, ?, ?, ?, ?)"] * len(batch))
+            params = list(chain.from_iterable(
+                (item['timestamp'], item['open'], item['high'], item['low'], item['close'], item['volume'])
+                for item in batch
+            ))
+            cursor.execute(f"""
+                INSERT OR REPLACE INTO {table_name} 
+                (timestamp, open_price, high_price, low_price, close_price, volume)
+                VALUES {values}
+            """, params)
+    
     def save_price_data_to_table(self, symbol: str, data: List[Dict[str, Any]], table_name: str):
         """특정 테이블에 가격 데이터 저장"""
+        # 빈 묶음은 연결/커밋 없이 바로 건너뜀
+        if not data:
+            return
+        
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                for item in data:
-                    cursor.execute(f"""
-                        INSERT OR REPLACE INTO {table_name} 
-                        (timestamp, open_price, high_price, low_price, close_price, volume)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        item['timestamp'],
-                        item['open'],
-                        item['high'],
-                        item['low'],
-                        item['close'],
-                        item['volume']
-                    ))
+                self._insert_candles(cursor, table_name, data)
                 
-                conn.commit()
+                self._commit(conn)
                 self.logger.info(f"{symbol} {table_name} 테이블에 {len(data)}개 데이터 저장 완료")
                 
         except Exception as e:
@@ -205,53 +325,88 @@ class Database:
     
     def save_price_data_to_coin_table(self, symbol: str, interval: str, data: List[Dict[str, Any]]):
         """코인별 간격별 테이블에 가격 데이터 저장"""
+        # 빈 묶음은 연결/커밋 없이 바로 건너뜀
+        if not data:
+            return
+        
         try:
             table_name = f"{symbol}_{interval}"
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                for item in data:
-                    cursor.execute(f"""
-                        INSERT OR REPLACE INTO {table_name} 
-                        (timestamp, open_price, high_price, low_price, close_price, volume)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                    """, (
-                        item['timestamp'],
-                        item['open'],
-                        item['high'],
-                        item['low'],
-                        item['close'],
-                        item['volume']
-                    ))
+                self._insert_candles(cursor, table_name, data)
                 
                 # 마지막 수집 타임스탬프 업데이트
-                if data:
-                    last_timestamp = data[-1]['timestamp']
-                    cursor.execute("""
-                        INSERT OR REPLACE INTO data_collection_status 
-                        (symbol, interval, last_collected_timestamp, last_updated)
-                        VALUES (?, ?, ?, CURRENT_TIMESTAMP)
-                    """, (symbol, interval, last_timestamp))
+                last_timestamp = data[-1]['timestamp']
+                cursor.execute("""
+                    INSERT OR REPLACE INTO data_collection_status 
+                    (symbol, interval, last_collected_timestamp, last_updated)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """, (symbol, interval, last_timestamp))
                 
-                conn.commit()
+                self._commit(conn)
                 self.logger.info(f"{symbol} {interval}: {len(data)}개 캔들 저장 완료")
                 
         except Exception as e:
             self.logger.error(f"{symbol} {interval} 데이터 저장 실패: {e}")
             raise
     
+    def save_price_dataframe_to_coin_table(self, symbol: str, interval: str, df: pd.DataFrame):
+        """코인별 간격별 테이블에 데이터프레임 일괄 저장 (단일 트랜잭션, executemany)
+        
+        df 컬럼: timestamp(밀리초 정수 또는 datetime64), open, high, low, close, volume
+        """
+        # 빈 묶음은 블록 매니저를 거치는 df.empty 대신 길이로 바로 건너뜀
+        if df is None or not len(df):
+            return
+        
+        try:
+            table_name = f"{symbol}_{interval}"
+            
+            # datetime64 타임스탬프는 행 단위 변환 없이 컬럼 전체를 밀리초 정수로 변환
+            timestamps = df['timestamp'].values
+            if pd.api.types.is_datetime64_any_dtype(df['timestamp']):
+                timestamps = timestamps.astype('datetime64[ms]').view('int64')
+            
+            # 컬럼별 파이썬 리스트를 튜플 행으로 묶어 한 번에 전달
+            rows = zip(timestamps.tolist(), *(df[col].tolist() for col in ['open', 'high', 'low', 'close', 'volume']))
+            
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany(f"""
+                    INSERT OR REPLACE INTO {table_name} 
+                    (timestamp, open_price, high_price, low_price, close_price, volume)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, rows)
+                
+                # 마지막 수집 타임스탬프 업데이트
+                last_timestamp = int(timestamps[-1])
+                cursor.execute("""
+                    INSERT OR REPLACE INTO data_collection_status 
+                    (symbol, interval, last_collected_timestamp, last_updated)
+                    VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+                """, (symbol, interval, last_timestamp))
+                
+                self._commit(conn)
+                self.logger.info(f"{symbol} {interval}: {len(df)}개 캔들 저장 완료")
+                
+        except Exception as e:
+            self.logger.error(f"{symbol} {interval} 데이터 저장 실패: {e}")
+            raise
+    
     def get_price_data(self, symbol: str, start_time: int = None, end_time: int = None, limit: int = None) -> pd.DataFrame:
         """가격 데이터 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 if start_time and end_time:
                     query = """
                         SELECT * FROM price_data 
                         WHERE symbol = ? AND timestamp BETWEEN ? AND ?
                         ORDER BY timestamp ASC
                     """
-                    df = pd.read_sql_query(query, conn, params=(symbol, start_time, end_time))
+                    df = self._read_frame(conn, query, (symbol, start_time, end_time))
                 elif limit:
                     query = """
                         SELECT * FROM price_data 
@@ -259,7 +414,7 @@ class Database:
                         ORDER BY timestamp DESC
                         LIMIT ?
                     """
-                    df = pd.read_sql_query(query, conn, params=(symbol, limit))
+                    df = self._read_frame(conn, query, (symbol, limit))
                 else:
                     query = """
                         SELECT * FROM price_data 
@@ -267,7 +422,7 @@ class Database:
                         ORDER BY timestamp DESC
                         LIMIT 100
                     """
-                    df = pd.read_sql_query(query, conn, params=(symbol,))
+                    df = self._read_frame(conn, query, (symbol,))
                 
                 return df
                 
@@ -279,7 +434,7 @@ class Database:
                            keywords: str, timestamp: int):
         """감정 데이터 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -288,7 +443,7 @@ class Database:
                     VALUES (?, ?, ?, ?, ?)
                 """, (source, headline, sentiment_score, keywords, timestamp))
                 
-                conn.commit()
+                self._commit(conn)
                 
         except Exception as e:
             self.logger.error(f"감정 데이터 저장 실패: {e}")
@@ -296,13 +451,13 @@ class Database:
     def get_sentiment_data(self, limit: int = 100) -> pd.DataFrame:
         """감정 데이터 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 query = """
                     SELECT * FROM sentiment_data 
                     ORDER BY timestamp DESC
                     LIMIT ?
                 """
-                df = pd.read_sql_query(query, conn, params=(limit,))
+                df = self._read_frame(conn, query, (limit,))
                 return df
                 
         except Exception as e:
@@ -312,7 +467,7 @@ class Database:
     def save_realtime_data(self, symbol: str, price: float, volume: float, timestamp: int):
         """실시간 데이터 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -321,7 +476,7 @@ class Database:
                     VALUES (?, ?, ?, ?)
                 """, (symbol, price, volume, timestamp))
                 
-                conn.commit()
+                self._commit(conn)
                 
         except Exception as e:
             self.logger.error(f"실시간 데이터 저장 실패: {e}")
@@ -330,7 +485,7 @@ class Database:
                    price: float, timestamp: int, status: str):
         """거래 기록 저장"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -339,15 +494,74 @@ class Database:
                     VALUES (?, ?, ?, ?, ?, ?)
                 """, (symbol, side, quantity, price, timestamp, status))
                 
-                conn.commit()
+                self._commit(conn)
                 
         except Exception as e:
             self.logger.error(f"거래 기록 저장 실패: {e}")
     
+    def save_trades(self, trades: List[tuple]):
+        """거래 기록 일괄 저장 (단일 트랜잭션, executemany)
+        
+        trades: (symbol, side, quantity, price, timestamp, status) 튜플 목록
+        """
+        if not trades:
+            return
+        
+        try:
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                
+                cursor.executemany("""
+                    INSERT INTO trades 
+                    (symbol, side, quantity, price, timestamp, status)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                """, trades)
+                
+                self._commit(conn)
+                
+        except Exception as e:
+            self.logger.error(f"거래 기록 일괄 저장 실패: {e}")
+    
+    def bulk_load(self, table_name: str, columns: List[str], rows: List[tuple]):
+        """대량 행 적재 - 보조 인덱스를 내렸다가 적재 후 다시 생성 (단일 트랜잭션, executemany)
+        
+        rows: columns 순서의 값 튜플 목록. PRIMARY KEY/UNIQUE 자동 인덱스는 그대로 유지됨
+        """
+        if not rows:
+            return
+        
+        try:
+            with self.bulk() as cursor:
+                # 직접 만든 인덱스만 대상 (자동 인덱스는 sql 이 NULL)
+                cursor.execute("""
+                    SELECT name, sql FROM sqlite_master 
+                    WHERE type = 'index' AND tbl_name = ? AND sql IS NOT NULL
+                """, (table_name,))
+                indexes = cursor.fetchall()
+                
+                for index_name, _ in indexes:
+                    cursor.execute(f"DROP INDEX {index_name}")
+                
+                placeholders = ", ".join(["?"] * len(columns))
+                cursor.executemany(f"""
+                    INSERT INTO {table_name} 
+                    ({", ".join(columns)})
+                    VALUES ({placeholders})
+                """, rows)
+                
+                for _, index_sql in indexes:
+                    cursor.execute(index_sql)
+                
+            self.logger.info(f"{table_name} 테이블에 {len(rows)}개 행 일괄 적재 완료")
+            
+        except Exception as e:
+            self.logger.error(f"{table_name} 테이블 일괄 적재 실패: {e}")
+            raise
+    
     def get_trades(self, symbol: str = None, limit: int = 100) -> pd.DataFrame:
         """거래 기록 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 if symbol:
                     query = """
                         SELECT * FROM trades 
@@ -355,14 +569,14 @@ class Database:
                         ORDER BY timestamp DESC
                         LIMIT ?
                     """
-                    df = pd.read_sql_query(query, conn, params=(symbol, limit))
+                    df = self._read_frame(conn, query, (symbol, limit))
                 else:
                     query = """
                         SELECT * FROM trades 
                         ORDER BY timestamp DESC
                         LIMIT ?
                     """
-                    df = pd.read_sql_query(query, conn, params=(limit,))
+                    df = self._read_frame(conn, query, (limit,))
                 
                 return df
                 
@@ -373,7 +587,7 @@ class Database:
     def get_last_collected_timestamp(self, symbol: str, interval: str) -> Optional[int]:
         """마지막으로 수집된 타임스탬프 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 cursor.execute("""
@@ -411,14 +625,14 @@ class Database:
             self.logger.error(f"누락 데이터 기간 조회 실패: {e}")
             return None
     
-    def connect(self):
-        """데이터베이스 연결"""
-        return sqlite3.connect(self.db_path)
+    def connect(self, check_same_thread: bool = True):
+        """데이터베이스 연결 ("file:...?mode=memory&cache=shared" 같은 URI 경로도 허용)"""
+        return sqlite3.connect(self.db_path, uri=True, check_same_thread=check_same_thread)
     
     def get_database_info(self) -> Dict[str, Any]:
         """데이터베이스 정보 조회"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # 기본 테이블별 레코드 수 조회
@@ -3,10 +3,14 @@
 전체 프로젝트 커버리지 테스트 실행
 """
 
+import importlib.util
 import subprocess
 import sys
 import os
 
+# pytest-xdist 설치 시 테스트를 병렬 실행 - 환경 변수/모듈 상태를 바꾸는 테스트끼리 섞이지 않도록 파일 단위로 워커 배정
+XDIST_ARGS = ["-n", "auto", "--dist", "loadfile"] if importlib.util.find_spec("xdist") else []
+
 def run_coverage_test():
     """전체 프로젝트 커버리지 테스트 실행"""
     print("🚀 전체 프로젝트 커버리지 테스트 시작")
@@ -16,7 +20,7 @@ def run_coverage_test():
     print("📊 Config 클래스 커버리지 테스트...")
     result = subprocess.run([
         sys.executable, "-m", "pytest", "test_config_80_coverage.py", 
-        "--cov=bot.config", "--cov-report=term", "--tb=no"
+        "--cov=bot.config", "--cov-report=term", "--tb=no", *XDIST_ARGS
     ], capture_output=True, text=True)
     
     if result.returncode == 0:
@@ -34,7 +38,7 @@ def run_coverage_test():
     print("📊 Database 클래스 커버리지 테스트...")
     result = subprocess.run([
         sys.executable, "-m", "pytest", "test_database_80_coverage.py", 
-        "--cov=data.database", "--cov-report=term", "--tb=no"
+        "--cov=data.database", "--cov-report=term", "--tb=no", *XDIST_ARGS
     ], capture_output=True, text=True)
     
     if result.returncode == 0:
@@ -54,7 +58,7 @@ def run_coverage_test():
         sys.executable, "-m", "pytest", 
         "test_config_80_coverage.py", "test_database_80_coverage.py",
         "--cov=bot", "--cov=config", "--cov=data", 
-        "--cov-report=term", "--cov-report=html", "--tb=no"
+        "--cov-report=term", "--cov-report=html", "--tb=no", *XDIST_ARGS
     ], capture_output=True, text=True)
     
     print("✅ 전체 프로젝트 테스트 완료")
@@ -8,15 +8,16 @@
 import sys
 import os
 import logging
-import requests
+import numpy as np
 import pandas as pd
 import time
 import asyncio
+import atexit
 import aiohttp
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
-import threading
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Callable
 
 # 프로젝트 루트 경로 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -38,8 +39,152 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# uvloop 사용 가능 시 이벤트 루프 교체 (aiohttp 소켓 처리 가속, Windows 등 미지원 환경은 기본 루프 사용)
+try:
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    uvloop = None
+
+# orjson 사용 가능 시 kline 응답 파싱 가속 (미설치 시 표준 json 사용)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    import json
+    json_loads = json.loads
+
+# Parquet 저장 엔진 사용 가능 시 일 단위 kline 캐시 활성화 (미설치 시 캐시 없이 동작)
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+# 일 단위 kline 캐시 경로 - cache/{symbol}/{interval}/{yyyymmdd}.parquet
+KLINE_CACHE_DIR = os.path.join("trading_bot", "data", "kline_cache")
+
+# 간격별 캔들 길이 (밀리초) - 1M 은 길이가 일정하지 않아 제외
+INTERVAL_MS = {
+    '1m': 60 * 1000,
+    '3m': 3 * 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '2h': 2 * 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '6h': 6 * 60 * 60 * 1000,
+    '8h': 8 * 60 * 60 * 1000,
+    '12h': 12 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000,
+    '3d': 3 * 24 * 60 * 60 * 1000,
+    '1w': 7 * 24 * 60 * 60 * 1000,
+}
+
+# Binance kline 응답에서 사용하는 가격/거래량 컬럼 (인덱스 1~5)
+OHLCV_COLUMNS = ['open', 'high', 'low', 'close', 'volume']
+
+# 가격/거래량 dtype - float32는 유효숫자 7자리라 BTC 등 고가 코인의 호가 단위를 표현하지 못함
+OHLCV_DTYPE = np.float64
+
+def _klines_to_columns(klines: List[list]) -> Dict[str, np.ndarray]:
+    """Binance kline 응답을 컬럼별 numpy 배열로 변환 (인덱스 0~5만 파싱)
+    
+    timestamp는 DB 저장 형식 그대로 int64 밀리초로 유지합니다.
+    """
+    n = len(klines)
+    columns = {'timestamp': np.fromiter((k[0] for k in klines), dtype=np.int64, count=n)}
+    for idx, col in enumerate(OHLCV_COLUMNS, start=1):
+        columns[col] = np.fromiter((float(k[idx]) for k in klines), dtype=OHLCV_DTYPE, count=n)
+    
+    return columns
+
+def _columns_to_dataframe(pages: List[Dict[str, np.ndarray]]) -> pd.DataFrame:
+    """페이지별 컬럼 배열을 컬럼 단위로 이어 붙여 데이터프레임 한 번만 생성"""
+    if len(pages) == 1:
+        columns = pages[0]
+    else:
+        columns = {col: np.concatenate([page[col] for page in pages]) for col in pages[0]}
+    
+    return pd.DataFrame(columns, copy=False)
+
+def _klines_to_dataframe(klines: List[list]) -> pd.DataFrame:
+    """Binance kline 응답 한 페이지를 데이터프레임으로 변환"""
+    return _columns_to_dataframe([_klines_to_columns(klines)])
+
+# Binance 요청 가중치 한도 (1분당) 및 klines 요청 1회 가중치
+WEIGHT_LIMIT_1M = 1200
+KLINE_WEIGHT = 2
+
+# 실패한 페이지 재요청 횟수 및 재요청 간 기본 대기 시간 (초)
+PAGE_RETRIES = 3
+PAGE_RETRY_DELAY = 1.0
+
+class TokenBucket:
+    """요청 가중치 토큰 버킷 - 한도까지 일정한 속도로 요청을 흘려보내 429 대기를 방지
+    
+    응답 헤더의 서버 사용 가중치(X-MBX-USED-WEIGHT-1M)로 남은 토큰과 보충 속도를 보정합니다.
+    """
+    
+    def __init__(self, rate: float, burst: float, limit: int = WEIGHT_LIMIT_1M):
+        """rate: 초당 보충 가중치, burst: 최대 누적 가중치, limit: 1분당 서버 한도"""
+        self.base_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.limit = limit
+        self.tokens = burst
+        self.updated = time.monotonic()
+    
+    def _refill(self):
+        """경과 시간만큼 토큰 보충"""
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+    
+    async def acquire(self, weight: float = KLINE_WEIGHT):
+        """가중치만큼 토큰이 찰 때까지 대기 후 차감"""
+        while True:
+            self._refill()
+            if self.tokens >= weight:
+                self.tokens -= weight
+                return
+            await asyncio.sleep((weight - self.tokens) / self.rate)
+    
+    def update(self, used_weight: int):
+        """서버가 알려준 현재 1분 창 사용 가중치 반영"""
+        # 서버 기준 남은 가중치보다 많이 보내지 않도록 토큰 상한 조정
+        self._refill()
+        self.tokens = min(self.tokens, self.limit - used_weight)
+        
+        # 한도의 80%를 넘으면 보충 속도를 절반으로 낮춰 창 초기화까지 버팀
+        self.rate = self.base_rate / 2 if used_weight > self.limit * 0.8 else self.base_rate
+    
+    def share(self, workers: int):
+        """여러 프로세스가 한도를 나눠 쓰도록 보충 속도와 버스트를 프로세스 수로 나눔"""
+        self.base_rate /= workers
+        self.rate = self.base_rate
+        self.burst /= workers
+        self.tokens = min(self.tokens, self.burst)
+    
+    def penalize(self):
+        """한도 초과 응답(418/429) - 1분 창이 초기화될 때까지 토큰을 음수로 묶어 둠"""
+        self._refill()
+        wait = 60 - (time.time() % 60)
+        self.tokens = -wait * self.rate
+        logger.warning(f"API 가중치 한도 초과: {wait:.1f}초 후 재개")
+
+# 모든 수집기 인스턴스가 공유하는 가중치 버킷 (버스트 + 1분 보충량이 한도를 넘지 않도록 설정)
+RATE_LIMITER = TokenBucket(rate=(WEIGHT_LIMIT_1M - 40) / 60, burst=40)
+
+class KlineStreamError(Exception):
+    """kline 수집이 중간에 실패함 - count 는 실패 전까지 on_batch 에 전달된 캔들 수"""
+    
+    def __init__(self, message: str, count: int = 0):
+        super().__init__(message)
+        self.count = count
+
 class FastHistoricalDataCollector:
-    """고속 과거데이터 수집 클래스 - 병렬 처리 및 배치 요청"""
+    """고속 과거데이터 수집 클래스 - 비동기 병렬 처리 기반 단일 수집기"""
     
     def __init__(self, config: Config, coins_config: CoinsConfig, database: Database):
         """데이터 수집기 초기화"""
@@ -60,454 +205,442 @@ class FastHistoricalDataCollector:
             '1d', '3d', '1w', '1M'  # 일봉, 주봉, 월봉
         ]
         
-        # API 제한 설정
-        self.max_requests_per_second = 10  # 초당 최대 요청 수
+        # API 제한 설정 (Binance 요청 가중치 1분당 1200)
         self.max_concurrent_requests = 20  # 동시 요청 수
-        self.request_delay = 0.1  # 요청 간 지연 (초)
+        self.rate_limiter = RATE_LIMITER  # 프로세스 전체 공유 가중치 버킷
         
         # 세마포어로 동시 요청 제한
         self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
-        self.request_count = 0
-        self.request_lock = threading.Lock()
+        
+        # 이미 받은 완료된 날짜는 로컬 캐시에서 읽어 재요청하지 않음
+        self.cache_dir = KLINE_CACHE_DIR if pyarrow is not None else None
+        
+        # 동기 진입점이 공유하는 이벤트 루프와 HTTP 세션 (수집기 수명 동안 재사용)
+        self._loop = None
+        self._session = None
+        self._session_loop = None
         
         # 진행 상황 추적기 추가
         self.progress_tracker = ProgressTracker()
         
         self.logger.info("고속 과거데이터 수집기 초기화 완료")
     
-    async def get_historical_data_async(self, session: aiohttp.ClientSession, 
-                                      symbol: str, interval: str, 
-                                      start_time: int, end_time: int) -> pd.DataFrame:
-        """비동기로 특정 간격의 과거 데이터 수집 - 3년치 모든 데이터 수집"""
-        async with self.semaphore:
-            try:
-                all_data = []
-                current_start = start_time
-                
-                while current_start < end_time:
-                    # API 호출 제한 관리
-                    await self._rate_limit()
-                    
-                    url = f"{self.base_url}/klines"
-                    params = {
-                        'symbol': symbol,
-                        'interval': interval,
-                        'startTime': current_start,
-                        'endTime': end_time,
-                        'limit': 1000  # Binance API 최대 제한
-                    }
-                    
-                    async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            if not data:
-                                break
-                            
-                            all_data.extend(data)
-                            
-                            # 마지막 캔들의 종료 시간을 다음 시작 시간으로 설정
-                            if data:
-                                last_candle = data[-1]
-                                current_start = int(last_candle[6]) + 1  # close_time + 1ms
-                            else:
-                                break
-                        else:
-                            self.logger.error(f"API 요청 실패: {response.status}")
-                            break
-                
-                if not all_data:
-                    return pd.DataFrame()
-                
-                # 데이터프레임 변환
-                df = pd.DataFrame(all_data, columns=[
-                    'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                    'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                    'taker_buy_quote', 'ignore'
-                ])
-                
-                # 데이터 타입 변환
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                for col in ['open', 'high', 'low', 'close', 'volume']:
-                    df[col] = pd.to_numeric(df[col], errors='coerce')
-                
-                # 필요한 컬럼만 선택
-                df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                
-                self.logger.info(f"{symbol} {interval}: {len(df)}개 캔들 수집 완료")
-                return df
-                        
-            except Exception as e:
-                self.logger.error(f"{symbol} {interval} 데이터 수집 실패: {e}")
-                return pd.DataFrame()
+    def _open_session(self) -> aiohttp.ClientSession:
+        """현재 이벤트 루프용 HTTP 세션 생성"""
+        # 세마포어는 실행 중인 이벤트 루프에 묶이므로 asyncio.run 마다 새로 생성
+        self.semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        
+        # 동시 요청 수만큼 keep-alive 연결을 유지하여 요청마다 TCP/TLS 핸드셰이크 반복 방지
+        connector = aiohttp.TCPConnector(
+            limit=self.max_concurrent_requests,
+            ttl_dns_cache=300,
+            keepalive_timeout=60
+        )
+        return aiohttp.ClientSession(connector=connector)
     
-    async def _rate_limit(self):
-        """API 호출 제한 관리"""
-        with self.request_lock:
-            self.request_count += 1
-            if self.request_count >= self.max_requests_per_second:
-                await asyncio.sleep(1)
-                self.request_count = 0
-            else:
-                await asyncio.sleep(self.request_delay)
-    
-    def get_historical_data_batch(self, symbol: str, interval: str, 
-                                start_time: int, end_time: int) -> pd.DataFrame:
-        """배치로 대용량 데이터 수집 (3년치 데이터를 여러 번에 나누어 수집)"""
-        all_data = []
-        current_start = start_time
-        
-        while current_start < end_time:
-            # 배치 크기 계산 (간격별로 조정)
-            batch_size = self._calculate_batch_size(interval)
-            current_end = min(current_start + batch_size, end_time)
-            
-            try:
-                # 동기 요청으로 배치 데이터 수집
-                url = f"{self.base_url}/klines"
-                params = {
-                    'symbol': symbol,
-                    'interval': interval,
-                    'startTime': current_start,
-                    'endTime': current_end,
-                    'limit': 1000
-                }
-                
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if data:
-                    # 데이터프레임 변환
-                    df = pd.DataFrame(data, columns=[
-                        'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                        'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                        'taker_buy_quote', 'ignore'
-                    ])
-                    
-                    # 데이터 타입 변환
-                    df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                    for col in ['open', 'high', 'low', 'close', 'volume']:
-                        df[col] = pd.to_numeric(df[col], errors='coerce')
-                    
-                    # 필요한 컬럼만 선택
-                    df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
-                    all_data.append(df)
-                
-                # 다음 배치 시작 시간 설정
-                if data:
-                    last_timestamp = data[-1][0]  # 마지막 캔들의 타임스탬프
-                    current_start = last_timestamp + 1
-                else:
-                    current_start = current_end
-                
-                # API 호출 제한 방지
-                time.sleep(0.05)  # 50ms 지연
-                
-            except Exception as e:
-                self.logger.error(f"{symbol} {interval} 배치 수집 실패: {e}")
-                current_start = current_end
-                continue
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """실행 중인 이벤트 루프의 공유 HTTP 세션 반환 (없으면 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            self._session = self._open_session()
+            self._session_loop = loop
+        return self._session
+    
+    def _run(self, coro_func, *args):
+        """동기 진입점 - 전용 이벤트 루프에서 공유 세션으로 코루틴 실행
         
-        if all_data:
-            # 모든 배치 데이터 합치기
-            combined_df = pd.concat(all_data, ignore_index=True)
-            combined_df = combined_df.drop_duplicates(subset=['timestamp'])
-            combined_df = combined_df.sort_values('timestamp')
-            
-            self.logger.info(f"{symbol} {interval}: 총 {len(combined_df)}개 캔들 수집 완료")
-            return combined_df
-        
-        return pd.DataFrame()
-    
-    def _calculate_batch_size(self, interval: str) -> int:
-        """간격별 배치 크기 계산 (밀리초 단위)"""
-        batch_sizes = {
-            '1m': 1000 * 60 * 1000,      # 1000분
-            '3m': 1000 * 3 * 60 * 1000,  # 1000 * 3분
-            '5m': 1000 * 5 * 60 * 1000,  # 1000 * 5분
-            '15m': 1000 * 15 * 60 * 1000, # 1000 * 15분
-            '30m': 1000 * 30 * 60 * 1000, # 1000 * 30분
-            '1h': 1000 * 60 * 60 * 1000,  # 1000시간
-            '2h': 1000 * 2 * 60 * 60 * 1000,  # 1000 * 2시간
-            '4h': 1000 * 4 * 60 * 60 * 1000,  # 1000 * 4시간
-            '6h': 1000 * 6 * 60 * 60 * 1000,  # 1000 * 6시간
-            '8h': 1000 * 8 * 60 * 60 * 1000,  # 1000 * 8시간
-            '12h': 1000 * 12 * 60 * 60 * 1000, # 1000 * 12시간
-            '1d': 1000 * 24 * 60 * 60 * 1000,  # 1000일
-            '3d': 1000 * 3 * 24 * 60 * 60 * 1000,  # 1000 * 3일
-            '1w': 1000 * 7 * 24 * 60 * 60 * 1000,  # 1000주
-            '1M': 1000 * 30 * 24 * 60 * 60 * 1000, # 1000 * 30일
-        }
-        return batch_sizes.get(interval, 1000 * 60 * 1000)  # 기본값: 1000분
-    
-    def collect_all_data_for_symbol_parallel(self, symbol: str, days: int = 1095) -> Dict[str, pd.DataFrame]:
-        """단일 코인의 모든 간격 데이터 병렬 수집 (3년치)"""
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
-        
-        all_data = {}
+        호출마다 세션을 새로 열지 않으므로 코인/간격이 바뀌어도 keep-alive 연결이 유지됩니다.
+        """
+        if self._loop is None or self._loop.is_closed():
+            self._loop = asyncio.new_event_loop()
         
-        self.logger.info(f"{symbol} 3년치 모든 간격 데이터 병렬 수집 시작")
+        async def runner():
+            return await coro_func(await self._get_session(), *args)
         
-        # ThreadPoolExecutor로 병렬 처리
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            # 각 간격별로 작업 제출
-            future_to_interval = {
-                executor.submit(self.get_historical_data_batch, symbol, interval, start_time, end_time): interval
-                for interval in self.intervals
-            }
-            
-            # 완료된 작업 처리
-            for future in as_completed(future_to_interval):
-                interval = future_to_interval[future]
-                try:
-                    df = future.result()
-                    if not df.empty:
-                        all_data[interval] = df
-                        
-                        # 데이터베이스에 저장
-                        data_list = []
-                        for _, row in df.iterrows():
-                            data = {
-                                'timestamp': int(row['timestamp'].timestamp() * 1000),
-                                'open': row['open'],
-                                'high': row['high'],
-                                'low': row['low'],
-                                'close': row['close'],
-                                'volume': row['volume']
-                            }
-                            data_list.append(data)
-                        
-
-                        
-                        # 코인별 테이블에도 저장
-                        self.database.save_price_data_to_coin_table(symbol, interval, data_list)
-                        
-                except Exception as e:
-                    self.logger.error(f"{symbol} {interval} 병렬 수집 실패: {e}")
-                    continue
-        
-        self.logger.info(f"{symbol} 데이터 수집 완료: {len(all_data)}개 간격")
-        return all_data
+        return self._loop.run_until_complete(runner())
     
-    async def collect_all_coins_all_data_async(self, days: int = 1095) -> Dict[str, Dict[str, pd.DataFrame]]:
-        """모든 코인의 모든 간격 데이터 비동기 수집 (3년치)"""
-        coins = self.coins_config.coins
-        all_coins_data = {}
+    def close(self):
+        """공유 HTTP 세션과 이벤트 루프 정리"""
+        if self._loop is None or self._loop.is_closed():
+            return
         
-        self.logger.info(f"50개 코인 3년치 모든 간격 데이터 비동기 수집 시작")
-        self.logger.info(f"수집 간격: {self.intervals}")
+        if self._session is not None and not self._session.closed and self._session_loop is self._loop:
+            self._loop.run_until_complete(self._session.close())
         
-        # aiohttp 세션 생성
-        async with aiohttp.ClientSession() as session:
-            # 코인별로 작업 생성
-            tasks = []
-            for symbol in coins:
-                task = self._collect_single_coin_async(session, symbol, days)
-                tasks.append(task)
+        self._loop.close()
+        self._session = None
+        self._session_loop = None
+    
+    async def _fetch_page(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                          start_time: int, end_time: int) -> Optional[List[list]]:
+        """kline 한 페이지(최대 1000개) 요청 - 실패 시 None 반환"""
+        # 전체 동시 요청 수는 페이지 단위로 제한
+        async with self.semaphore:
+            # 가중치 토큰이 찰 때까지 대기
+            await self.rate_limiter.acquire(KLINE_WEIGHT)
             
-            # 모든 작업 동시 실행
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+            url = f"{self.base_url}/klines"
+            params = {
+                'symbol': symbol,
+                'interval': interval,
+                'startTime': start_time,
+                'endTime': end_time,
+                'limit': 1000  # Binance API 최대 제한
+            }
             
-            # 결과 처리
-            for i, result in enumerate(results):
-                symbol = coins[i]
-                if isinstance(result, Exception):
-                    self.logger.error(f"{symbol} 수집 실패: {result}")
-                elif result:
-                    all_coins_data[symbol] = result
+            async with session.get(url, params=params, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                # 응답 헤더의 사용 가중치로 다음 요청 속도 조절
+                used_weight = response.headers.get('X-MBX-USED-WEIGHT-1M')
+                if used_weight is not None:
+                    self.rate_limiter.update(int(used_weight))
+                
+                if response.status != 200:
+                    if response.status in (418, 429):
+                        # 한도 초과 - 다음 요청은 1분 창이 초기화될 때까지 대기
+                        self.rate_limiter.penalize()
+                    self.logger.error(f"API 요청 실패: {response.status}")
+                    return None
+                return await response.json(loads=json_loads)
+    
+    async def _fetch_page_with_retry(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                                     start_time: int, end_time: int) -> Optional[List[list]]:
+        """kline 한 페이지 요청 - 실패 시 PAGE_RETRIES 회까지 재요청하고 모두 실패하면 None 반환
+        
+        418/429 응답은 가중치 버킷이 1분 창 초기화까지 다음 요청을 대기시키므로
+        재요청은 한도가 풀린 뒤에 나갑니다.
+        """
+        for attempt in range(1, PAGE_RETRIES + 1):
+            try:
+                data = await self._fetch_page(session, symbol, interval, start_time, end_time)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                if attempt == PAGE_RETRIES:
+                    raise
+                self.logger.warning(f"{symbol} {interval} 페이지 요청 오류 ({start_time}~): {e}")
+                data = None
+            
+            if data is not None:
+                return data
+            
+            if attempt < PAGE_RETRIES:
+                self.logger.warning(f"{symbol} {interval} 페이지 재요청 ({start_time}~, {attempt}/{PAGE_RETRIES})")
+                await asyncio.sleep(PAGE_RETRY_DELAY * attempt)
         
-        self.logger.info(f"전체 데이터 수집 완료: {len(all_coins_data)}개 코인")
-        return all_coins_data
+        return None
     
-    async def _collect_single_coin_async(self, session: aiohttp.ClientSession, 
-                                       symbol: str, days: int) -> Dict[str, pd.DataFrame]:
-        """단일 코인 비동기 수집"""
+    def _cache_path(self, symbol: str, interval: str, day: int) -> str:
+        """일 단위 캐시 파일 경로 (day: 1970-01-01 기준 UTC 일 번호)"""
+        date_str = time.strftime('%Y%m%d', time.gmtime(day * 86400))
+        return os.path.join(self.cache_dir, symbol, interval, f"{date_str}.parquet")
+    
+    def _write_cache_day(self, symbol: str, interval: str, day: int, df: pd.DataFrame):
+        """완료된 하루치 캔들을 캐시에 저장 (임시 파일 작성 후 교체)"""
+        path = self._cache_path(symbol, interval, day)
         try:
-            end_time = int(datetime.now().timestamp() * 1000)
-            start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = path + ".tmp"
+            df.reset_index(drop=True).to_parquet(tmp_path, compression='zstd', index=False)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            self.logger.error(f"{symbol} {interval} 캐시 저장 실패 ({path}): {e}")
+    
+    async def _stream_klines(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                             start_time: int, end_time: int,
+                             on_batch: Callable[[pd.DataFrame], None]) -> int:
+        """과거 데이터를 시간 순서대로 on_batch 에 전달 - 캐시된 날짜는 HTTP 요청 없이 로드
+        
+        구간 앞부분의 연속된 캐시 날짜를 먼저 전달하고, 나머지는 수집하면서
+        구간 안에 온전히 포함된 완료 날짜를 캐시에 기록합니다.
+        """
+        day_ms = INTERVAL_MS['1d']
+        # 일봉 이상은 3년치도 몇 페이지뿐이고 대부분의 날짜가 비어 있으므로 캐시하지 않음
+        if self.cache_dir is None or INTERVAL_MS.get(interval, day_ms) >= day_ms:
+            return await self._stream_pages(session, symbol, interval, start_time, end_time, on_batch)
+        
+        # 캐시 대상: 구간 안에 온전히 포함되고 이미 끝난(오늘 이전) 날짜
+        today = int(time.time() * 1000) // day_ms
+        first_day = -(-start_time // day_ms)
+        end_day = min((end_time + 1) // day_ms, today)
+        
+        total = 0
+        day = first_day
+        try:
+            while day < end_day and os.path.exists(self._cache_path(symbol, interval, day)):
+                if day == first_day and start_time < day * day_ms:
+                    # 첫 날 이전의 자투리 구간은 요청으로 수집
+                    total += await self._stream_pages(session, symbol, interval, start_time, day * day_ms - 1, on_batch)
+                
+                cached = pd.read_parquet(self._cache_path(symbol, interval, day))
+                if len(cached):
+                    on_batch(cached)
+                    total += len(cached)
+                day += 1
             
-            all_data = {}
+            if day > first_day:
+                self.logger.info(f"{symbol} {interval}: 캐시 {day - first_day}일 사용")
+                start_time = day * day_ms
+                if start_time > end_time:
+                    return total
+            
+            pending = []
+            next_day = day
             
-            # 각 간격별로 배치 수집 (비동기 대신 배치 처리 사용)
-            for interval in self.intervals:
-                try:
-                    self.logger.info(f"{symbol} {interval} 배치 수집 중...")
+            def cache_and_forward(batch_df: pd.DataFrame):
+                """묶음 전달 후, 이후 캔들이 도착해 완료가 확인된 날짜를 캐시에 기록"""
+                nonlocal pending, next_day
+                on_batch(batch_df)
+                
+                pending.append(batch_df)
+                buffered = pd.concat(pending, ignore_index=True)
+                days = buffered['timestamp'].values // day_ms
+                last_day = int(days[-1])
+                
+                # 수집이 중간에 실패해도 전달된 데이터는 빈틈없는 앞부분이므로 마지막 캔들 이전 날짜는 완료
+                for d in range(next_day, min(last_day, end_day)):
+                    self._write_cache_day(symbol, interval, d, buffered[days == d])
+                next_day = max(next_day, min(last_day, end_day))
+                pending = [buffered[days >= last_day]]
+            
+            return total + await self._stream_pages(session, symbol, interval, start_time, end_time, cache_and_forward)
+        except KlineStreamError as e:
+            # 캐시에서 전달한 앞부분까지 포함해 실패 전 전달 수를 보고
+            raise KlineStreamError(str(e), total + e.count) from e
+        except Exception as e:
+            raise KlineStreamError(f"{symbol} {interval} 캐시 데이터 전달 실패: {e}", total) from e
+    
+    async def _stream_pages(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                            start_time: int, end_time: int,
+                            on_batch: Callable[[pd.DataFrame], None]) -> int:
+        """과거 데이터를 페이지 묶음 단위로 요청하여 시간 순서대로 on_batch 에 전달
+        
+        수집한 캔들 수를 반환하며, 묶음은 전달 후 보관하지 않습니다.
+        재요청 후에도 페이지를 받지 못하거나 on_batch 가 실패하면 KlineStreamError 를 발생시킵니다.
+        """
+        total = 0
+        try:
+            # 첫 페이지로 실제 데이터 시작 시점 확인 (상장 이전 구간의 빈 요청 방지)
+            data = await self._fetch_page_with_retry(session, symbol, interval, start_time, end_time)
+            
+            if data is None:
+                raise KlineStreamError(f"{symbol} {interval} 첫 페이지 수집 실패 ({start_time}~)")
+            if not data:
+                return 0
+            
+            on_batch(_klines_to_dataframe(data))
+            total += len(data)
+            current_start = int(data[-1][6]) + 1  # close_time + 1ms
+            
+            step = INTERVAL_MS.get(interval)
+            if step is None:
+                # 길이가 일정하지 않은 간격(1M)은 순차 페이지네이션
+                while current_start < end_time:
+                    data = await self._fetch_page_with_retry(session, symbol, interval, current_start, end_time)
+                    
+                    if data is None:
+                        raise KlineStreamError(f"{symbol} {interval} 페이지 수집 실패 ({current_start}~)", total)
+                    if not data:
+                        break
                     
-                    # 배치로 데이터 수집
-                    df = self.get_historical_data_batch(symbol, interval, start_time, end_time)
+                    on_batch(_klines_to_dataframe(data))
+                    total += len(data)
+                    current_start = int(data[-1][6]) + 1
+            elif current_start < end_time:
+                # 남은 구간을 1000캔들 단위 창으로 나눠 동시 요청 수만큼씩 묶어서 요청
+                window = step * 1000
+                windows = [(ws, min(ws + window - 1, end_time)) for ws in range(current_start, end_time, window)]
+                
+                for i in range(0, len(windows), self.max_concurrent_requests):
+                    batch = windows[i:i + self.max_concurrent_requests]
+                    pages = await asyncio.gather(
+                        *(self._fetch_page_with_retry(session, symbol, interval, ws, we) for ws, we in batch),
+                        return_exceptions=True
+                    )
+                    
+                    batch_pages = []
+                    error = None
+                    for (ws, _), page in zip(batch, pages):
+                        if page is None or isinstance(page, Exception):
+                            # 중간이 빠진 데이터가 저장되지 않도록 실패한 창 이전까지만 사용
+                            error = f"{symbol} {interval} 페이지 수집 실패 ({ws}~): {page}"
+                            break
+                        if page:
+                            batch_pages.append(_klines_to_columns(page))
                     
-                    if not df.empty:
-                        all_data[interval] = df
-                        
-                        # 데이터베이스에 저장
-                        data_list = []
-                        for _, row in df.iterrows():
-                            data = {
-                                'timestamp': int(row['timestamp'].timestamp() * 1000),
-                                'open': row['open'],
-                                'high': row['high'],
-                                'low': row['low'],
-                                'close': row['close'],
-                                'volume': row['volume']
-                            }
-                            data_list.append(data)
-                        
-                                                # 코인별 테이블에 저장
-                        self.database.save_price_data_to_coin_table(symbol, interval, data_list)
+                    if batch_pages:
+                        batch_df = _columns_to_dataframe(batch_pages)
+                        on_batch(batch_df)
+                        total += len(batch_df)
                     
-                except Exception as e:
-                    self.logger.error(f"{symbol} {interval} 배치 수집 실패: {e}")
-                    continue
+                    if error:
+                        raise KlineStreamError(error, total)
             
-            return all_data
+            self.logger.info(f"{symbol} {interval}: {total}개 캔들 수집 완료")
             
+        except KlineStreamError as e:
+            self.logger.error(str(e))
+            raise
         except Exception as e:
-            self.logger.error(f"{symbol} 비동기 수집 실패: {e}")
-            return {}
-
-class HistoricalDataCollector:
-    """과거데이터 수집 클래스 - 3년치 모든 데이터 수집"""
-    
-    def __init__(self, config: Config, coins_config: CoinsConfig, database: Database):
-        """데이터 수집기 초기화"""
-        self.config = config
-        self.coins_config = coins_config
-        self.database = database
-        self.logger = logging.getLogger(__name__)
-        
-        # Binance API 설정
-        self.base_url = "https://api.binance.com/api/v3"
-        self.api_key = config.binance_api_key
-        self.secret_key = config.binance_secret_key
-        
-        # 수집할 모든 시간대 간격
-        self.intervals = [
-            '1m', '3m', '5m', '15m', '30m',  # 분봉
-            '1h', '2h', '4h', '6h', '8h', '12h',  # 시간봉
-            '1d', '3d', '1w', '1M'  # 일봉, 주봉, 월봉
-        ]
-        
-        # 각 간격별 최대 수집 개수 (3년치 데이터를 위해 제한 없음)
-        self.limit = 1000000  # 100만개로 설정 (실제로는 시간 범위로 제한됨)
-        
-        # 진행 상황 추적기 추가
-        self.progress_tracker = ProgressTracker()
+            # 저장(on_batch) 실패 등 - 호출자가 완료로 처리하지 않도록 전달한 캔들 수와 함께 전파
+            self.logger.error(f"{symbol} {interval} 데이터 수집 실패: {e}")
+            raise KlineStreamError(f"{symbol} {interval} 데이터 수집 실패: {e}", total) from e
         
-        self.logger.info("3년치 과거데이터 수집기 초기화 완료")
+        return total
     
-    def get_historical_data(self, symbol: str, interval: str, start_time: int, end_time: int) -> pd.DataFrame:
-        """특정 간격의 과거 데이터 수집 - 3년치 모든 데이터 수집"""
+    async def _stream_klines_partial(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                                     start_time: int, end_time: int,
+                                     on_batch: Callable[[pd.DataFrame], None]) -> int:
+        """_stream_klines 와 같지만 실패 시 로그만 남기고 그때까지 전달한 캔들 수 반환
+        
+        전달된 데이터는 빈틈없는 앞부분이므로, 이어서 받을 위치를 저장된 데이터로 알 수 있는
+        호출자(누락 데이터 수집 등)에서 사용합니다.
+        """
         try:
-            all_data = []
-            current_start = start_time
+            return await self._stream_klines(session, symbol, interval, start_time, end_time, on_batch)
+        except KlineStreamError as e:
+            self.logger.warning(f"{symbol} {interval}: 수집 중단, {e.count}개까지만 전달")
+            return e.count
+    
+    async def get_historical_data_async(self, session: aiohttp.ClientSession, 
+                                      symbol: str, interval: str, 
+                                      start_time: int, end_time: int) -> pd.DataFrame:
+        """비동기로 특정 간격의 과거 데이터 수집 - 데이터프레임으로 반환 (저장하지 않음)"""
+        step = INTERVAL_MS.get(interval)
+        
+        if step is None:
+            # 길이가 일정하지 않은 간격(1M)은 캔들 수를 미리 알 수 없으므로 묶음을 모아 한 번에 연결
+            frames = []
+            await self._stream_klines_partial(session, symbol, interval, start_time, end_time, frames.append)
             
-            while current_start < end_time:
-                url = f"{self.base_url}/klines"
-                params = {
-                    'symbol': symbol,
-                    'interval': interval,
-                    'startTime': current_start,
-                    'endTime': end_time,
-                    'limit': 1000  # Binance API 최대 제한
-                }
-                
-                response = requests.get(url, params=params, timeout=30)
-                response.raise_for_status()
-                
-                data = response.json()
-                
-                if not data:
-                    break
-                
-                all_data.extend(data)
-                
-                # 마지막 캔들의 종료 시간을 다음 시작 시간으로 설정
-                if data:
-                    last_candle = data[-1]
-                    current_start = int(last_candle[6]) + 1  # close_time + 1ms
-                else:
-                    break
-                
-                # API 제한 방지
-                time.sleep(0.1)
+            if not frames:
+                return pd.DataFrame()
+            
+            df = pd.concat(frames, ignore_index=True)
+        else:
+            # 구간 길이로 최대 캔들 수가 정해지므로 버퍼를 한 번만 할당하고 묶음을 순서대로 채움
+            capacity = max((end_time - start_time) // step + 1, 0)
+            buffer = {'timestamp': np.empty(capacity, dtype=np.int64)}
+            buffer.update({col: np.empty(capacity, dtype=OHLCV_DTYPE) for col in OHLCV_COLUMNS})
+            filled = 0
             
-            if not all_data:
+            def fill(batch_df: pd.DataFrame):
+                """묶음을 버퍼의 다음 구간에 복사"""
+                nonlocal filled
+                count = min(len(batch_df), capacity - filled)
+                for col, values in buffer.items():
+                    values[filled:filled + count] = batch_df[col].values[:count]
+                filled += count
+            
+            await self._stream_klines_partial(session, symbol, interval, start_time, end_time, fill)
+            
+            if not filled:
                 return pd.DataFrame()
             
-            # 데이터프레임 변환
-            df = pd.DataFrame(all_data, columns=[
-                'timestamp', 'open', 'high', 'low', 'close', 'volume',
-                'close_time', 'quote_volume', 'trades', 'taker_buy_base',
-                'taker_buy_quote', 'ignore'
-            ])
+            df = pd.DataFrame({col: values[:filled] for col, values in buffer.items()}, copy=False)
+        
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df
+    
+    def get_historical_data(self, symbol: str, interval: str, start_time: int, end_time: int) -> pd.DataFrame:
+        """특정 간격의 과거 데이터 수집 (동기 진입점)"""
+        return self._run(self.get_historical_data_async, symbol, interval, start_time, end_time)
+    
+    def _persist(self, symbol: str, interval: str, df: pd.DataFrame):
+        """수집한 데이터프레임을 코인별 테이블에 저장"""
+        # 파싱 단계에서 이미 int64 밀리초이므로 변환 없이 단일 트랜잭션으로 일괄 저장
+        self.database.save_price_dataframe_to_coin_table(symbol, interval, df)
+    
+    async def _fetch_symbol_interval(self, session: aiohttp.ClientSession, symbol: str, interval: str,
+                                     start_time: int, end_time: int) -> int:
+        """단일 코인 단일 간격 수집 - 페이지 묶음마다 바로 저장하고 캔들 수 반환"""
+        return await self._stream_klines_partial(
+            session, symbol, interval, start_time, end_time,
+            lambda batch_df: self._persist(symbol, interval, batch_df)
+        )
+    
+    def _time_range(self, days: int):
+        """현재 시각 기준 수집 기간 (밀리초)"""
+        now = datetime.now()
+        end_time = int(now.timestamp() * 1000)
+        start_time = int((now - timedelta(days=days)).timestamp() * 1000)
+        return start_time, end_time
+    
+    async def _collect_single_coin_async(self, session: aiohttp.ClientSession, 
+                                       symbol: str, days: int) -> Dict[str, int]:
+        """단일 코인 비동기 수집 - 모든 간격 동시 실행, 간격별 캔들 수 반환"""
+        try:
+            start_time, end_time = self._time_range(days)
             
-            # 데이터 타입 변환
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col], errors='coerce')
+            tasks = [
+                self._fetch_symbol_interval(session, symbol, interval, start_time, end_time)
+                for interval in self.intervals
+            ]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
             
-            # 필요한 컬럼만 선택
-            df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+            counts = {}
+            for interval, result in zip(self.intervals, results):
+                if isinstance(result, Exception):
+                    self.logger.error(f"{symbol} {interval} 수집 실패: {result}")
+                elif result:
+                    counts[interval] = result
             
-            self.logger.info(f"{symbol} {interval}: {len(df)}개 캔들 수집 완료")
-            return df
+            return counts
             
         except Exception as e:
-            self.logger.error(f"{symbol} {interval} 데이터 수집 실패: {e}")
-            return pd.DataFrame()
+            self.logger.error(f"{symbol} 비동기 수집 실패: {e}")
+            return {}
     
-    def collect_all_data_for_symbol(self, symbol: str, days: int = 1095) -> Dict[str, pd.DataFrame]:
-        """단일 코인의 모든 간격 데이터 수집 (3년치)"""
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+    def collect_all_data_for_symbol(self, symbol: str, days: int = 1095) -> Dict[str, int]:
+        """단일 코인의 모든 간격 데이터 병렬 수집 (3년치) - 간격별 캔들 수 반환"""
+        self.logger.info(f"{symbol} 3년치 모든 간격 데이터 병렬 수집 시작")
         
-        all_data = {}
+        counts = self._run(self._collect_single_coin_async, symbol, days)
         
-        self.logger.info(f"{symbol} 3년치 모든 간격 데이터 수집 시작")
+        self.logger.info(f"{symbol} 데이터 수집 완료: {len(counts)}개 간격")
+        return counts
+    
+    async def collect_all_coins_all_data_async(self, days: int = 1095) -> Dict[str, Dict[str, int]]:
+        """모든 코인의 모든 간격 데이터 비동기 수집 (3년치) - 코인별 간격별 캔들 수 반환"""
+        # aiohttp 세션 생성 (호출한 쪽 이벤트 루프 전용)
+        async with self._open_session() as session:
+            return await self._collect_all_coins_async(session, days)
+    
+    def collect_all_coins_all_data_parallel(self, days: int = 1095,
+                                            coins: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """모든 코인(또는 지정한 코인 묶음)의 모든 간격 데이터 병렬 수집 (동기 진입점, 공유 세션 사용)"""
+        return self._run(self._collect_all_coins_async, days, coins)
+    
+    async def _collect_all_coins_async(self, session: aiohttp.ClientSession, days: int,
+                                       coins: Optional[List[str]] = None) -> Dict[str, Dict[str, int]]:
+        """모든 코인 동시 수집 - 하나의 세션을 모든 코인이 공유"""
+        coins = coins or self.coins_config.coins
+        all_counts = {}
         
-        for interval in self.intervals:
-            try:
-                self.logger.info(f"{symbol} {interval} 수집 중...")
-                
-                # 해당 간격의 데이터 수집
-                df = self.get_historical_data(symbol, interval, start_time, end_time)
-                
-                if not df.empty:
-                    all_data[interval] = df
-                    
-                    # 데이터베이스에 저장 - 리스트로 변환하여 전달
-                    data_list = []
-                    for _, row in df.iterrows():
-                        data = {
-                            'timestamp': int(row['timestamp'].timestamp() * 1000),
-                            'open': row['open'],
-                            'high': row['high'],
-                            'low': row['low'],
-                            'close': row['close'],
-                            'volume': row['volume']
-                        }
-                        data_list.append(data)
-                    
-                    # 코인별 테이블에 저장 (새로운 구조)
-                    self.database.save_price_data_to_coin_table(symbol, interval, data_list)
-                
-                # API 호출 제한 방지
-                time.sleep(0.1)
-                
-            except Exception as e:
-                self.logger.error(f"{symbol} {interval} 수집 실패: {e}")
-                continue
+        self.logger.info(f"50개 코인 3년치 모든 간격 데이터 비동기 수집 시작")
+        self.logger.info(f"수집 간격: {self.intervals}")
         
-        self.logger.info(f"{symbol} 데이터 수집 완료: {len(all_data)}개 간격")
-        return all_data
+        # 코인별로 작업 생성
+        tasks = []
+        for symbol in coins:
+            task = self._collect_single_coin_async(session, symbol, days)
+            tasks.append(task)
+        
+        # 모든 작업 동시 실행
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # 결과 처리
+        for i, result in enumerate(results):
+            symbol = coins[i]
+            if isinstance(result, Exception):
+                self.logger.error(f"{symbol} 수집 실패: {result}")
+            elif result:
+                all_counts[symbol] = result
+        
+        self.logger.info(f"전체 데이터 수집 완료: {len(all_counts)}개 코인")
+        return all_counts
     
-    def collect_all_coins_all_data(self, days: int = 1095) -> Dict[str, Dict[str, pd.DataFrame]]:
-        """모든 코인의 모든 간격 데이터 수집 (3년치) - 재개 가능"""
+    def collect_all_coins_all_data(self, days: int = 1095) -> Dict[str, Dict[str, int]]:
+        """모든 코인의 모든 간격 데이터 수집 (3년치) - 재개 가능, 코인별 간격별 캔들 수 반환"""
         coins = self.coins_config.coins
-        all_coins_data = {}
+        all_counts = {}
         
         # 진행 상황 표시
         self.progress_tracker.print_progress_summary()
@@ -527,31 +660,71 @@ class HistoricalDataCollector:
                 self.progress_tracker.start_coin_collection(symbol)
                 
                 # 해당 코인의 모든 간격 데이터 수집
-                symbol_data = self.collect_all_data_for_symbol_with_progress(symbol, days)
+                symbol_counts = self.collect_all_data_for_symbol_with_progress(symbol, days)
                 
-                if symbol_data:
-                    all_coins_data[symbol] = symbol_data
+                if symbol_counts:
+                    all_counts[symbol] = symbol_counts
                     self.progress_tracker.complete_coin_collection(symbol)
                 else:
                     self.progress_tracker.fail_coin_collection(symbol, "데이터 수집 실패")
                 
-                # 코인 간 API 호출 제한 방지
-                time.sleep(0.5)
-                
             except Exception as e:
                 self.logger.error(f"{symbol} 전체 수집 실패: {e}")
                 self.progress_tracker.fail_coin_collection(symbol, str(e))
                 continue
         
-        self.logger.info(f"전체 데이터 수집 완료: {len(all_coins_data)}개 코인")
-        return all_coins_data
+        self.logger.info(f"전체 데이터 수집 완료: {len(all_counts)}개 코인")
+        return all_counts
     
-    def collect_all_data_for_symbol_with_progress(self, symbol: str, days: int = 1095) -> Dict[str, pd.DataFrame]:
-        """단일 코인의 모든 간격 데이터 수집 (진행 상황 추적 포함)"""
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
-        
-        all_data = {}
+    async def _collect_interval_with_progress(self, session: aiohttp.ClientSession, symbol: str,
+                                              interval: str, start_time: int, end_time: int) -> int:
+        """단일 간격 수집 (진행 상황 추적 포함) - 캔들 수 반환"""
+        try:
+            self.logger.info(f"{symbol} {interval} 수집 중...")
+            
+            # 간격 수집 시작
+            self.progress_tracker.start_interval_collection(symbol, interval)
+            
+            # 중단된 경우 마지막으로 저장된 페이지 다음부터 재개
+            checkpoint = self.progress_tracker.get_checkpoint(symbol, interval)
+            resumed = checkpoint is not None and checkpoint >= start_time
+            if resumed:
+                self.logger.info(f"{symbol} {interval}: 체크포인트 {checkpoint} 이후부터 재개")
+                start_time = checkpoint + 1
+            
+            def persist_and_checkpoint(batch_df: pd.DataFrame):
+                """페이지 묶음 저장 후 체크포인트 기록"""
+                self._persist(symbol, interval, batch_df)
+                last_ts = int(batch_df['timestamp'].iloc[-1])
+                self.progress_tracker.checkpoint(symbol, interval, last_ts)
+            
+            # 해당 간격의 데이터 수집 (페이지 묶음 단위로 저장)
+            try:
+                count = await self._stream_klines(
+                    session, symbol, interval, start_time, end_time, persist_and_checkpoint
+                )
+            except KlineStreamError as e:
+                # 실패로 남겨 다음 실행이 마지막 체크포인트부터 이어서 수집하도록 함
+                self.progress_tracker.fail_interval_collection(symbol, interval, str(e))
+                return e.count
+            
+            if count or resumed:
+                # 간격 수집 완료 (재개 시 새 캔들이 없으면 이미 끝까지 저장된 것)
+                self.progress_tracker.complete_interval_collection(symbol, interval)
+            else:
+                self.progress_tracker.fail_interval_collection(symbol, interval, "데이터 없음")
+            
+            return count
+            
+        except Exception as e:
+            self.logger.error(f"{symbol} {interval} 수집 실패: {e}")
+            self.progress_tracker.fail_interval_collection(symbol, interval, str(e))
+            return 0
+    
+    async def _collect_symbol_with_progress_async(self, session: aiohttp.ClientSession,
+                                                  symbol: str, days: int) -> Dict[str, int]:
+        """단일 코인의 남은 간격 비동기 수집 (진행 상황 추적 포함)"""
+        start_time, end_time = self._time_range(days)
         
         # 남은 간격 목록 조회
         remaining_intervals = self.progress_tracker.get_remaining_intervals(symbol, self.intervals)
@@ -559,177 +732,176 @@ class HistoricalDataCollector:
         self.logger.info(f"{symbol} 3년치 모든 간격 데이터 수집 시작")
         self.logger.info(f"남은 간격 수: {len(remaining_intervals)}개")
         
-        for interval in remaining_intervals:
-            try:
-                self.logger.info(f"{symbol} {interval} 수집 중...")
-                
-                # 간격 수집 시작
-                self.progress_tracker.start_interval_collection(symbol, interval)
-                
-                # 해당 간격의 데이터 수집
-                df = self.get_historical_data(symbol, interval, start_time, end_time)
-                
-                if not df.empty:
-                    all_data[interval] = df
-                    
-                    # 데이터베이스에 저장
-                    data_list = []
-                    for _, row in df.iterrows():
-                        data = {
-                            'timestamp': int(row['timestamp'].timestamp() * 1000),
-                            'open': row['open'],
-                            'high': row['high'],
-                            'low': row['low'],
-                            'close': row['close'],
-                            'volume': row['volume']
-                        }
-                        data_list.append(data)
-                    
-                    # 코인별 테이블에 저장
-                    self.database.save_price_data_to_coin_table(symbol, interval, data_list)
-                    
-                    # 간격 수집 완료
-                    self.progress_tracker.complete_interval_collection(symbol, interval)
-                else:
-                    self.progress_tracker.fail_interval_collection(symbol, interval, "데이터 없음")
-                
-                # API 호출 제한 방지
-                time.sleep(0.1)
-                
-            except Exception as e:
-                self.logger.error(f"{symbol} {interval} 수집 실패: {e}")
-                self.progress_tracker.fail_interval_collection(symbol, interval, str(e))
-                continue
+        tasks = [
+            self._collect_interval_with_progress(session, symbol, interval, start_time, end_time)
+            for interval in remaining_intervals
+        ]
+        results = await asyncio.gather(*tasks)
         
-        self.logger.info(f"{symbol} 데이터 수집 완료: {len(all_data)}개 간격")
-        return all_data
+        return {interval: count for interval, count in zip(remaining_intervals, results) if count}
     
-    def collect_single_coin_single_interval(self, symbol: str, interval: str, days: int = 30) -> pd.DataFrame:
-        """단일 코인의 단일 간격 데이터 수집"""
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
+    def collect_all_data_for_symbol_with_progress(self, symbol: str, days: int = 1095) -> Dict[str, int]:
+        """단일 코인의 모든 간격 데이터 수집 (진행 상황 추적 포함) - 간격별 캔들 수 반환"""
+        counts = self._run(self._collect_symbol_with_progress_async, symbol, days)
         
-        self.logger.info(f"{symbol} {interval} {days}일 데이터 수집 시작")
+        self.logger.info(f"{symbol} 데이터 수집 완료: {len(counts)}개 간격")
+        return counts
+    
+    def collect_single_coin_single_interval(self, symbol: str, interval: str, days: int = 30) -> int:
+        """단일 코인의 단일 간격 데이터 수집 - 저장한 캔들 수 반환"""
+        start_time, end_time = self._time_range(days)
         
-        df = self.get_historical_data(symbol, interval, start_time, end_time)
-        
-        if not df.empty:
-            # 데이터베이스에 저장
-            data_list = []
-            for _, row in df.iterrows():
-                data = {
-                    'timestamp': int(row['timestamp'].timestamp() * 1000),
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'volume': row['volume']
-                }
-                data_list.append(data)
-            
-            # 코인별 테이블에 저장 (새로운 구조)
-            self.database.save_price_data_to_coin_table(symbol, interval, data_list)
+        self.logger.info(f"{symbol} {interval} {days}일 데이터 수집 시작")
         
-        return df
-
-    def collect_missing_data(self, symbol: str, interval: str) -> pd.DataFrame:
-        """누락된 데이터 수집 (과거 데이터와 실시간 데이터 사이의 갭 메우기)"""
+        return self._run(self._fetch_symbol_interval, symbol, interval, start_time, end_time)
+    
+    def collect_missing_data(self, symbol: str, interval: str) -> int:
+        """누락된 데이터 수집 (과거 데이터와 실시간 데이터 사이의 갭 메우기) - 캔들 수 반환"""
         try:
-            # 누락된 데이터 기간 조회
-            missing_period = self.database.get_missing_data_period(symbol, interval)
-            
-            if not missing_period:
-                self.logger.info(f"{symbol} {interval}: 누락된 데이터 없음")
-                return pd.DataFrame()
-            
-            start_time = missing_period['start_time']
-            end_time = missing_period['end_time']
-            
-            # 누락된 기간이 너무 짧으면 수집하지 않음 (1분 이하)
-            if end_time - start_time < 60000:  # 1분 = 60,000ms
-                self.logger.info(f"{symbol} {interval}: 누락 기간이 너무 짧음 (1분 이하)")
-                return pd.DataFrame()
-            
-            self.logger.info(f"{symbol} {interval}: 누락된 데이터 수집 시작 ({start_time} ~ {end_time})")
-            
-            # 누락된 데이터 수집
-            df = self.get_historical_data_batch(symbol, interval, start_time, end_time)
-            
-            if not df.empty:
-                # 데이터베이스에 저장
-                data_list = []
-                for _, row in df.iterrows():
-                    data = {
-                        'timestamp': int(row['timestamp'].timestamp() * 1000),
-                        'open': row['open'],
-                        'high': row['high'],
-                        'low': row['low'],
-                        'close': row['close'],
-                        'volume': row['volume']
-                    }
-                    data_list.append(data)
-                
-                # 코인별 테이블에 저장
-                self.database.save_price_data_to_coin_table(symbol, interval, data_list)
-                
-                self.logger.info(f"{symbol} {interval}: 누락된 데이터 {len(df)}개 수집 완료")
-            
-            return df
-            
+            return self._run(self._collect_missing_one, symbol, interval)
         except Exception as e:
             self.logger.error(f"{symbol} {interval} 누락 데이터 수집 실패: {e}")
-            return pd.DataFrame()
+            return 0
     
-    def collect_all_missing_data(self) -> Dict[str, Dict[str, pd.DataFrame]]:
-        """모든 코인의 모든 간격 누락 데이터 수집"""
-        coins = self.coins_config.coins
-        all_missing_data = {}
+    def collect_missing_data_for_symbol(self, symbol: str) -> Dict[str, int]:
+        """단일 코인의 모든 간격 누락 데이터 수집 (간격별 병렬 처리)"""
+        return self._run(self._collect_missing_symbol_async, symbol)
+    
+    async def _collect_missing_symbol_async(self, session: aiohttp.ClientSession,
+                                            symbol: str) -> Dict[str, int]:
+        """단일 코인의 모든 간격 누락 데이터 비동기 수집"""
+        tasks = [self._collect_missing_one(session, symbol, interval) for interval in self.intervals]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        symbol_counts = {}
+        for interval, result in zip(self.intervals, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"{symbol} {interval} 누락 데이터 수집 실패: {result}")
+            elif result:
+                symbol_counts[interval] = result
+        
+        return symbol_counts
+    
+    def collect_all_missing_data(self) -> Dict[str, Dict[str, int]]:
+        """모든 코인의 모든 간격 누락 데이터 수집 (비동기 병렬 처리)"""
+        return self._run(self._collect_all_missing_async)
+    
+    async def collect_all_missing_data_async(self) -> Dict[str, Dict[str, int]]:
+        """모든 코인의 모든 간격 누락 데이터 비동기 수집 - 코인 × 간격 동시 실행"""
+        async with self._open_session() as session:
+            return await self._collect_all_missing_async(session)
+    
+    async def _collect_all_missing_async(self, session: aiohttp.ClientSession) -> Dict[str, Dict[str, int]]:
+        """모든 코인 × 간격 누락 데이터 동시 수집 - 하나의 세션을 공유"""
+        pairs = [(symbol, interval) for symbol in self.coins_config.coins for interval in self.intervals]
+        all_counts = {}
         
-        self.logger.info("모든 코인의 누락된 데이터 수집 시작")
+        self.logger.info(f"모든 코인의 누락된 데이터 비동기 수집 시작: {len(pairs)}개 작업")
         
-        for symbol in coins:
-            symbol_missing_data = {}
-            
-            for interval in self.intervals:
-                try:
-                    df = self.collect_missing_data(symbol, interval)
-                    if not df.empty:
-                        symbol_missing_data[interval] = df
-                except Exception as e:
-                    self.logger.error(f"{symbol} {interval} 누락 데이터 수집 실패: {e}")
-                    continue
-            
-            if symbol_missing_data:
-                all_missing_data[symbol] = symbol_missing_data
+        tasks = [self._collect_missing_one(session, symbol, interval) for symbol, interval in pairs]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # 결과 처리
+        for (symbol, interval), result in zip(pairs, results):
+            if isinstance(result, Exception):
+                self.logger.error(f"{symbol} {interval} 누락 데이터 수집 실패: {result}")
+            elif result:
+                all_counts.setdefault(symbol, {})[interval] = result
+        
+        self.logger.info(f"누락된 데이터 수집 완료: {len(all_counts)}개 코인")
+        return all_counts
+    
+    async def _collect_missing_one(self, session: aiohttp.ClientSession,
+                                   symbol: str, interval: str) -> int:
+        """단일 코인 단일 간격 누락 데이터 비동기 수집 - 캔들 수 반환"""
+        missing_period = self.database.get_missing_data_period(symbol, interval)
+        
+        if not missing_period:
+            self.logger.info(f"{symbol} {interval}: 누락된 데이터 없음")
+            return 0
+        
+        start_time = missing_period['start_time']
+        end_time = missing_period['end_time']
+        
+        # 누락된 기간이 너무 짧으면 수집하지 않음 (1분 이하)
+        if end_time - start_time < 60000:  # 1분 = 60,000ms
+            self.logger.info(f"{symbol} {interval}: 누락 기간이 너무 짧음 (1분 이하)")
+            return 0
+        
+        count = await self._fetch_symbol_interval(session, symbol, interval, start_time, end_time)
+        
+        if count:
+            self.logger.info(f"{symbol} {interval}: 누락된 데이터 {count}개 수집 완료")
         
-        self.logger.info(f"누락된 데이터 수집 완료: {len(all_missing_data)}개 코인")
-        return all_missing_data
+        return count
+
+# 기존 동기 수집기 이름 호환용 별칭 (단일 비동기 수집기로 통합됨)
+HistoricalDataCollector = FastHistoricalDataCollector
+
+@lru_cache(maxsize=1)
+def get_context():
+    """설정, 코인 설정, 데이터베이스 인스턴스를 한 번만 생성하여 공유"""
+    return Config.from_env(), CoinsConfig(), Database()
+
+
+@lru_cache(maxsize=1)
+def get_collector() -> FastHistoricalDataCollector:
+    """공유 컨텍스트로 만든 수집기를 한 번만 생성 (HTTP 세션을 하위 명령 간 재사용)"""
+    collector = FastHistoricalDataCollector(*get_context())
+    atexit.register(collector.close)
+    return collector
+
+
+def format_interval_counts(interval_counts: Dict[str, int]) -> str:
+    """간격별 캔들 수를 한 줄 문자열로 변환 (예: 1m: 1440개, 1h: 24개)"""
+    return ", ".join(f"{interval}: {count}개" for interval, count in interval_counts.items())
+
+def log_collection_summary(all_counts: Dict[str, Dict[str, int]]):
+    """코인별 수집 결과 요약 로그 - 코인당 한 줄"""
+    for symbol, interval_counts in all_counts.items():
+        logger.info(f"{symbol}: {len(interval_counts)}개 간격, {sum(interval_counts.values())}개 캔들 "
+                    f"({format_interval_counts(interval_counts)})")
+
+def _init_collect_worker(workers: int):
+    """프로세스 풀 초기화 - 프로세스마다 한 번만 가중치 한도를 나눠 가져 전체 요청 속도가 한도를 넘지 않도록 함
+    
+    작업마다 나누면 묶음을 두 개 이상 처리하는 프로세스의 한도가 workers² 로 줄어듦
+    """
+    RATE_LIMITER.share(workers)
 
-def collect_historical_data_for_all_coins_all_intervals_fast(days: int = 1095):
-    """모든 코인의 모든 간격 데이터 고속 수집 (3년치) - 병렬 처리"""
+def _collect_coins_worker(coins: List[str], days: int) -> Dict[str, Dict[str, int]]:
+    """프로세스 풀 작업 - 코인 묶음을 수집하여 DB에 저장하고 캔들 수만 반환"""
+    collector = FastHistoricalDataCollector(*get_context())
+    try:
+        return collector.collect_all_coins_all_data_parallel(days=days, coins=coins)
+    finally:
+        collector.close()
+
+def collect_historical_data_for_all_coins_all_intervals_fast(days: int = 1095, workers: int = None):
+    """모든 코인의 모든 간격 데이터 고속 수집 (3년치) - 코인 묶음별 프로세스 병렬 처리"""
     try:
         logger.info("=== 3년치 모든 데이터 고속 수집 시작 (병렬 처리) ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 고속 데이터 수집기 초기화
-        collector = FastHistoricalDataCollector(config, coins_config, database)
+        coins = get_context()[1].coins
+        workers = max(1, min(workers or os.cpu_count() or 1, len(coins)))
         
         # 전체 데이터 수집 (병렬 처리)
-        logger.info(f"50개 코인 3년치 모든 간격 데이터 병렬 수집 시작")
-        all_data = asyncio.run(collector.collect_all_coins_all_data_async(days=days))
+        logger.info(f"50개 코인 3년치 모든 간격 데이터 병렬 수집 시작 (프로세스 {workers}개)")
+        if workers == 1:
+            all_data = get_collector().collect_all_coins_all_data_parallel(days=days)
+        else:
+            # 응답 파싱/데이터프레임 생성이 GIL에 묶이지 않도록 코인 묶음마다 별도 프로세스에서 수집
+            chunks = [coins[i::workers] for i in range(workers)]
+            all_data = {}
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_collect_worker, initargs=(workers,)) as executor:
+                for counts in executor.map(_collect_coins_worker, chunks, [days] * workers):
+                    all_data.update(counts)
         
         logger.info(f"=== 3년치 모든 데이터 고속 수집 완료 ===")
         logger.info(f"수집된 코인 수: {len(all_data)}")
         
         # 수집 결과 요약
-        for symbol, intervals_data in all_data.items():
-            logger.info(f"{symbol}: {len(intervals_data)}개 간격")
-            for interval, df in intervals_data.items():
-                logger.info(f"  {interval}: {len(df)}개 캔들")
+        log_collection_summary(all_data)
         
         return all_data
         
@@ -742,23 +914,17 @@ def collect_historical_data_for_single_coin_all_intervals_fast(symbol: str, days
     try:
         logger.info(f"=== {symbol} 3년치 모든 간격 데이터 고속 수집 시작 (병렬 처리) ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 고속 데이터 수집기 초기화
-        collector = FastHistoricalDataCollector(config, coins_config, database)
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
         
         # 단일 코인 모든 간격 데이터 수집 (병렬 처리)
-        symbol_data = collector.collect_all_data_for_symbol_parallel(symbol, days=days)
+        symbol_data = collector.collect_all_data_for_symbol(symbol, days=days)
         
         logger.info(f"=== {symbol} 3년치 모든 간격 데이터 고속 수집 완료 ===")
         logger.info(f"수집된 간격 수: {len(symbol_data)}")
         
         # 수집 결과 요약
-        for interval, df in symbol_data.items():
-            logger.info(f"  {interval}: {len(df)}개 캔들")
+        logger.info(f"  {format_interval_counts(symbol_data)}")
         
         return symbol_data
         
@@ -771,13 +937,8 @@ def collect_historical_data_for_all_coins_all_intervals(days: int = 1095):
     try:
         logger.info("=== 3년치 모든 데이터 수집 시작 (재개 가능) ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 데이터 수집기 초기화
-        collector = HistoricalDataCollector(config, coins_config, database)
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
         
         # 전체 데이터 수집 (재개 가능)
         logger.info(f"50개 코인 3년치 모든 간격 데이터 수집 시작")
@@ -787,10 +948,7 @@ def collect_historical_data_for_all_coins_all_intervals(days: int = 1095):
         logger.info(f"수집된 코인 수: {len(all_data)}")
         
         # 수집 결과 요약
-        for symbol, intervals_data in all_data.items():
-            logger.info(f"{symbol}: {len(intervals_data)}개 간격")
-            for interval, df in intervals_data.items():
-                logger.info(f"  {interval}: {len(df)}개 캔들")
+        log_collection_summary(all_data)
         
         return all_data
         
@@ -803,13 +961,8 @@ def collect_historical_data_for_single_coin_all_intervals(symbol: str, days: int
     try:
         logger.info(f"=== {symbol} 3년치 모든 간격 데이터 수집 시작 ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 데이터 수집기 초기화
-        collector = HistoricalDataCollector(config, coins_config, database)
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
         
         # 단일 코인 모든 간격 데이터 수집
         symbol_data = collector.collect_all_data_for_symbol(symbol, days=days)
@@ -818,8 +971,7 @@ def collect_historical_data_for_single_coin_all_intervals(symbol: str, days: int
         logger.info(f"수집된 간격 수: {len(symbol_data)}")
         
         # 수집 결과 요약
-        for interval, df in symbol_data.items():
-            logger.info(f"  {interval}: {len(df)}개 캔들")
+        logger.info(f"  {format_interval_counts(symbol_data)}")
         
         return symbol_data
         
@@ -832,41 +984,16 @@ def collect_historical_data_for_single_coin_single_interval(symbol: str, interva
     try:
         logger.info(f"=== {symbol} {interval} {days}일 데이터 수집 시작 ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 고속 데이터 수집기 초기화 (배치 처리 지원)
-        collector = FastHistoricalDataCollector(config, coins_config, database)
-        
-        # 단일 코인 단일 간격 데이터 수집 (배치 처리)
-        end_time = int(datetime.now().timestamp() * 1000)
-        start_time = int((datetime.now() - timedelta(days=days)).timestamp() * 1000)
-        
-        df = collector.get_historical_data_batch(symbol, interval, start_time, end_time)
-        
-        if not df.empty:
-            # 데이터베이스에 저장
-            data_list = []
-            for _, row in df.iterrows():
-                data = {
-                    'timestamp': int(row['timestamp'].timestamp() * 1000),
-                    'open': row['open'],
-                    'high': row['high'],
-                    'low': row['low'],
-                    'close': row['close'],
-                    'volume': row['volume']
-                }
-                data_list.append(data)
-            
-            # 코인별 테이블에 저장
-            collector.database.save_price_data_to_coin_table(symbol, interval, data_list)
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
+        
+        # 단일 코인 단일 간격 데이터 수집 및 저장
+        count = collector.collect_single_coin_single_interval(symbol, interval, days)
         
         logger.info(f"=== {symbol} {interval} {days}일 데이터 수집 완료 ===")
-        logger.info(f"수집된 캔들 수: {len(df)}")
+        logger.info(f"수집된 캔들 수: {count}")
         
-        return df
+        return count
         
     except Exception as e:
         logger.error(f"{symbol} {interval} {days}일 데이터 수집 실패: {e}")
@@ -877,13 +1004,8 @@ def collect_missing_data_for_all_coins():
     try:
         logger.info("=== 누락된 데이터 수집 시작 ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
-        
-        # 고속 데이터 수집기 초기화
-        collector = FastHistoricalDataCollector(config, coins_config, database)
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
         
         # 누락된 데이터 수집
         missing_data = collector.collect_all_missing_data()
@@ -892,10 +1014,7 @@ def collect_missing_data_for_all_coins():
         logger.info(f"수집된 코인 수: {len(missing_data)}")
         
         # 수집 결과 요약
-        for symbol, intervals_data in missing_data.items():
-            logger.info(f"{symbol}: {len(intervals_data)}개 간격")
-            for interval, df in intervals_data.items():
-                logger.info(f"  {interval}: {len(df)}개 캔들")
+        log_collection_summary(missing_data)
         
         return missing_data
         
@@ -908,32 +1027,17 @@ def collect_missing_data_for_single_coin(symbol: str):
     try:
         logger.info(f"=== {symbol} 누락된 데이터 수집 시작 ===")
         
-        # 설정 로드
-        config = Config.from_env()
-        coins_config = CoinsConfig()
-        database = Database()
+        # 공유 수집기 (설정/DB/HTTP 세션을 프로세스 내에서 재사용)
+        collector = get_collector()
         
-        # 고속 데이터 수집기 초기화
-        collector = FastHistoricalDataCollector(config, coins_config, database)
-        
-        # 단일 코인 누락 데이터 수집
-        symbol_missing_data = {}
-        
-        for interval in collector.intervals:
-            try:
-                df = collector.collect_missing_data(symbol, interval)
-                if not df.empty:
-                    symbol_missing_data[interval] = df
-            except Exception as e:
-                logger.error(f"{symbol} {interval} 누락 데이터 수집 실패: {e}")
-                continue
+        # 단일 코인 누락 데이터 수집 (간격별 병렬 처리)
+        symbol_missing_data = collector.collect_missing_data_for_symbol(symbol)
         
         logger.info(f"=== {symbol} 누락된 데이터 수집 완료 ===")
         logger.info(f"수집된 간격 수: {len(symbol_missing_data)}")
         
         # 수집 결과 요약
-        for interval, df in symbol_missing_data.items():
-            logger.info(f"  {interval}: {len(df)}개 캔들")
+        logger.info(f"  {format_interval_counts(symbol_missing_data)}")
         
         return symbol_missing_data
         
@@ -941,6 +1045,66 @@ def collect_missing_data_for_single_coin(symbol: str):
         logger.error(f"{symbol} 누락된 데이터 수집 실패: {e}")
         raise
 
+def show_progress_status(args):
+    """진행 상황 확인 - 진행 상황 파일만 로드 (설정/DB 초기화 없음)"""
+    ProgressTracker().print_progress_summary()
+
+def reset_progress_status(args):
+    """진행 상황 초기화 - 진행 상황 파일만 로드 (설정/DB 초기화 없음)"""
+    ProgressTracker().reset_progress()
+    logger.info("진행 상황 초기화 완료")
+
+def fast_usage_error(args):
+    """고속 수집 옵션 조합 오류"""
+    logger.error("고속 수집은 --all 또는 --all-intervals와 함께 사용해야 합니다")
+
+def collect_default(args):
+    """기본값: BTCUSDT 1분봉 7일 수집"""
+    logger.info("기본값으로 BTCUSDT 1분봉 7일 데이터 수집")
+    collect_historical_data_for_single_coin_single_interval("BTCUSDT", "1m", 7)
+
+# (실행 모드, 수집 범위) -> 처리 함수
+# 수집 범위가 등록되지 않은 조합은 (실행 모드, None) 항목으로 처리
+COMMANDS = {
+    ('status', None): show_progress_status,
+    ('reset', None): reset_progress_status,
+    
+    # 누락된 데이터만 수집 - 심볼 지정 시 단일 코인, 아니면 모든 코인
+    ('missing', None): lambda args: collect_missing_data_for_all_coins(),
+    ('missing', 'symbol'): lambda args: collect_missing_data_for_single_coin(args.symbol),
+    ('missing', 'symbol_interval'): lambda args: collect_missing_data_for_single_coin(args.symbol),
+    ('missing', 'symbol_all_intervals'): lambda args: collect_missing_data_for_single_coin(args.symbol),
+    
+    # 고속 수집 (병렬 처리, 3년치)
+    ('fast', None): fast_usage_error,
+    ('fast', 'all'): lambda args: collect_historical_data_for_all_coins_all_intervals_fast(args.days, args.workers),
+    ('fast', 'symbol_all_intervals'): lambda args: collect_historical_data_for_single_coin_all_intervals_fast(args.symbol, args.days),
+    
+    # 일반 수집 - 모든 코인은 재개 가능, 심볼만 지정하면 모든 간격 수집
+    ('collect', None): collect_default,
+    ('collect', 'all'): lambda args: collect_historical_data_for_all_coins_all_intervals(args.days),
+    ('collect', 'symbol_all_intervals'): lambda args: collect_historical_data_for_single_coin_all_intervals(args.symbol, args.days),
+    ('collect', 'symbol_interval'): lambda args: collect_historical_data_for_single_coin_single_interval(args.symbol, args.interval, args.days),
+    ('collect', 'symbol'): lambda args: collect_historical_data_for_single_coin_all_intervals(args.symbol, args.days),
+}
+
+def resolve_command(args) -> Callable:
+    """명령행 인자로 처리 함수 조회"""
+    mode = next((flag for flag in ('status', 'reset', 'missing', 'fast') if getattr(args, flag)), 'collect')
+    
+    if args.all:
+        scope = 'all'
+    elif args.symbol and args.all_intervals:
+        scope = 'symbol_all_intervals'
+    elif args.symbol and args.interval:
+        scope = 'symbol_interval'
+    elif args.symbol:
+        scope = 'symbol'
+    else:
+        scope = None
+    
+    return COMMANDS.get((mode, scope), COMMANDS[(mode, None)])
+
 def main():
     """메인 실행 함수"""
     import argparse
@@ -952,6 +1116,7 @@ def main():
     parser.add_argument('--all', action='store_true', help='모든 코인 모든 간격 수집')
     parser.add_argument('--all-intervals', action='store_true', help='단일 코인 모든 간격 수집')
     parser.add_argument('--fast', action='store_true', help='고속 수집 (병렬 처리)')
+    parser.add_argument('--workers', type=int, help='고속 전체 수집 프로세스 수 (기본값: CPU 코어 수)')
     parser.add_argument('--missing', action='store_true', help='누락된 데이터만 수집')
     parser.add_argument('--resume', action='store_true', help='중단된 지점부터 재개')
     parser.add_argument('--reset', action='store_true', help='진행 상황 초기화')
@@ -960,58 +1125,7 @@ def main():
     args = parser.parse_args()
     
     try:
-        # 진행 상황 확인
-        if args.status:
-            config = Config.from_env()
-            coins_config = CoinsConfig()
-            database = Database()
-            collector = HistoricalDataCollector(config, coins_config, database)
-            collector.progress_tracker.print_progress_summary()
-            return
-        
-        # 진행 상황 초기화
-        if args.reset:
-            config = Config.from_env()
-            coins_config = CoinsConfig()
-            database = Database()
-            collector = HistoricalDataCollector(config, coins_config, database)
-            collector.progress_tracker.reset_progress()
-            logger.info("진행 상황 초기화 완료")
-            return
-        
-        if args.missing:
-            if args.symbol:
-                # 단일 코인 누락 데이터 수집
-                collect_missing_data_for_single_coin(args.symbol)
-            else:
-                # 모든 코인 누락 데이터 수집
-                collect_missing_data_for_all_coins()
-        elif args.fast:
-            if args.all:
-                # 모든 코인 모든 간격 고속 수집 (3년치)
-                collect_historical_data_for_all_coins_all_intervals_fast(args.days)
-            elif args.all_intervals and args.symbol:
-                # 단일 코인 모든 간격 고속 수집 (3년치)
-                collect_historical_data_for_single_coin_all_intervals_fast(args.symbol, args.days)
-            else:
-                logger.error("고속 수집은 --all 또는 --all-intervals와 함께 사용해야 합니다")
-        else:
-            if args.all:
-                # 모든 코인 모든 간격 수집 (3년치) - 재개 가능
-                collect_historical_data_for_all_coins_all_intervals(args.days)
-            elif args.all_intervals and args.symbol:
-                # 단일 코인 모든 간격 수집 (3년치)
-                collect_historical_data_for_single_coin_all_intervals(args.symbol, args.days)
-            elif args.symbol and args.interval:
-                # 단일 코인 단일 간격 수집
-                collect_historical_data_for_single_coin_single_interval(args.symbol, args.interval, args.days)
-            elif args.symbol:
-                # 단일 코인 모든 간격 수집 (기본값)
-                collect_historical_data_for_single_coin_all_intervals(args.symbol, args.days)
-            else:
-                # 기본값: BTCUSDT 1분봉 7일 수집
-                logger.info("기본값으로 BTCUSDT 1분봉 7일 데이터 수집")
-                collect_historical_data_for_single_coin_single_interval("BTCUSDT", "1m", 7)
+        resolve_command(args)(args)
         
     except KeyboardInterrupt:
         logger.info("사용자에 의해 중단됨")
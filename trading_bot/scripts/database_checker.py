@@ -6,11 +6,19 @@
 
 import sys
 import os
+import queue
+import re
 import sqlite3
 import time
 import logging
+import threading
+from collections import defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from functools import lru_cache
+from typing import Dict, Iterator, List, Any, Optional
 import pandas as pd
 
 # 프로젝트 루트 경로 추가
@@ -29,22 +37,307 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# 점검 전용 연결 설정 - 읽기 전용, 큰 페이지 캐시와 mmap 으로 대용량 테이블 스캔 가속
+READ_PRAGMAS = (
+    "PRAGMA cache_size=-262144",  # 256MB
+    "PRAGMA mmap_size=268435456",  # 256MB
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA query_only=1",
+)
+
+# HTML 리포트 공통 스타일
+REPORT_CSS = """
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        .header { background-color: #f0f0f0; padding: 20px; border-radius: 5px; }
+        .section { margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }
+        .status-ok { color: green; }
+        .status-warning { color: orange; }
+        .status-timeout { color: orange; }
+        .status-error { color: red; }
+        .table { width: 100%; border-collapse: collapse; margin: 10px 0; }
+        .table th, .table td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+        .table th { background-color: #f2f2f2; }
+        .recommendation { background-color: #fff3cd; padding: 10px; border-radius: 5px; margin: 10px 0; }
+"""
+
+# 리포트의 천 단위 구분 정수 포맷 (형식 지정자를 매번 파싱하지 않도록 미리 바인딩)
+_int_fmt = "{:,}".format
+
+# 리포트 파일 쓰기 버퍼 크기
+REPORT_WRITE_BUFFER = 1 << 20
+
+# 테이블별 스캔 병렬 워커 수 상한
+MAX_SCAN_WORKERS = 8
+
+# 시간 예산 확인 주기 (SQLite VM 명령 수)
+PROGRESS_HANDLER_OPS = 10000
+
+# sqlite_stat1 행 수 추정치가 이 이상이면 정확한 COUNT(*) 대신 추정치 사용
+ROW_ESTIMATE_TRUST_THRESHOLD = 1_000_000
+
+# 인덱스 효율성 검사 대상 테이블 최소 행 수
+INDEX_CHECK_MIN_ROWS = 10000
+
+# 심볼별 구간/공백 리포트 (--price-gaps) 의 청크 스트리밍 크기
+PRICE_CHUNK_ROWS = 200_000
+
+# 집계 함수 FILTER 절 지원 여부 (SQLite 3.30+)
+HAS_AGGREGATE_FILTER = sqlite3.sqlite_version_info >= (3, 30, 0)
+
+# PRAGMA table_info 결과를 속성별 리스트로 정리한 컬럼 정보 (names 는 SQL 캐시 키로 쓰이므로 튜플)
+Columns = namedtuple('Columns', 'names types notnull pk')
+
+# 허용 식별자 (테이블/컬럼명) - Database 가 따옴표 없이 만드는 이름 형식
+_IDENT = re.compile(r'^[A-Za-z_][A-Za-z0-9_]*\Z').match
+
+def _q(name: str) -> str:
+    """SQL 식별자(테이블/컬럼명) 검증 후 큰따옴표 인용"""
+    if not _IDENT(name):
+        raise ValueError(f"허용되지 않는 SQL 식별자: {name!r}")
+    return f'"{name}"'
+
+@lru_cache(maxsize=256)
+def _null_count_sql(table_name: str, col_names: tuple) -> str:
+    """행 수와 컬럼별 NULL 수를 한 번의 스캔으로 구하는 집계 쿼리 (테이블/컬럼 조합별로 캐시)"""
+    null_sums = ''.join(f", COALESCE(SUM({_q(col)} IS NULL), 0)" for col in col_names)
+    return f"SELECT COUNT(*){null_sums} FROM {_q(table_name)}"
+
+@lru_cache(maxsize=256)
+def _duplicate_sql(table_name: str, col_names: tuple) -> tuple:
+    """중복 존재 여부 확인 쿼리와 중복 행 수 집계 쿼리 (테이블/컬럼 조합별로 캐시)"""
+    group_by = ', '.join(_q(col) for col in col_names)
+    probe = f"SELECT 1 FROM {_q(table_name)} GROUP BY {group_by} HAVING COUNT(*) > 1 LIMIT 1"
+    total = f"""
+            SELECT COALESCE(SUM(cnt - 1), 0) FROM (
+                SELECT COUNT(*) AS cnt FROM {_q(table_name)} GROUP BY {group_by} HAVING COUNT(*) > 1
+            )
+        """
+    return probe, total
+
+def _count_where(condition: str) -> str:
+    """조건을 만족하는 행 수 집계식 - FILTER 절 미지원 버전은 SUM(CASE ...) 로 대체"""
+    if HAS_AGGREGATE_FILTER:
+        return f"COUNT(*) FILTER (WHERE {condition})"
+    return f"COALESCE(SUM(CASE WHEN {condition} THEN 1 ELSE 0 END), 0)"
+
+def _prefetch(executor: ThreadPoolExecutor, iterator: Iterator) -> Iterator:
+    """iterator 의 다음 항목을 executor 에서 미리 계산하면서 순서대로 반환"""
+    pending = executor.submit(next, iterator, None)
+    while True:
+        item = pending.result()
+        if item is None:
+            return
+        pending = executor.submit(next, iterator, None)
+        yield item
+
 class DatabaseChecker:
     """데이터베이스 점검 클래스"""
     
-    def __init__(self, db_path: str = "data/trading_bot.db"):
-        """데이터베이스 점검기 초기화"""
+    def __init__(self, db_path: str = "data/trading_bot.db", budget_sec: Optional[float] = None,
+                 price_gaps: bool = False):
+        """데이터베이스 점검기 초기화
+        
+        budget_sec: 테이블별 NULL/중복 스캔 시간 예산 (None 이면 무제한)
+        price_gaps: price_data 전체를 한 번 더 읽어 심볼별 구간/최대 공백 리포트 생성
+        """
         self.db_path = db_path
+        self.budget_sec = budget_sec
+        self.price_gaps = price_gaps
         self.logger = logging.getLogger(__name__)
         
         # 데이터베이스 연결
         self.db = Database()
         
+        # 점검 실행 중 테이블 목록/컬럼/인덱스 정보 캐시 (읽기 트랜잭션마다 초기화)
+        self._schema_cache: Dict[tuple, Any] = {}
+        
+        # 읽기 트랜잭션과 같은 시점에 스냅샷을 고정한 병렬 스캔용 커서 (트랜잭션 밖에서는 None)
+        self._scan_pool: Optional[queue.SimpleQueue] = None
+        
         self.logger.info(f"데이터베이스 점검기 초기화: {db_path}")
     
-    def check_database_integrity(self) -> Dict[str, Any]:
-        """데이터베이스 무결성 점검"""
+    def _connect(self, read_only: bool = False) -> sqlite3.Connection:
+        """점검용 연결 생성 및 읽기 전용 설정 적용 (read_only 면 mode=ro 로 열고 스레드 간 close 허용)"""
+        if read_only:
+            uri = Path(self.db_path).resolve().as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            conn = sqlite3.connect(self.db_path)
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _begin_snapshot(self, cursor):
+        """읽기 트랜잭션 시작 후 첫 읽기로 스냅샷 고정 (BEGIN 만으로는 첫 읽기 전까지 잠금을 잡지 않음)"""
+        cursor.execute("BEGIN")
+        cursor.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchall()
+    
+    @contextmanager
+    def _read_transaction(self):
+        """하나의 읽기 트랜잭션 안에서 사용할 커서 제공 (문장마다 암시적 트랜잭션을 열지 않음)
+        
+        병렬 테이블 스캔용 읽기 전용 연결도 주 커서가 아무것도 읽기 전에 함께 트랜잭션을 시작합니다.
+        롤백 저널 모드에서는 주 연결의 공유 잠금이 쓰기 커밋을 막으므로 모든 스캔이 같은 시점을 보고,
+        WAL 모드에서는 연결들의 스냅샷 고정 사이(수 밀리초)에 커밋된 쓰기만 일부 연결에 보일 수 있습니다.
+        """
+        conn = self._connect()
+        self._schema_cache.clear()
+        scan_conns = []
         try:
+            cursor = conn.cursor()
+            self._begin_snapshot(cursor)
+            
+            pool = queue.SimpleQueue()
+            for _ in range(MAX_SCAN_WORKERS):
+                scan_conn = self._connect(read_only=True)
+                scan_conns.append(scan_conn)
+                scan_cursor = scan_conn.cursor()
+                self._begin_snapshot(scan_cursor)
+                pool.put(scan_cursor)
+            
+            self._scan_pool = pool
+            try:
+                yield cursor
+            finally:
+                self._scan_pool = None
+                conn.commit()
+        finally:
+            for scan_conn in scan_conns:
+                scan_conn.close()
+            conn.close()
+    
+    @contextmanager
+    def _time_budget(self, cursor):
+        """budget_sec 초과 시 진행 중인 쿼리를 중단 (sqlite3.OperationalError: interrupted)"""
+        if not self.budget_sec:
+            yield
+            return
+        
+        deadline = time.monotonic() + self.budget_sec
+        conn = cursor.connection
+        conn.set_progress_handler(lambda: 1 if time.monotonic() > deadline else 0, PROGRESS_HANDLER_OPS)
+        try:
+            yield
+        finally:
+            conn.set_progress_handler(None, 0)
+    
+    def _tables(self, cursor) -> List[str]:
+        """테이블 목록 (같은 점검 실행 안에서는 한 번만 조회)"""
+        if ('tables',) not in self._schema_cache:
+            cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+            self._schema_cache[('tables',)] = [row[0] for row in cursor]
+        return self._schema_cache[('tables',)]
+    
+    def _columns(self, cursor, table_name: str) -> Columns:
+        """테이블 컬럼 정보 (PRAGMA table_info 결과를 이름/타입/NOT NULL/PK 리스트로 변환해 캐시)"""
+        key = ('columns', table_name)
+        if key not in self._schema_cache:
+            cursor.execute(f"PRAGMA table_info({_q(table_name)})")
+            rows = cursor.fetchall()
+            self._schema_cache[key] = Columns(
+                names=tuple(row[1] for row in rows),
+                types=[row[2] for row in rows],
+                notnull=[bool(row[3]) for row in rows],
+                pk=[row[5] for row in rows]
+            )
+        return self._schema_cache[key]
+    
+    def _table_sizes(self, cursor) -> Optional[Dict[str, int]]:
+        """dbstat 가상 테이블로 테이블별 실제 사용 바이트 (인덱스 포함) - 미지원 빌드면 None"""
+        if ('sizes',) not in self._schema_cache:
+            try:
+                cursor.execute("""
+                    SELECT m.tbl_name, SUM(d.pgsize)
+                    FROM dbstat AS d JOIN sqlite_master AS m ON m.name = d.name
+                    GROUP BY m.tbl_name
+                """)
+                self._schema_cache[('sizes',)] = dict(cursor)
+            except sqlite3.OperationalError:
+                self.logger.warning("dbstat 가상 테이블을 사용할 수 없어 테이블 크기를 추정합니다")
+                self._schema_cache[('sizes',)] = None
+        return self._schema_cache[('sizes',)]
+    
+    def _scan_tables_parallel(self, tables: List[str], scan) -> list:
+        """테이블별 스캔을 스레드 풀로 병렬 실행 - 워커 스레드마다 읽기 전용 연결 하나를 재사용
+        
+        _read_transaction 안에서는 트랜잭션과 함께 스냅샷을 고정한 스캔 커서를 사용하고,
+        외부에서 넘긴 커서로 호출된 경우에는 새 연결을 열므로 주 커서와 스냅샷이 다를 수 있습니다.
+        """
+        if not tables:
+            return []
+        
+        pool = self._scan_pool
+        local = threading.local()
+        taken = []
+        
+        def run(table):
+            if not hasattr(local, 'cursor'):
+                local.cursor = pool.get_nowait() if pool is not None else self._connect(read_only=True).cursor()
+                taken.append(local.cursor)
+            return scan(local.cursor, table)
+        
+        try:
+            with ThreadPoolExecutor(max_workers=min(MAX_SCAN_WORKERS, len(tables))) as executor:
+                return list(executor.map(run, tables))
+        finally:
+            for cursor in taken:
+                if pool is not None:
+                    pool.put(cursor)
+                else:
+                    cursor.connection.close()
+    
+    def _per_table_integrity(self, cursor, tables: List[str]) -> list:
+        """테이블별 무결성 점검 병렬 실행 (스키마/크기 캐시는 워커 시작 전에 채움)"""
+        self._table_sizes(cursor)
+        for table in tables:
+            self._columns(cursor, table)
+        return self._scan_tables_parallel(tables, self._check_table_integrity)
+    
+    def _row_estimates(self, cursor) -> Dict[str, int]:
+        """sqlite_stat1 (ANALYZE 결과) 의 테이블별 행 수 추정치 - 통계가 없으면 빈 dict"""
+        if ('row_estimates',) not in self._schema_cache:
+            estimates = {}
+            try:
+                cursor.execute("SELECT tbl, stat FROM sqlite_stat1")
+                for tbl, stat in cursor:
+                    if stat:
+                        estimates[tbl] = max(estimates.get(tbl, 0), int(stat.split()[0]))
+            except sqlite3.OperationalError:
+                pass  # ANALYZE 를 실행한 적 없는 DB
+            self._schema_cache[('row_estimates',)] = estimates
+        return self._schema_cache[('row_estimates',)]
+    
+    def analyze(self):
+        """ANALYZE 실행으로 sqlite_stat1 통계 갱신 (점검 연결은 읽기 전용이라 별도 연결 사용)"""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            try:
+                conn.execute("ANALYZE")
+                conn.commit()
+            finally:
+                conn.close()
+            self.logger.info("ANALYZE 완료 - sqlite_stat1 통계 갱신")
+        except Exception as e:
+            self.logger.error(f"ANALYZE 실패: {e}")
+    
+    def _iter_checks(self) -> Iterator[Dict[str, Any]]:
+        """무결성/성능/품질 점검 결과를 하나의 연결과 트랜잭션 안에서 순서대로 생성"""
+        with self._read_transaction() as cursor:
+            yield self.check_database_integrity(cursor)
+            yield self.check_database_performance(cursor)
+            yield self.check_data_quality(cursor)
+    
+    def run_all_checks(self):
+        """무결성/성능/품질 점검을 하나의 연결과 트랜잭션으로 실행"""
+        return tuple(self._iter_checks())
+    
+    def check_database_integrity(self, cursor=None) -> Dict[str, Any]:
+        """데이터베이스 무결성 점검 (cursor 미지정 시 전용 연결 사용)"""
+        try:
+            if cursor is None:
+                with self._read_transaction() as cursor:
+                    return self.check_database_integrity(cursor)
+            
             self.logger.info("=== 데이터베이스 무결성 점검 시작 ===")
             
             integrity_results = {
@@ -54,35 +347,31 @@ class DatabaseChecker:
                 'warnings': []
             }
             
-            # 데이터베이스 연결 테스트
+            # 데이터베이스 조회 테스트
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # 테이블 목록 조회
-                    cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                    tables = [row[0] for row in cursor.fetchall()]
-                    
-                    self.logger.info(f"발견된 테이블: {tables}")
-                    
-                    # 각 테이블 점검
-                    for table in tables:
-                        table_result = self._check_table_integrity(cursor, table)
-                        integrity_results['tables'][table] = table_result
-                        
-                        if table_result['status'] == 'ERROR':
-                            integrity_results['overall_status'] = 'ERROR'
-                        elif table_result['status'] == 'WARNING' and integrity_results['overall_status'] == 'OK':
-                            integrity_results['overall_status'] = 'WARNING'
-                    
-                    # 인덱스 점검
-                    index_result = self._check_indexes(cursor)
-                    integrity_results['indexes'] = index_result
-                    
-                    # 외래키 제약 조건 점검
-                    fk_result = self._check_foreign_keys(cursor)
-                    integrity_results['foreign_keys'] = fk_result
+                # 테이블 목록 조회
+                tables = self._tables(cursor)
+                
+                self.logger.info(f"발견된 테이블: {tables}")
+                
+                # 각 테이블 점검 (스레드 병렬)
+                table_results = self._per_table_integrity(cursor, tables)
+                for table, table_result in zip(tables, table_results):
+                    integrity_results['tables'][table] = table_result
                     
+                    if table_result['status'] == 'ERROR':
+                        integrity_results['overall_status'] = 'ERROR'
+                    elif table_result['status'] in ('WARNING', 'TIMEOUT') and integrity_results['overall_status'] == 'OK':
+                        integrity_results['overall_status'] = 'WARNING'
+                
+                # 인덱스 점검
+                index_result = self._check_indexes(cursor)
+                integrity_results['indexes'] = index_result
+                
+                # 외래키 제약 조건 점검
+                fk_result = self._check_foreign_keys(cursor)
+                integrity_results['foreign_keys'] = fk_result
+                
             except Exception as e:
                 integrity_results['overall_status'] = 'ERROR'
                 integrity_results['errors'].append(f"데이터베이스 연결 실패: {e}")
@@ -106,50 +395,43 @@ class DatabaseChecker:
                 'warnings': []
             }
             
-            # 행 수 조회
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            row_count = cursor.fetchone()[0]
-            result['row_count'] = row_count
+            # 행 수와 컬럼별 NULL 값 수를 한 번의 테이블 스캔으로 조회
+            columns = self._columns(cursor, table_name)
+            col_names = columns.names
+            pk_columns = tuple(name for name, pk in zip(columns.names, columns.pk) if pk > 0)  # pk > 0인 컬럼
             
-            # 테이블 크기 조회 (간단한 방법으로 변경)
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            row_count = cursor.fetchone()[0]
-            result['size_bytes'] = row_count * 100  # 대략적인 크기 추정
+            try:
+                with self._time_budget(cursor):
+                    cursor.execute(_null_count_sql(table_name, col_names))
+                    row_count, *null_counts = cursor.fetchone()
+                    result['row_count'] = row_count
+                    
+                    # 중복 데이터 검사 (기본키가 있는 경우)
+                    duplicate_count = self._count_duplicates(cursor, table_name, pk_columns) if pk_columns else 0
+            except sqlite3.OperationalError as e:
+                if 'interrupted' not in str(e):
+                    raise
+                self.logger.warning(f"테이블 '{table_name}' 점검 시간 예산 {self.budget_sec}초 초과로 중단")
+                result['status'] = 'TIMEOUT'
+                result['warnings'].append(f"시간 예산 {self.budget_sec}초 초과로 점검 중단")
+                return result
+            
+            # 테이블 크기 조회 (dbstat 페이지 합계, 미지원 시 추정)
+            table_sizes = self._table_sizes(cursor)
+            if table_sizes is not None:
+                result['size_bytes'] = table_sizes.get(table_name, 0)
+            else:
+                result['size_bytes'] = row_count * 100  # 대략적인 크기 추정
             
             # NULL 값 검사
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
+            for col_name, null_count in zip(col_names, null_counts):
+                if null_count > 0:
+                    result['status'] = 'WARNING'
+                    result['warnings'].append(f"컬럼 '{col_name}'에 {null_count}개의 NULL 값 발견")
             
-            for col in columns:
-                col_name = col[1]
-                col_type = col[2]
-                is_not_null = col[3]
-                
-                # NOT NULL 컬럼에서 NULL 값 검사 (안전한 방법)
-                try:
-                    cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {col_name} IS NULL")
-                    null_count = cursor.fetchone()[0]
-                    
-                    if null_count > 0:
-                        result['status'] = 'WARNING'
-                        result['warnings'].append(f"컬럼 '{col_name}'에 {null_count}개의 NULL 값 발견")
-                except Exception as e:
-                    # 컬럼이 존재하지 않거나 접근할 수 없는 경우 무시
-                    pass
-            
-            # 중복 데이터 검사 (기본키가 있는 경우)
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            pk_columns = [col[1] for col in columns if col[5] > 0]  # pk > 0인 컬럼
-            
-            if pk_columns:
-                pk_cols_str = ', '.join(pk_columns)
-                cursor.execute(f"SELECT COUNT(*) FROM (SELECT DISTINCT {pk_cols_str} FROM {table_name})")
-                distinct_count = cursor.fetchone()[0]
-                
-                if distinct_count < row_count:
-                    result['status'] = 'ERROR'
-                    result['errors'].append(f"기본키 중복 발견: {row_count - distinct_count}개 중복")
+            if duplicate_count > 0:
+                result['status'] = 'ERROR'
+                result['errors'].append(f"기본키 중복 발견: {duplicate_count}개 중복")
             
             self.logger.info(f"테이블 '{table_name}' 점검 완료: {result['status']} ({row_count}행)")
             return result
@@ -163,6 +445,18 @@ class DatabaseChecker:
                 'size_bytes': 0
             }
     
+    def _count_duplicates(self, cursor, table_name: str, col_names: tuple) -> int:
+        """지정 컬럼 기준 중복 행 수 - 중복이 하나라도 있을 때만 전체 개수 집계"""
+        probe_sql, total_sql = _duplicate_sql(table_name, tuple(col_names))
+        
+        # 첫 중복 그룹을 찾는 즉시 종료하는 존재 여부 확인
+        cursor.execute(probe_sql)
+        if cursor.fetchone() is None:
+            return 0
+        
+        cursor.execute(total_sql)
+        return cursor.fetchone()[0]
+    
     def _check_indexes(self, cursor) -> Dict[str, Any]:
         """인덱스 점검"""
         try:
@@ -174,17 +468,12 @@ class DatabaseChecker:
             
             # 인덱스 목록 조회
             cursor.execute("SELECT name, tbl_name, sql FROM sqlite_master WHERE type='index'")
-            indexes = cursor.fetchall()
+            result['indexes'] = [
+                {'name': index_name, 'table': table_name, 'sql': sql}
+                for index_name, table_name, sql in cursor
+            ]
             
-            for index in indexes:
-                index_name, table_name, sql = index
-                result['indexes'].append({
-                    'name': index_name,
-                    'table': table_name,
-                    'sql': sql
-                })
-            
-            self.logger.info(f"인덱스 점검 완료: {len(indexes)}개 인덱스")
+            self.logger.info(f"인덱스 점검 완료: {len(result['indexes'])}개 인덱스")
             return result
             
         except Exception as e:
@@ -202,27 +491,25 @@ class DatabaseChecker:
             
             # 외래키 정보 조회
             cursor.execute("PRAGMA foreign_key_list")
-            foreign_keys = cursor.fetchall()
-            
-            for fk in foreign_keys:
-                result['foreign_keys'].append({
-                    'table': fk[0],
-                    'from': fk[3],
-                    'to': fk[4],
-                    'on_update': fk[5],
-                    'on_delete': fk[6]
-                })
-            
-            self.logger.info(f"외래키 점검 완료: {len(foreign_keys)}개 외래키")
+            result['foreign_keys'] = [
+                {'table': fk[0], 'from': fk[3], 'to': fk[4], 'on_update': fk[5], 'on_delete': fk[6]}
+                for fk in cursor
+            ]
+            
+            self.logger.info(f"외래키 점검 완료: {len(result['foreign_keys'])}개 외래키")
             return result
             
         except Exception as e:
             self.logger.error(f"외래키 점검 실패: {e}")
             return {'status': 'ERROR', 'error': str(e)}
     
-    def check_database_performance(self) -> Dict[str, Any]:
-        """데이터베이스 성능 점검"""
+    def check_database_performance(self, cursor=None) -> Dict[str, Any]:
+        """데이터베이스 성능 점검 (cursor 미지정 시 전용 연결 사용)"""
         try:
+            if cursor is None:
+                with self._read_transaction() as cursor:
+                    return self.check_database_performance(cursor)
+            
             self.logger.info("=== 데이터베이스 성능 점검 시작 ===")
             
             performance_results = {
@@ -231,17 +518,25 @@ class DatabaseChecker:
                 'recommendations': []
             }
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 테이블별 행 수 및 크기 조회
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = [row[0] for row in cursor.fetchall()]
+            # 테이블별 행 수 및 크기 조회
+            tables = self._tables(cursor)
+            row_estimates = self._row_estimates(cursor)
+            
+            for table in tables:
+                estimate = row_estimates.get(table)
                 
-                for table in tables:
+                if estimate is not None and estimate >= ROW_ESTIMATE_TRUST_THRESHOLD:
+                    # 충분히 큰 테이블은 전체 스캔 없이 sqlite_stat1 추정치 사용
+                    row_count = estimate
+                    performance_results['query_performance'][table] = {
+                        'row_count': row_count,
+                        'count_query_time': None,
+                        'status': 'ESTIMATED'
+                    }
+                else:
                     # 행 수 조회
                     start_time = time.time()
-                    cursor.execute(f"SELECT COUNT(*) FROM {table}")
+                    cursor.execute(f"SELECT COUNT(*) FROM {_q(table)}")
                     row_count = cursor.fetchone()[0]
                     query_time = time.time() - start_time
                     
@@ -250,31 +545,31 @@ class DatabaseChecker:
                         'count_query_time': query_time,
                         'status': 'FAST' if query_time < 1.0 else 'SLOW'
                     }
-                    
-                    # 인덱스 효율성 검사
-                    if row_count > 10000:  # 큰 테이블만
-                        index_efficiency = self._check_index_efficiency(cursor, table)
-                        performance_results['index_efficiency'][table] = index_efficiency
-                        
-                        if index_efficiency['missing_indexes']:
-                            performance_results['recommendations'].append(
-                                f"테이블 '{table}'에 인덱스 추가 권장"
-                            )
-                
-                # 전체 데이터베이스 크기
-                cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
-                db_size = cursor.fetchone()[0]
-                performance_results['database_size'] = db_size
                 
-                # 페이지 수 및 페이지 크기
-                cursor.execute("SELECT page_count, page_size FROM pragma_page_count(), pragma_page_size()")
-                page_info = cursor.fetchone()
-                performance_results['page_count'] = page_info[0]
-                performance_results['page_size'] = page_info[1]
+                # 인덱스 효율성 검사
+                if row_count > INDEX_CHECK_MIN_ROWS:  # 큰 테이블만
+                    index_efficiency = self._check_index_efficiency(cursor, table)
+                    performance_results['index_efficiency'][table] = index_efficiency
+                    
+                    if index_efficiency['missing_indexes']:
+                        performance_results['recommendations'].append(
+                            f"테이블 '{table}'에 인덱스 추가 권장"
+                        )
+            
+            # 전체 데이터베이스 크기
+            cursor.execute("SELECT page_count * page_size as size FROM pragma_page_count(), pragma_page_size()")
+            db_size = cursor.fetchone()[0]
+            performance_results['database_size'] = db_size
+            
+            # 페이지 수 및 페이지 크기
+            cursor.execute("SELECT page_count, page_size FROM pragma_page_count(), pragma_page_size()")
+            page_info = cursor.fetchone()
+            performance_results['page_count'] = page_info[0]
+            performance_results['page_size'] = page_info[1]
             
             self.logger.info("=== 데이터베이스 성능 점검 완료 ===")
             return performance_results
-            
+        
         except Exception as e:
             self.logger.error(f"성능 점검 실패: {e}")
             return {'error': str(e)}
@@ -289,25 +584,24 @@ class DatabaseChecker:
             }
             
             # 테이블의 컬럼 정보 조회
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
-            
-            # 인덱스 정보 조회
-            cursor.execute(f"PRAGMA index_list({table_name})")
-            indexes = cursor.fetchall()
+            table_columns = set(self._columns(cursor, table_name).names)
             
             # WHERE 절에서 자주 사용되는 컬럼들 (추정)
             frequently_used_columns = ['timestamp', 'symbol', 'interval', 'created_at', 'updated_at']
             
-            for col in columns:
-                col_name = col[1]
-                if col_name in frequently_used_columns:
-                    # 해당 컬럼에 인덱스가 있는지 확인
-                    has_index = any(index[1].endswith(f"_{col_name}") or col_name in index[1] for index in indexes)
-                    
-                    if not has_index:
-                        result['missing_indexes'].append(col_name)
-                        result['recommendations'].append(f"컬럼 '{col_name}'에 인덱스 추가 권장")
+            # 후보 컬럼 중 이미 인덱스에 포함된 컬럼을 한 번의 조회로 확인
+            placeholders = ', '.join('?' for _ in frequently_used_columns)
+            cursor.execute(f"""
+                SELECT DISTINCT i.name
+                FROM pragma_index_list(?) AS l JOIN pragma_index_info(l.name) AS i
+                WHERE i.name IN ({placeholders})
+            """, (table_name, *frequently_used_columns))
+            indexed = {row[0] for row in cursor}
+            
+            for col_name in frequently_used_columns:
+                if col_name in table_columns and col_name not in indexed:
+                    result['missing_indexes'].append(col_name)
+                    result['recommendations'].append(f"컬럼 '{col_name}'에 인덱스 추가 권장")
             
             return result
             
@@ -315,9 +609,13 @@ class DatabaseChecker:
             self.logger.error(f"인덱스 효율성 검사 실패: {e}")
             return {'error': str(e)}
     
-    def check_data_quality(self) -> Dict[str, Any]:
-        """데이터 품질 점검"""
+    def check_data_quality(self, cursor=None) -> Dict[str, Any]:
+        """데이터 품질 점검 (cursor 미지정 시 전용 연결 사용)"""
         try:
+            if cursor is None:
+                with self._read_transaction() as cursor:
+                    return self.check_data_quality(cursor)
+            
             self.logger.info("=== 데이터 품질 점검 시작 ===")
             
             quality_results = {
@@ -327,32 +625,31 @@ class DatabaseChecker:
                 'issues': []
             }
             
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # 테이블별 데이터 품질 점검
-                cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
-                tables = [row[0] for row in cursor.fetchall()]
-                
-                for table in tables:
-                    table_quality = self._check_table_data_quality(cursor, table)
-                    quality_results['data_consistency'][table] = table_quality
-                    
-                    if table_quality['issues']:
-                        quality_results['issues'].extend(table_quality['issues'])
-                
-                # 특정 테이블 상세 점검
-                if 'price_data' in tables:
-                    price_quality = self._check_price_data_quality(cursor)
-                    quality_results['data_accuracy']['price_data'] = price_quality
+            # 테이블별 데이터 품질 점검
+            tables = self._tables(cursor)
+            
+            for table in tables:
+                self._columns(cursor, table)
+            table_qualities = self._scan_tables_parallel(tables, self._check_table_data_quality)
+            
+            for table, table_quality in zip(tables, table_qualities):
+                quality_results['data_consistency'][table] = table_quality
                 
-                if 'sentiment_data' in tables:
-                    sentiment_quality = self._check_sentiment_data_quality(cursor)
-                    quality_results['data_accuracy']['sentiment_data'] = sentiment_quality
+                if table_quality['issues']:
+                    quality_results['issues'].extend(table_quality['issues'])
+            
+            # 특정 테이블 상세 점검
+            if 'price_data' in tables:
+                price_quality = self._check_price_data_quality(cursor)
+                quality_results['data_accuracy']['price_data'] = price_quality
+            
+            if 'sentiment_data' in tables:
+                sentiment_quality = self._check_sentiment_data_quality(cursor)
+                quality_results['data_accuracy']['sentiment_data'] = sentiment_quality
             
             self.logger.info("=== 데이터 품질 점검 완료 ===")
             return quality_results
-            
+        
         except Exception as e:
             self.logger.error(f"데이터 품질 점검 실패: {e}")
             return {'error': str(e)}
@@ -367,30 +664,21 @@ class DatabaseChecker:
                 'issues': []
             }
             
-            # 전체 행 수
-            cursor.execute(f"SELECT COUNT(*) FROM {table_name}")
-            result['total_rows'] = cursor.fetchone()[0]
+            # 전체 행 수와 컬럼별 NULL 값 수 (한 번의 테이블 스캔)
+            col_names = self._columns(cursor, table_name).names
             
-            # 컬럼별 NULL 값 수
-            cursor.execute(f"PRAGMA table_info({table_name})")
-            columns = cursor.fetchall()
+            cursor.execute(_null_count_sql(table_name, col_names))
+            result['total_rows'], *null_counts = cursor.fetchone()
             
-            for col in columns:
-                col_name = col[1]
-                cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {col_name} IS NULL")
-                null_count = cursor.fetchone()[0]
+            for col_name, null_count in zip(col_names, null_counts):
                 result['null_counts'][col_name] = null_count
                 
                 if null_count > 0:
                     result['issues'].append(f"컬럼 '{col_name}'에 {null_count}개의 NULL 값")
             
             # 중복 행 검사 (모든 컬럼 기준)
-            if columns:
-                col_names = [col[1] for col in columns]
-                cols_str = ', '.join(col_names)
-                cursor.execute(f"SELECT COUNT(*) FROM (SELECT DISTINCT {cols_str} FROM {table_name})")
-                distinct_count = cursor.fetchone()[0]
-                result['duplicate_rows'] = result['total_rows'] - distinct_count
+            if col_names:
+                result['duplicate_rows'] = self._count_duplicates(cursor, table_name, col_names)
                 
                 if result['duplicate_rows'] > 0:
                     result['issues'].append(f"{result['duplicate_rows']}개의 중복 행 발견")
@@ -412,41 +700,94 @@ class DatabaseChecker:
                 'anomalies': []
             }
             
-            # 전체 레코드 수
-            cursor.execute("SELECT COUNT(*) FROM price_data")
-            result['total_records'] = cursor.fetchone()[0]
+            # 스키마에 맞춰 컬럼 결정 (open/open_price, interval 컬럼 유무)
+            columns = set(self._columns(cursor, 'price_data').names)
+            price_columns = [c if c in columns else f"{c}_price" for c in ('open', 'high', 'low', 'close')]
+            anomaly_expr = " OR ".join(f"{_q(c)} <= 0" for c in price_columns)
             
-            # 심볼별 통계
-            cursor.execute("SELECT symbol, COUNT(*) FROM price_data GROUP BY symbol")
-            symbol_stats = cursor.fetchall()
-            result['symbols'] = [stat[0] for stat in symbol_stats]
+            # 레코드 수, 날짜 범위, 이상치(가격이 0이거나 음수) 를 한 번의 스캔으로 집계
+            cursor.execute(f"""
+                SELECT COUNT(*), MIN(timestamp), MAX(timestamp), {_count_where(anomaly_expr)}
+                FROM price_data
+            """)
+            total_records, min_ts, max_ts, anomaly_count = cursor.fetchone()
+            result['total_records'] = total_records
             
-            # 간격별 통계
-            cursor.execute("SELECT interval, COUNT(*) FROM price_data GROUP BY interval")
-            interval_stats = cursor.fetchall()
-            result['intervals'] = [stat[0] for stat in interval_stats]
-            
-            # 날짜 범위
-            cursor.execute("SELECT MIN(timestamp), MAX(timestamp) FROM price_data")
-            date_range = cursor.fetchone()
-            if date_range[0] and date_range[1]:
+            if min_ts and max_ts:
                 result['date_range'] = {
-                    'start': datetime.fromtimestamp(date_range[0] / 1000),
-                    'end': datetime.fromtimestamp(date_range[1] / 1000)
+                    'start': datetime.fromtimestamp(min_ts / 1000),
+                    'end': datetime.fromtimestamp(max_ts / 1000)
                 }
             
-            # 이상치 검사 (가격이 0이거나 음수인 경우)
-            cursor.execute("SELECT COUNT(*) FROM price_data WHERE open <= 0 OR high <= 0 OR low <= 0 OR close <= 0")
-            anomaly_count = cursor.fetchone()[0]
+            # 심볼별/간격별 통계를 하나의 GROUP BY 로 조회
+            has_interval = 'interval' in columns
+            group_by = "symbol, interval" if has_interval else "symbol"
+            cursor.execute(f"SELECT {group_by}, COUNT(*) FROM price_data GROUP BY {group_by}")
+            symbol_counts = defaultdict(int)
+            interval_counts = defaultdict(int)
+            for row in cursor:
+                symbol_counts[row[0]] += row[-1]
+                if has_interval:
+                    interval_counts[row[1]] += row[-1]
+            result['symbols'] = list(symbol_counts)
+            result['intervals'] = sorted(interval_counts)
+            
             if anomaly_count > 0:
                 result['anomalies'].append(f"{anomaly_count}개의 이상한 가격 데이터")
             
+            # 요청 시에만 심볼별 구간과 최대 공백을 pandas 청크 집계로 산출 (전체 테이블 정렬 스캔)
+            if self.price_gaps:
+                result['symbol_ranges'] = self._price_gap_report(cursor)
+            
             return result
             
         except Exception as e:
             self.logger.error(f"가격 데이터 품질 점검 실패: {e}")
             return {'error': str(e)}
     
+    def _price_gap_report(self, cursor) -> Dict[str, Dict[str, Any]]:
+        """price_data 를 (symbol, timestamp) 순으로 청크 스트리밍해 심볼별 행 수/시작/끝/최대 공백(ms) 집계
+        
+        (symbol, timestamp) 두 컬럼만 읽어 UNIQUE 인덱스만으로 정렬 스캔이 끝나도록 함
+        """
+        report: Dict[str, Dict[str, Any]] = {}
+        prev_symbol = prev_ts = None
+        
+        chunks = pd.read_sql_query(
+            "SELECT symbol, timestamp FROM price_data ORDER BY symbol, timestamp",
+            cursor.connection, chunksize=PRICE_CHUNK_ROWS
+        )
+        for chunk in chunks:
+            symbols = chunk['symbol']
+            timestamps = chunk['timestamp']
+            
+            # 같은 심볼 안에서만 연속 타임스탬프 간격 계산 (이전 청크 마지막 행과도 연결)
+            gaps = timestamps.diff().where(symbols.eq(symbols.shift()))
+            if symbols.iloc[0] == prev_symbol:
+                gaps.iloc[0] = timestamps.iloc[0] - prev_ts
+            
+            stats = pd.DataFrame({'symbol': symbols, 'timestamp': timestamps, 'gap': gaps}).groupby('symbol', sort=False).agg(
+                rows=('timestamp', 'size'),
+                start=('timestamp', 'min'),
+                end=('timestamp', 'max'),
+                max_gap=('gap', 'max')
+            )
+            for symbol, row in zip(stats.index, stats.itertuples(index=False)):
+                entry = report.setdefault(symbol, {'rows': 0, 'start': int(row.start), 'end': int(row.end), 'max_gap_ms': 0})
+                entry['rows'] += int(row.rows)
+                entry['end'] = int(row.end)
+                if pd.notna(row.max_gap):
+                    entry['max_gap_ms'] = max(entry['max_gap_ms'], int(row.max_gap))
+            
+            prev_symbol = symbols.iloc[-1]
+            prev_ts = timestamps.iloc[-1]
+        
+        for entry in report.values():
+            entry['start'] = datetime.fromtimestamp(entry['start'] / 1000)
+            entry['end'] = datetime.fromtimestamp(entry['end'] / 1000)
+        
+        return report
+    
     def _check_sentiment_data_quality(self, cursor) -> Dict[str, Any]:
         """감정 데이터 품질 점검"""
         try:
@@ -457,28 +798,26 @@ class DatabaseChecker:
                 'issues': []
             }
             
-            # 전체 레코드 수
-            cursor.execute("SELECT COUNT(*) FROM sentiment_data")
-            result['total_records'] = cursor.fetchone()[0]
+            # 레코드 수, 감정 점수 범위, 이상치를 한 번의 스캔으로 집계
+            cursor.execute(f"""
+                SELECT COUNT(*), MIN(sentiment_score), MAX(sentiment_score), AVG(sentiment_score),
+                       {_count_where("sentiment_score < -1 OR sentiment_score > 1")}
+                FROM sentiment_data
+            """)
+            total_records, min_score, max_score, avg_score, anomaly_count = cursor.fetchone()
+            result['total_records'] = total_records
             
-            # 소스별 통계
-            cursor.execute("SELECT source, COUNT(*) FROM sentiment_data GROUP BY source")
-            source_stats = cursor.fetchall()
-            result['sources'] = [stat[0] for stat in source_stats]
-            
-            # 감정 점수 범위
-            cursor.execute("SELECT MIN(sentiment_score), MAX(sentiment_score), AVG(sentiment_score) FROM sentiment_data")
-            score_stats = cursor.fetchone()
-            if score_stats[0] is not None:
+            if min_score is not None:
                 result['sentiment_range'] = {
-                    'min': score_stats[0],
-                    'max': score_stats[1],
-                    'avg': score_stats[2]
+                    'min': min_score,
+                    'max': max_score,
+                    'avg': avg_score
                 }
             
-            # 감정 점수 이상치 검사
-            cursor.execute("SELECT COUNT(*) FROM sentiment_data WHERE sentiment_score < -1 OR sentiment_score > 1")
-            anomaly_count = cursor.fetchone()[0]
+            # 소스별 통계
+            cursor.execute("SELECT source, COUNT(*) FROM sentiment_data GROUP BY source")
+            result['sources'] = [stat[0] for stat in cursor]
+            
             if anomaly_count > 0:
                 result['issues'].append(f"{anomaly_count}개의 이상한 감정 점수")
             
@@ -493,18 +832,22 @@ class DatabaseChecker:
         try:
             self.logger.info("=== 데이터베이스 종합 점검 리포트 생성 시작 ===")
             
-            # 각종 점검 실행
-            integrity_result = self.check_database_integrity()
-            performance_result = self.check_database_performance()
-            quality_result = self.check_data_quality()
-            
-            # 리포트 생성
-            report = self._generate_html_report(integrity_result, performance_result, quality_result)
-            
-            # 리포트 파일 저장
             report_file = f"database_check_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.html"
-            with open(report_file, 'w', encoding='utf-8') as f:
-                f.write(report)
+            
+            # 점검은 전용 스레드 하나에서 순서대로 실행하고 (SQLite 연결은 같은 스레드에서만 사용),
+            # 앞 점검 결과 섹션을 파일에 쓰는 동안 다음 점검을 미리 진행
+            checks = self._iter_checks()
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                try:
+                    with open(report_file, 'w', encoding='utf-8', buffering=REPORT_WRITE_BUFFER) as f:
+                        f.writelines(self._iter_html_report(_prefetch(executor, checks)))
+                except Exception:
+                    # 중간에 실패하면 불완전한 리포트 파일을 남기지 않음
+                    if os.path.exists(report_file):
+                        os.remove(report_file)
+                    raise
+                finally:
+                    executor.submit(checks.close)
             
             self.logger.info(f"=== 데이터베이스 점검 리포트 생성 완료: {report_file} ===")
             return report_file
@@ -515,24 +858,17 @@ class DatabaseChecker:
     
     def _generate_html_report(self, integrity_result: Dict, performance_result: Dict, quality_result: Dict) -> str:
         """HTML 리포트 생성"""
-        html = f"""
+        return "".join(self._iter_html_report(iter((integrity_result, performance_result, quality_result))))
+    
+    def _iter_html_report(self, results: Iterator[Dict]) -> Iterator[str]:
+        """HTML 리포트를 섹션 단위 문자열로 생성 - 각 점검 결과는 해당 섹션 직전에 results 에서 꺼냄"""
+        yield f"""
 <!DOCTYPE html>
 <html>
 <head>
     <meta charset="UTF-8">
     <title>데이터베이스 점검 리포트</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        .header {{ background-color: #f0f0f0; padding: 20px; border-radius: 5px; }}
-        .section {{ margin: 20px 0; padding: 15px; border: 1px solid #ddd; border-radius: 5px; }}
-        .status-ok {{ color: green; }}
-        .status-warning {{ color: orange; }}
-        .status-error {{ color: red; }}
-        .table {{ width: 100%; border-collapse: collapse; margin: 10px 0; }}
-        .table th, .table td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        .table th {{ background-color: #f2f2f2; }}
-        .recommendation {{ background-color: #fff3cd; padding: 10px; border-radius: 5px; margin: 10px 0; }}
-    </style>
+    <style>{REPORT_CSS}    </style>
 </head>
 <body>
     <div class="header">
@@ -541,7 +877,10 @@ class DatabaseChecker:
         <p>데이터베이스: {self.db_path}</p>
     </div>
     
-    <div class="section">
+"""
+        
+        integrity_result = next(results)
+        yield f"""    <div class="section">
         <h2>🔍 무결성 점검 결과</h2>
         <p>전체 상태: <span class="status-{integrity_result.get('overall_status', 'unknown')}">{integrity_result.get('overall_status', 'UNKNOWN')}</span></p>
         
@@ -560,17 +899,17 @@ class DatabaseChecker:
             status_class = f"status-{table_result.get('status', 'unknown').lower()}"
             issues = ', '.join(table_result.get('errors', []) + table_result.get('warnings', []))
             
-            html += f"""
+            yield f"""
             <tr>
                 <td>{table_name}</td>
                 <td class="{status_class}">{table_result.get('status', 'UNKNOWN')}</td>
-                <td>{table_result.get('row_count', 0):,}</td>
-                <td>{table_result.get('size_bytes', 0):,}</td>
+                <td>{_int_fmt(table_result.get('row_count', 0))}</td>
+                <td>{_int_fmt(table_result.get('size_bytes', 0))}</td>
                 <td>{issues if issues else '없음'}</td>
             </tr>
 """
         
-        html += """
+        yield """
         </table>
     </div>
     
@@ -578,15 +917,17 @@ class DatabaseChecker:
         <h2>⚡ 성능 점검 결과</h2>
 """
         
+        performance_result = next(results)
+        
         if 'database_size' in performance_result:
             db_size_mb = performance_result['database_size'] / (1024 * 1024)
-            html += f"""
+            yield f"""
         <p>데이터베이스 크기: {db_size_mb:.2f} MB</p>
-        <p>페이지 수: {performance_result.get('page_count', 0):,}</p>
-        <p>페이지 크기: {performance_result.get('page_size', 0):,} 바이트</p>
+        <p>페이지 수: {_int_fmt(performance_result.get('page_count', 0))}</p>
+        <p>페이지 크기: {_int_fmt(performance_result.get('page_size', 0))} 바이트</p>
 """
         
-        html += """
+        yield """
         <h3>쿼리 성능</h3>
         <table class="table">
             <tr>
@@ -599,16 +940,18 @@ class DatabaseChecker:
         
         for table_name, perf_result in performance_result.get('query_performance', {}).items():
             status_class = f"status-{perf_result.get('status', 'unknown').lower()}"
-            html += f"""
+            query_time = perf_result.get('count_query_time', 0)
+            query_time_text = f"{query_time:.3f}초" if query_time is not None else '추정치 (sqlite_stat1)'
+            yield f"""
             <tr>
                 <td>{table_name}</td>
-                <td>{perf_result.get('row_count', 0):,}</td>
-                <td>{perf_result.get('count_query_time', 0):.3f}초</td>
+                <td>{_int_fmt(perf_result.get('row_count', 0))}</td>
+                <td>{query_time_text}</td>
                 <td class="{status_class}">{perf_result.get('status', 'UNKNOWN')}</td>
             </tr>
 """
         
-        html += """
+        yield """
         </table>
     </div>
     
@@ -616,20 +959,49 @@ class DatabaseChecker:
         <h2>📈 데이터 품질 점검 결과</h2>
 """
         
+        quality_result = next(results)
+        
         for table_name, quality_result_table in quality_result.get('data_consistency', {}).items():
-            html += f"""
+            yield f"""
         <h3>{table_name}</h3>
-        <p>전체 행 수: {quality_result_table.get('total_rows', 0):,}</p>
-        <p>중복 행 수: {quality_result_table.get('duplicate_rows', 0):,}</p>
+        <p>전체 행 수: {_int_fmt(quality_result_table.get('total_rows', 0))}</p>
+        <p>중복 행 수: {_int_fmt(quality_result_table.get('duplicate_rows', 0))}</p>
 """
             
             if quality_result_table.get('issues'):
-                html += '<ul>'
+                yield '<ul>'
                 for issue in quality_result_table['issues']:
-                    html += f'<li>{issue}</li>'
-                html += '</ul>'
+                    yield f'<li>{issue}</li>'
+                yield '</ul>'
         
-        html += """
+        symbol_ranges = quality_result.get('data_accuracy', {}).get('price_data', {}).get('symbol_ranges')
+        if symbol_ranges:
+            yield """
+        <h3>심볼별 가격 데이터 구간</h3>
+        <table class="table">
+            <tr>
+                <th>심볼</th>
+                <th>행 수</th>
+                <th>시작</th>
+                <th>끝</th>
+                <th>최대 공백 (초)</th>
+            </tr>
+"""
+            for symbol, entry in symbol_ranges.items():
+                yield f"""
+            <tr>
+                <td>{symbol}</td>
+                <td>{_int_fmt(entry['rows'])}</td>
+                <td>{entry['start']:%Y-%m-%d %H:%M}</td>
+                <td>{entry['end']:%Y-%m-%d %H:%M}</td>
+                <td>{_int_fmt(entry['max_gap_ms'] // 1000)}</td>
+            </tr>
+"""
+            yield """
+        </table>
+"""
+        
+        yield """
     </div>
     
     <div class="section">
@@ -650,35 +1022,33 @@ class DatabaseChecker:
         
         if recommendations:
             for rec in recommendations:
-                html += f'<div class="recommendation">💡 {rec}</div>'
+                yield f'<div class="recommendation">💡 {rec}</div>'
         else:
-            html += '<p>현재 특별한 권장사항이 없습니다.</p>'
+            yield '<p>현재 특별한 권장사항이 없습니다.</p>'
         
-        html += """
+        yield """
     </div>
 </body>
 </html>
 """
-        
-        return html
     
     def print_summary(self):
         """점검 결과 요약 출력"""
         try:
             self.logger.info("=== 데이터베이스 점검 요약 ===")
             
+            # 각종 점검 실행 (하나의 연결/트랜잭션 공유)
+            integrity_result, performance_result, quality_result = self.run_all_checks()
+            
             # 무결성 점검
-            integrity_result = self.check_database_integrity()
             print(f"🔍 무결성 상태: {integrity_result.get('overall_status', 'UNKNOWN')}")
             
             # 성능 점검
-            performance_result = self.check_database_performance()
             if 'database_size' in performance_result:
                 db_size_mb = performance_result['database_size'] / (1024 * 1024)
                 print(f"📊 데이터베이스 크기: {db_size_mb:.2f} MB")
             
             # 데이터 품질 점검
-            quality_result = self.check_data_quality()
             total_issues = len(quality_result.get('issues', []))
             print(f"📈 발견된 문제점: {total_issues}개")
             
@@ -698,11 +1068,17 @@ def main():
     parser.add_argument('--quality', action='store_true', help='데이터 품질 점검만 실행')
     parser.add_argument('--report', action='store_true', help='HTML 리포트 생성')
     parser.add_argument('--summary', action='store_true', help='요약 정보만 출력')
+    parser.add_argument('--analyze', action='store_true', help='점검 전에 ANALYZE 로 행 수 추정 통계(sqlite_stat1) 갱신')
+    parser.add_argument('--budget-sec', type=float, default=None, help='테이블별 NULL/중복 스캔 시간 예산 (초, 초과 시 TIMEOUT)')
+    parser.add_argument('--price-gaps', action='store_true', help='리포트에 심볼별 가격 데이터 구간/최대 공백 포함 (price_data 전체 스캔)')
     
     args = parser.parse_args()
     
     try:
-        checker = DatabaseChecker(args.db_path)
+        checker = DatabaseChecker(args.db_path, budget_sec=args.budget_sec, price_gaps=args.price_gaps)
+        
+        if args.analyze:
+            checker.analyze()
         
         if args.summary:
             checker.print_summary()
@@ -3,17 +3,59 @@
 과거 데이터 수집 중단/재개를 위한 진행 상황 관리
 """
 
+import atexit
+import functools
 import json
+import mmap
 import os
+import time
 import logging
 from datetime import datetime
 from typing import Dict, Any, Optional, List
 
+# orjson 사용 가능 시 진행 상황 직렬화 가속 (미설치 시 표준 json 사용)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
+# 진행 상황 저장 디바운스 - 변경이 이 건수만큼 쌓이거나 마지막 저장 후 이 시간이 지나면 파일에 기록
+FLUSH_EVERY_CHANGES = 16
+FLUSH_INTERVAL_SEC = 2.0
+
+# 이벤트 로그가 스냅샷의 이 배수보다 커지면 스냅샷을 새로 쓰고 로그를 비움
+LOG_COMPACT_RATIO = 4
+
+# 이 크기를 넘는 진행 상황 파일은 mmap 으로 읽어 파싱 (orjson 사용 시)
+PROGRESS_MMAP_MIN_BYTES = 64 * 1024
+
+@functools.lru_cache(maxsize=4)
+def _iso_to_dt(value: str) -> datetime:
+    """ISO 문자열 -> datetime (시작/마지막 성공 시각은 거의 바뀌지 않으므로 캐시)"""
+    return datetime.fromisoformat(value)
+
 class ProgressTracker:
     """진행 상황 추적 클래스"""
     
+    # 새 진행 상황 스키마 - (키, 기본값) 쌍, 호출 가능한 기본값은 매번 새 객체로 생성
+    _SCHEMA = (
+        ('total_coins', 50),
+        ('total_intervals', 16),
+        ('completed_coins', list),
+        ('current_coin', None),
+        ('current_coin_progress', dict),
+        ('completed_intervals', dict),
+        ('failed_coins', list),
+        ('failed_intervals', dict),
+        ('last_successful_time', None),
+        ('total_completed', 0),
+        ('total_failed', 0),
+    )
+    
     def __init__(self, progress_file: str = None):
         """진행 상황 추적기 초기화"""
         if progress_file is None:
@@ -23,164 +65,391 @@ class ProgressTracker:
         self.progress_file = progress_file
         self.logger = logging.getLogger(__name__)
         
-        # 진행 상황 로드
+        # 진행 상황/체크포인트/이벤트 로그는 모두 같은 디렉토리 - 시작 시 한 번만 생성
+        dir_path = os.path.dirname(progress_file)
+        if dir_path:
+            os.makedirs(dir_path, exist_ok=True)
+        
+        # 페이지 단위 체크포인트 파일 (진행 상황 파일과 같은 디렉토리)
+        self.checkpoint_file = os.path.splitext(progress_file)[0] + "_checkpoint.json"
+        
+        # 스냅샷 이후 상태 변경 이벤트 로그 (한 줄에 이벤트 하나, 추가 쓰기 전용)
+        self.log_file = os.path.splitext(progress_file)[0] + ".log"
+        self._log_fd = None
+        self._log_size = 0
+        self._snapshot_size = 0
+        self._seq = 0
+        
+        # 저장되지 않은 변경 추적 (디바운스 저장)
+        self._dirty = False
+        self._dirty_count = 0
+        self._last_flush = time.monotonic()
+        self._flush_interval = FLUSH_INTERVAL_SEC
+        
+        # 진행 상황 로드 (스냅샷 + 이벤트 로그 재적용)
         self.progress = self.load_progress()
+        self._index_progress()
+        self._seq = self.progress.pop('log_seq', 0)
+        self._replay_log()
+        self._open_log()
+        self.checkpoints = self.load_checkpoints()
+        
+        # 종료 시 남은 변경 저장
+        atexit.register(self.flush)
         
         self.logger.info("진행 상황 추적기 초기화 완료")
     
     def load_progress(self) -> Dict[str, Any]:
         """진행 상황 파일 로드"""
         try:
-            if os.path.exists(self.progress_file):
-                with open(self.progress_file, 'r', encoding='utf-8') as f:
-                    progress = json.load(f)
-                self.logger.info(f"진행 상황 파일 로드: {self.progress_file}")
-                return progress
-            else:
-                # 새로운 진행 상황 초기화
-                progress = {
-                    'start_time': datetime.now().isoformat(),
-                    'total_coins': 50,
-                    'total_intervals': 16,
-                    'completed_coins': [],
-                    'current_coin': None,
-                    'current_coin_progress': {},
-                    'completed_intervals': {},
-                    'failed_coins': [],
-                    'failed_intervals': {},
-                    'last_successful_time': None,
-                    'total_completed': 0,
-                    'total_failed': 0
-                }
-                self.save_progress(progress)
-                return progress
-                
+            # 존재 확인 없이 바로 열기 (없으면 FileNotFoundError 로 새 진행 상황 생성)
+            with open(self.progress_file, 'rb') as f:
+                if orjson is not None and os.fstat(f.fileno()).st_size > PROGRESS_MMAP_MIN_BYTES:
+                    # 큰 스냅샷은 읽기 버퍼로 복사하지 않고 매핑된 페이지에서 바로 파싱
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        progress = orjson.loads(view)
+                else:
+                    progress = json_loads(f.read())
+            self._migrate_progress(progress)
+            self.logger.info(f"진행 상황 파일 로드: {self.progress_file}")
+            return progress
+            
+        except FileNotFoundError:
+            # 새로운 진행 상황 초기화
+            progress = self._create_default_progress()
+            self.save_progress(progress)
+            
+            # 스냅샷 없이 남은 이벤트 로그는 이전 진행 상황이므로 재적용하지 않고 비움
+            try:
+                os.truncate(self.log_file, 0)
+            except FileNotFoundError:
+                pass
+            return progress
+            
         except Exception as e:
             self.logger.error(f"진행 상황 파일 로드 실패: {e}")
             return self._create_default_progress()
     
+    @staticmethod
+    def _migrate_progress(progress: Dict[str, Any]):
+        """이전 형식 진행 상황 변환 - 단일 진행 중 간격(current_interval)을 current_intervals 목록으로"""
+        coin_progress = progress.get('current_coin_progress') or {}
+        if 'current_interval' in coin_progress:
+            interval = coin_progress.pop('current_interval')
+            coin_progress.setdefault('current_intervals', [interval] if interval else [])
+    
     def _create_default_progress(self) -> Dict[str, Any]:
         """기본 진행 상황 생성"""
+        progress = {'start_time': datetime.now().isoformat()}
+        progress.update((key, default() if callable(default) else default) for key, default in self._SCHEMA)
+        return progress
+    
+    def _index_progress(self):
+        """완료/실패 코인과 간격 목록을 set 으로 옮겨 관리 (파일 저장 시에만 리스트로 변환)"""
+        self._completed_coins = set(self.progress.pop('completed_coins', []))
+        self._failed_coins = set(self.progress.pop('failed_coins', []))
+        self._completed_intervals = {symbol: set(intervals) for symbol, intervals in self.progress.pop('completed_intervals', {}).items()}
+        self._failed_intervals = {symbol: set(intervals) for symbol, intervals in self.progress.pop('failed_intervals', {}).items()}
+        
+        # 남은 간격 조회용 - 코인별 완료 또는 실패한 간격 (간격이 빠지는 경우가 없으므로 추가만 함)
+        self._done_intervals = {}
+        for intervals_map in (self._completed_intervals, self._failed_intervals):
+            for symbol, intervals in intervals_map.items():
+                self._done_intervals.setdefault(symbol, set()).update(intervals)
+        
+        # 요약용 완료/실패 간격 수 (이후 변경 시 증감으로 유지)
+        self._n_completed_intervals = sum(len(intervals) for intervals in self._completed_intervals.values())
+        self._n_failed_intervals = sum(len(intervals) for intervals in self._failed_intervals.values())
+    
+    @staticmethod
+    def _now() -> int:
+        """이벤트 시각 (ns 정수) - ISO 문자열 변환은 저장/조회 시점으로 미룸"""
+        return time.time_ns()
+    
+    @staticmethod
+    def _iso(value) -> Optional[str]:
+        """ns 정수 시각을 ISO 문자열로 변환 (파일에서 읽은 ISO 문자열과 None 은 그대로)"""
+        if isinstance(value, int):
+            return datetime.fromtimestamp(value / 1e9).isoformat()
+        return value
+    
+    def _progress_snapshot(self) -> Dict[str, Any]:
+        """파일 저장용 진행 상황 - set 으로 관리하는 목록을 정렬된 리스트로, ns 시각을 ISO 문자열로 변환"""
+        coin_progress = self.progress['current_coin_progress']
+        if 'start_time' in coin_progress:
+            coin_progress = {**coin_progress, 'start_time': self._iso(coin_progress['start_time'])}
         return {
-            'start_time': datetime.now().isoformat(),
-            'total_coins': 50,
-            'total_intervals': 16,
-            'completed_coins': [],
-            'current_coin': None,
-            'current_coin_progress': {},
-            'completed_intervals': {},
-            'failed_coins': [],
-            'failed_intervals': {},
-            'last_successful_time': None,
-            'total_completed': 0,
-            'total_failed': 0
+            **self.progress,
+            'current_coin_progress': coin_progress,
+            'last_successful_time': self._iso(self.progress['last_successful_time']),
+            'completed_coins': sorted(self._completed_coins),
+            'failed_coins': sorted(self._failed_coins),
+            'completed_intervals': {symbol: sorted(intervals) for symbol, intervals in self._completed_intervals.items()},
+            'failed_intervals': {symbol: sorted(intervals) for symbol, intervals in self._failed_intervals.items()},
+            'log_seq': self._seq
         }
     
-    def save_progress(self, progress: Dict[str, Any] = None):
-        """진행 상황 파일 저장"""
+    def save_progress(self, progress: Dict[str, Any] = None, sync: bool = False, pretty: bool = False):
+        """진행 상황 파일 저장 - 임시 파일에 쓴 뒤 원자적으로 교체 (sync=True 면 교체 전 fsync)
+        
+        orjson 이 있으면 들여쓰기 포함 바이트로 직렬화하고, 없으면 표준 json 으로 압축 직렬화
+        (pretty=True 일 때만 들여쓰기). 현재 상태 스냅샷을 저장하면 이벤트 로그를 비움
+        """
         try:
-            if progress is None:
-                progress = self.progress
+            snapshot = progress is None
+            if snapshot:
+                progress = self._progress_snapshot()
+            
+            if orjson is not None:
+                data = orjson.dumps(progress, option=orjson.OPT_INDENT_2)
+            elif pretty:
+                data = json.dumps(progress, indent=2, ensure_ascii=False).encode('utf-8')
+            else:
+                data = json.dumps(progress, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
             
-            # 디렉토리가 있는 경우에만 생성
-            dir_path = os.path.dirname(self.progress_file)
-            if dir_path:
-                os.makedirs(dir_path, exist_ok=True)
+            # 쓰는 도중 중단되어도 기존 파일이 손상되지 않도록 임시 파일 사용
+            tmp_file = self.progress_file + ".tmp"
+            fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, self.progress_file)
             
-            with open(self.progress_file, 'w', encoding='utf-8') as f:
-                json.dump(progress, f, indent=2, ensure_ascii=False)
+            # 스냅샷에 반영된 이벤트는 로그에서 제거 (log_seq 로 중복 적용 방지)
+            if snapshot and self._log_fd is not None:
+                os.ftruncate(self._log_fd, 0)
+                self._log_size = 0
+            self._snapshot_size = len(data)
             
-            self.logger.info(f"진행 상황 저장: {self.progress_file}")
+            self._dirty = False
+            self._dirty_count = 0
+            self._last_flush = time.monotonic()
+            
+            self.logger.debug("진행 상황 저장: %s", self.progress_file)
             
         except Exception as e:
             self.logger.error(f"진행 상황 파일 저장 실패: {e}")
     
+    def _open_log(self):
+        """이벤트 로그 파일을 추가 쓰기 모드로 열기"""
+        try:
+            self._log_fd = os.open(self.log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND | getattr(os, 'O_CLOEXEC', 0), 0o644)
+            self._log_size = os.fstat(self._log_fd).st_size
+        except Exception as e:
+            self.logger.error(f"진행 상황 로그 열기 실패: {e}")
+    
+    def _replay_log(self):
+        """스냅샷 이후 기록된 이벤트를 순서대로 다시 적용 (log_seq 이하 이벤트는 이미 반영됨)"""
+        try:
+            if not os.path.exists(self.log_file) or os.path.getsize(self.log_file) == 0:
+                return
+            
+            replayed = 0
+            with open(self.log_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                while True:
+                    end = mm.find(b'\n', start)
+                    if end < 0:
+                        break  # 마지막 줄이 기록 도중 끊긴 경우 무시
+                    
+                    try:
+                        event = json_loads(mm[start:end])
+                        if event['seq'] > self._seq:
+                            self._apply(event)
+                            self._seq = event['seq']
+                            replayed += 1
+                    except Exception as e:
+                        self.logger.warning(f"진행 상황 로그 이벤트 무시: {e}")
+                    start = end + 1
+            
+            if start < size:
+                # 끊긴 마지막 줄 제거 - 남겨 두면 다음 이벤트가 그 뒤에 이어 붙어 함께 깨짐
+                os.truncate(self.log_file, start)
+                self.logger.warning(f"진행 상황 로그의 끊긴 마지막 줄 제거: {size - start}바이트")
+            
+            if replayed:
+                self.logger.info(f"진행 상황 로그 재적용: {replayed}개 이벤트")
+                
+        except Exception as e:
+            self.logger.error(f"진행 상황 로그 재적용 실패: {e}")
+    
+    def _apply(self, event: Dict[str, Any]):
+        """상태 변경 이벤트를 메모리 상의 진행 상황에 적용"""
+        op = event['op']
+        symbol = event['sym']
+        
+        if op == 'start_coin':
+            self.progress['current_coin'] = symbol
+            self.progress['current_coin_progress'] = {
+                'start_time': event.get('ns', event.get('time')),
+                'completed_intervals': [],
+                'failed_intervals': [],
+                'current_intervals': []
+            }
+        elif op == 'complete_coin':
+            self._completed_coins.add(symbol)
+            self._failed_coins.discard(symbol)
+            self.progress['current_coin'] = None
+            self.progress['current_coin_progress'] = {}
+            self.progress['last_successful_time'] = event.get('ns', event.get('time'))
+            self.progress['total_completed'] += 1
+        elif op == 'fail_coin':
+            self._failed_coins.add(symbol)
+            self.progress['current_coin'] = None
+            self.progress['current_coin_progress'] = {}
+            self.progress['total_failed'] += 1
+        elif op == 'start_interval':
+            self._completed_intervals.setdefault(symbol, set())
+            # 한 코인의 간격들은 동시에 수집되므로 진행 중인 간격을 모두 기록
+            current_intervals = self.progress['current_coin_progress'].setdefault('current_intervals', [])
+            if event['iv'] not in current_intervals:
+                current_intervals.append(event['iv'])
+        elif op == 'complete_interval':
+            interval = event['iv']
+            completed = self._completed_intervals.setdefault(symbol, set())
+            if interval not in completed:
+                completed.add(interval)
+                self._n_completed_intervals += 1
+            failed = self._failed_intervals.get(symbol)
+            if failed and interval in failed:
+                failed.remove(interval)
+                self._n_failed_intervals -= 1
+            self._done_intervals.setdefault(symbol, set()).add(interval)
+            self.progress['current_coin_progress']['completed_intervals'].append(interval)
+            self._finish_interval(interval)
+        elif op == 'fail_interval':
+            interval = event['iv']
+            failed = self._failed_intervals.setdefault(symbol, set())
+            if interval not in failed:
+                failed.add(interval)
+                self._n_failed_intervals += 1
+            self._done_intervals.setdefault(symbol, set()).add(interval)
+            self.progress['current_coin_progress']['failed_intervals'].append(interval)
+            self._finish_interval(interval)
+        else:
+            raise ValueError(f"알 수 없는 진행 상황 이벤트: {op}")
+    
+    def _finish_interval(self, interval: str):
+        """완료/실패한 간격을 진행 중 목록에서 제거 (다른 간격은 계속 진행 중)"""
+        current_intervals = self.progress['current_coin_progress'].get('current_intervals')
+        if current_intervals and interval in current_intervals:
+            current_intervals.remove(interval)
+    
+    def _record(self, op: str, symbol: str, **fields):
+        """이벤트를 메모리 상태에 적용하고 로그에 한 줄로 추가"""
+        event = {'seq': self._seq + 1, 'op': op, 'sym': symbol, **fields}
+        self._apply(event)
+        self._seq = event['seq']
+        
+        if self._log_fd is not None:
+            try:
+                line = json.dumps(event, separators=(',', ':'), ensure_ascii=False).encode('utf-8') + b'\n'
+                os.write(self._log_fd, line)
+                self._log_size += len(line)
+            except Exception as e:
+                self.logger.error(f"진행 상황 로그 기록 실패: {e}")
+    
+    def _mark_dirty(self):
+        """메모리 상의 진행 상황 변경 표시 - 실제 저장은 디바운스"""
+        self._dirty = True
+        self._dirty_count += 1
+        self._maybe_flush()
+    
+    def _maybe_flush(self):
+        """변경이 충분히 쌓였거나 저장 주기가 지났거나 로그가 커졌을 때만 스냅샷 저장"""
+        if (self._dirty_count >= FLUSH_EVERY_CHANGES
+                or time.monotonic() - self._last_flush >= self._flush_interval
+                or self._log_size > LOG_COMPACT_RATIO * self._snapshot_size):
+            self.save_progress()
+    
+    def flush(self):
+        """저장되지 않은 변경이 있으면 즉시 저장"""
+        if self._dirty:
+            self.save_progress()
+    
+    def load_checkpoints(self) -> Dict[str, int]:
+        """체크포인트 파일 로드 ({심볼_간격: 마지막 저장 캔들 타임스탬프})"""
+        try:
+            if os.path.exists(self.checkpoint_file):
+                with open(self.checkpoint_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+        except Exception as e:
+            self.logger.error(f"체크포인트 파일 로드 실패: {e}")
+        
+        return {}
+    
+    def _save_checkpoints(self):
+        """체크포인트 파일 저장 - 임시 파일에 쓴 뒤 원자적으로 교체"""
+        try:
+            tmp_file = self.checkpoint_file + ".tmp"
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(self.checkpoints, f)
+            os.replace(tmp_file, self.checkpoint_file)
+            
+        except Exception as e:
+            self.logger.error(f"체크포인트 파일 저장 실패: {e}")
+    
+    def checkpoint(self, symbol: str, interval: str, last_timestamp: int):
+        """페이지 저장 완료 시점의 마지막 캔들 타임스탬프 기록"""
+        self.checkpoints[f"{symbol}_{interval}"] = last_timestamp
+        self._save_checkpoints()
+    
+    def get_checkpoint(self, symbol: str, interval: str) -> Optional[int]:
+        """마지막으로 저장된 캔들 타임스탬프 조회"""
+        return self.checkpoints.get(f"{symbol}_{interval}")
+    
     def start_coin_collection(self, symbol: str):
         """코인 수집 시작"""
-        self.progress['current_coin'] = symbol
-        self.progress['current_coin_progress'] = {
-            'start_time': datetime.now().isoformat(),
-            'completed_intervals': [],
-            'failed_intervals': [],
-            'current_interval': None
-        }
-        self.save_progress()
+        self._record('start_coin', symbol, ns=self._now())
+        self._mark_dirty()
         self.logger.info(f"코인 수집 시작: {symbol}")
     
     def complete_coin_collection(self, symbol: str):
         """코인 수집 완료"""
-        if symbol not in self.progress['completed_coins']:
-            self.progress['completed_coins'].append(symbol)
-        
-        if symbol in self.progress['failed_coins']:
-            self.progress['failed_coins'].remove(symbol)
-        
-        self.progress['current_coin'] = None
-        self.progress['current_coin_progress'] = {}
-        self.progress['last_successful_time'] = datetime.now().isoformat()
-        self.progress['total_completed'] += 1
+        self._record('complete_coin', symbol, ns=self._now())
         
-        self.save_progress()
+        # 코인 경계는 재개 지점이므로 즉시 디스크까지 저장
+        self.save_progress(sync=True)
         self.logger.info(f"코인 수집 완료: {symbol}")
     
     def fail_coin_collection(self, symbol: str, error: str):
         """코인 수집 실패"""
-        if symbol not in self.progress['failed_coins']:
-            self.progress['failed_coins'].append(symbol)
+        self._record('fail_coin', symbol)
         
-        self.progress['current_coin'] = None
-        self.progress['current_coin_progress'] = {}
-        self.progress['total_failed'] += 1
-        
-        self.save_progress()
+        # 코인 경계는 재개 지점이므로 즉시 디스크까지 저장
+        self.save_progress(sync=True)
         self.logger.error(f"코인 수집 실패: {symbol} - {error}")
     
     def start_interval_collection(self, symbol: str, interval: str):
         """간격 수집 시작"""
-        if symbol not in self.progress['completed_intervals']:
-            self.progress['completed_intervals'][symbol] = []
-        
-        self.progress['current_coin_progress']['current_interval'] = interval
-        self.save_progress()
-        self.logger.info(f"간격 수집 시작: {symbol} {interval}")
+        self._record('start_interval', symbol, iv=interval)
+        self._mark_dirty()
+        # 간격 단위 이벤트는 수가 많으므로 DEBUG + 지연 포맷 (INFO 는 코인 경계에서만)
+        self.logger.debug("간격 수집 시작: %s %s", symbol, interval)
     
     def complete_interval_collection(self, symbol: str, interval: str):
         """간격 수집 완료"""
-        if symbol not in self.progress['completed_intervals']:
-            self.progress['completed_intervals'][symbol] = []
-        
-        if interval not in self.progress['completed_intervals'][symbol]:
-            self.progress['completed_intervals'][symbol].append(interval)
-        
-        if symbol in self.progress['failed_intervals'] and interval in self.progress['failed_intervals'][symbol]:
-            self.progress['failed_intervals'][symbol].remove(interval)
+        self._record('complete_interval', symbol, iv=interval)
+        self._mark_dirty()
         
-        self.progress['current_coin_progress']['completed_intervals'].append(interval)
-        self.progress['current_coin_progress']['current_interval'] = None
+        # 완료된 간격은 더 이상 재개 지점이 필요 없음
+        if self.checkpoints.pop(f"{symbol}_{interval}", None) is not None:
+            self._save_checkpoints()
         
-        self.save_progress()
-        self.logger.info(f"간격 수집 완료: {symbol} {interval}")
+        self.logger.debug("간격 수집 완료: %s %s", symbol, interval)
     
     def fail_interval_collection(self, symbol: str, interval: str, error: str):
         """간격 수집 실패"""
-        if symbol not in self.progress['failed_intervals']:
-            self.progress['failed_intervals'][symbol] = []
-        
-        if interval not in self.progress['failed_intervals'][symbol]:
-            self.progress['failed_intervals'][symbol].append(interval)
-        
-        self.progress['current_coin_progress']['failed_intervals'].append(interval)
-        self.progress['current_coin_progress']['current_interval'] = None
-        
-        self.save_progress()
+        self._record('fail_interval', symbol, iv=interval)
+        self._mark_dirty()
         self.logger.error(f"간격 수집 실패: {symbol} {interval} - {error}")
     
     def get_remaining_coins(self, all_coins: List[str]) -> List[str]:
         """남은 코인 목록 조회"""
-        completed = set(self.progress['completed_coins'])
-        failed = set(self.progress['failed_coins'])
-        
-        remaining = [coin for coin in all_coins if coin not in completed and coin not in failed]
+        remaining = [coin for coin in all_coins if coin not in self._completed_coins and coin not in self._failed_coins]
         
         # 현재 진행 중인 코인이 있으면 추가
         if self.progress['current_coin'] and self.progress['current_coin'] not in remaining:
@@ -190,27 +459,29 @@ class ProgressTracker:
     
     def get_remaining_intervals(self, symbol: str, all_intervals: List[str]) -> List[str]:
         """남은 간격 목록 조회"""
-        completed = set(self.progress['completed_intervals'].get(symbol, []))
-        failed = set(self.progress['failed_intervals'].get(symbol, []))
+        done = self._done_intervals.get(symbol, ())
         
-        remaining = [interval for interval in all_intervals if interval not in completed and interval not in failed]
+        # 중단 당시 진행 중이던 간격을 먼저, 나머지는 원래 순서대로
+        current_intervals = [interval for interval in self._current_intervals(symbol) if interval not in done]
+        remaining = [interval for interval in all_intervals if interval not in done and interval not in current_intervals]
         
-        # 현재 진행 중인 간격이 있으면 추가
-        current_interval = self.progress['current_coin_progress'].get('current_interval')
-        if current_interval and current_interval not in remaining:
-            remaining.insert(0, current_interval)
-        
-        return remaining
+        return current_intervals + remaining
+    
+    def _current_intervals(self, symbol: str = None) -> List[str]:
+        """진행 중인 간격 목록 (symbol 을 주면 그 코인이 현재 코인일 때만)"""
+        if symbol is not None and symbol != self.progress['current_coin']:
+            return []
+        return list(self.progress['current_coin_progress'].get('current_intervals', []))
     
     def get_progress_summary(self) -> Dict[str, Any]:
         """진행 상황 요약"""
         total_coins = self.progress['total_coins']
         total_intervals = self.progress['total_intervals']
-        completed_coins = len(self.progress['completed_coins'])
-        failed_coins = len(self.progress['failed_coins'])
+        completed_coins = len(self._completed_coins)
+        failed_coins = len(self._failed_coins)
         
-        total_completed_intervals = sum(len(intervals) for intervals in self.progress['completed_intervals'].values())
-        total_failed_intervals = sum(len(intervals) for intervals in self.progress['failed_intervals'].values())
+        total_completed_intervals = self._n_completed_intervals
+        total_failed_intervals = self._n_failed_intervals
         
         coin_progress = (completed_coins / total_coins) * 100 if total_coins > 0 else 0
         interval_progress = (total_completed_intervals / (total_coins * total_intervals)) * 100 if total_coins * total_intervals > 0 else 0
@@ -223,9 +494,9 @@ class ProgressTracker:
             'total_completed_intervals': total_completed_intervals,
             'total_failed_intervals': total_failed_intervals,
             'current_coin': self.progress['current_coin'],
-            'current_interval': self.progress['current_coin_progress'].get('current_interval'),
+            'current_intervals': self._current_intervals(),
             'start_time': self.progress['start_time'],
-            'last_successful_time': self.progress['last_successful_time']
+            'last_successful_time': self._iso(self.progress['last_successful_time'])
         }
     
     def print_progress_summary(self):
@@ -244,15 +515,15 @@ class ProgressTracker:
         
         if summary['current_coin']:
             print(f"현재 진행 중: {summary['current_coin']}")
-            if summary['current_interval']:
-                print(f"현재 간격: {summary['current_interval']}")
+            if summary['current_intervals']:
+                print(f"현재 간격: {', '.join(summary['current_intervals'])}")
         
         if summary['start_time']:
-            start_time = datetime.fromisoformat(summary['start_time'])
+            start_time = _iso_to_dt(summary['start_time'])
             print(f"시작 시간: {start_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         if summary['last_successful_time']:
-            last_time = datetime.fromisoformat(summary['last_successful_time'])
+            last_time = _iso_to_dt(summary['last_successful_time'])
             print(f"마지막 성공: {last_time.strftime('%Y-%m-%d %H:%M:%S')}")
         
         print("="*60)
@@ -260,12 +531,19 @@ class ProgressTracker:
     def reset_progress(self):
         """진행 상황 초기화"""
         self.progress = self._create_default_progress()
-        self.save_progress()
+        self._index_progress()
+        self.save_progress(sync=True)
+        self.checkpoints = {}
+        self._save_checkpoints()
         self.logger.info("진행 상황 초기화 완료")
     
     def cleanup_progress_file(self):
-        """진행 상황 파일 삭제"""
+        """진행 상황 파일 삭제 (이벤트 로그 포함)"""
         try:
+            if self._log_fd is not None:
+                os.ftruncate(self._log_fd, 0)
+                self._log_size = 0
+            
             if os.path.exists(self.progress_file):
                 os.remove(self.progress_file)
                 self.logger.info(f"진행 상황 파일 삭제: {self.progress_file}")
@@ -44,13 +44,12 @@ def setup_completed_progress():
             "completed_intervals": {}
         }
     
-    # 완료된 코인들을 진행 상황에 추가
+    # 완료된 코인들을 진행 상황에 추가 (기존 목록과 합집합)
+    progress["completed_coins"] = sorted(set(progress["completed_coins"]) | set(completed_coins))
+    
+    # 모든 간격을 완료된 것으로 표시 - 저장 직전까지 수정하지 않으므로 코인 간 같은 리스트를 공유
     for coin in completed_coins:
-        if coin not in progress["completed_coins"]:
-            progress["completed_coins"].append(coin)
-        
-        # 모든 간격을 완료된 것으로 표시
-        progress["completed_intervals"][coin] = all_intervals.copy()
+        progress["completed_intervals"][coin] = all_intervals
     
     # 진행 상황 저장
     with open(progress_file, 'w', encoding='utf-8') as f:
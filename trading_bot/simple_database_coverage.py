@@ -27,103 +27,107 @@ def test_database_coverage():
         conn = database.connect()
         conn.close()
         
-        # 잘못된 데이터로 저장 테스트 (오류 처리 커버리지)
-        invalid_data = {
-            'timestamp': 'invalid_timestamp',
-            'open': 'invalid_open',
-            'high': 'invalid_high',
-            'low': 'invalid_low',
-            'close': 'invalid_close',
-            'volume': 'invalid_volume'
-        }
-        
-        # 오류가 발생해도 예외가 전파되지 않아야 함
-        database.save_price_data('BTCUSDT', invalid_data)
-        
-        # 빈 데이터로 저장 테스트
-        empty_data = []
-        database.save_price_data_to_table('BTCUSDT', empty_data, 'test_table')
-        database.save_price_data_to_coin_table('BTCUSDT', '1m', empty_data)
-        
-        # 잘못된 데이터로 다른 저장 함수들 테스트
-        database.save_sentiment_data('invalid_source', 'invalid_headline', 'invalid_score', 'invalid_keywords', 'invalid_timestamp')
-        database.save_realtime_data('BTCUSDT', 'invalid_price', 'invalid_volume', 'invalid_timestamp')
-        database.save_trade('BTCUSDT', 'invalid_side', 'invalid_quantity', 'invalid_price', 'invalid_timestamp', 'invalid_status')
-        
-        # 조회 함수들 테스트
-        result = database.get_price_data('INVALID_SYMBOL', 1000000, 2000000)
-        result = database.get_trades(symbol='INVALID_SYMBOL')
-        result = database.get_trades(limit=0)
-        result = database.get_last_collected_timestamp('INVALID_SYMBOL', 'invalid_interval')
-        result = database.get_missing_data_period('INVALID_SYMBOL', 'invalid_interval')
-        
-        # 추가 커버리지 테스트
-        # 정상적인 데이터로 저장 테스트
-        valid_data = {
-            'timestamp': 1000000,
-            'open': 50000.0,
-            'high': 51000.0,
-            'low': 49000.0,
-            'close': 50500.0,
-            'volume': 1000.0
-        }
-        database.save_price_data('BTCUSDT', valid_data)
-        
-        # 정상적인 데이터로 코인 테이블 저장 테스트
-        valid_data_list = [valid_data]
-        database.save_price_data_to_coin_table('BTCUSDT', '1m', valid_data_list)
-        
-        # 정상적인 데이터로 다른 저장 함수들 테스트
-        database.save_sentiment_data('test_source', 'test_headline', 0.5, 'bitcoin,positive', 1000000)
-        database.save_realtime_data('BTCUSDT', 50000.0, 1000.0, 1000000)
-        database.save_trade('BTCUSDT', 'buy', 1.0, 50000.0, 1000000, 'completed')
-        
-        # 정상적인 조회 테스트
-        result = database.get_price_data('BTCUSDT', 1000000, 2000000)
-        result = database.get_trades(symbol='BTCUSDT')
-        result = database.get_trades(limit=10)
-        result = database.get_last_collected_timestamp('BTCUSDT', '1m')
-        result = database.get_missing_data_period('BTCUSDT', '1m')
-        
-        # 추가 커버리지 테스트 - 여러 데이터 저장
-        for i in range(5):
-            data = {
-                'timestamp': 1000000 + i,
-                'open': 50000.0 + i,
-                'high': 51000.0 + i,
-                'low': 49000.0 + i,
-                'close': 50500.0 + i,
-                'volume': 1000.0 + i
+        # 이후 저장/조회는 연결 하나를 재사용
+        with database.session():
+            # 잘못된 데이터로 저장 테스트 (오류 처리 커버리지)
+            invalid_data = {
+                'timestamp': 'invalid_timestamp',
+                'open': 'invalid_open',
+                'high': 'invalid_high',
+                'low': 'invalid_low',
+                'close': 'invalid_close',
+                'volume': 'invalid_volume'
             }
-            database.save_price_data(f'COIN{i}USDT', data)
-            database.save_sentiment_data(f'source{i}', f'headline{i}', 0.1 * i, f'keyword{i}', 1000000 + i)
-            database.save_realtime_data(f'COIN{i}USDT', 50000.0 + i, 1000.0 + i, 1000000 + i)
-            database.save_trade(f'COIN{i}USDT', 'buy' if i % 2 == 0 else 'sell', 1.0 + i, 50000.0 + i, 1000000 + i, 'completed')
-        
-        # 여러 코인 테이블에 데이터 저장
-        for coin in ['ETHUSDT', 'SOLUSDT', 'XRPUSDT']:
-            for interval in ['1m', '3m', '5m']:
-                data_list = [{
-                    'timestamp': 1000000,
-                    'open': 50000.0,
-                    'high': 51000.0,
-                    'low': 49000.0,
-                    'close': 50500.0,
-                    'volume': 1000.0
-                }]
-                database.save_price_data_to_coin_table(coin, interval, data_list)
-        
-        # 데이터베이스 정보 재조회
-        info = database.get_database_info()
-        print(f"Updated database info: {info}")
-        
-        # 추가 조회 테스트
-        for i in range(5):
-            result = database.get_price_data(f'COIN{i}USDT', 1000000, 2000000)
-            result = database.get_trades(symbol=f'COIN{i}USDT')
-            result = database.get_last_collected_timestamp(f'COIN{i}USDT', '1m')
-            result = database.get_missing_data_period(f'COIN{i}USDT', '1m')
-        
+            
+            # 오류가 발생해도 예외가 전파되지 않아야 함
+            database.save_price_data('BTCUSDT', invalid_data)
+            
+            # 빈 데이터로 저장 테스트
+            empty_data = []
+            database.save_price_data_to_table('BTCUSDT', empty_data, 'test_table')
+            database.save_price_data_to_coin_table('BTCUSDT', '1m', empty_data)
+            
+            # 잘못된 데이터로 다른 저장 함수들 테스트
+            database.save_sentiment_data('invalid_source', 'invalid_headline', 'invalid_score', 'invalid_keywords', 'invalid_timestamp')
+            database.save_realtime_data('BTCUSDT', 'invalid_price', 'invalid_volume', 'invalid_timestamp')
+            database.save_trade('BTCUSDT', 'invalid_side', 'invalid_quantity', 'invalid_price', 'invalid_timestamp', 'invalid_status')
+            
+            # 조회 함수들 테스트
+            result = database.get_price_data('INVALID_SYMBOL', 1000000, 2000000)
+            result = database.get_trades(symbol='INVALID_SYMBOL')
+            result = database.get_trades(limit=0)
+            result = database.get_last_collected_timestamp('INVALID_SYMBOL', 'invalid_interval')
+            result = database.get_missing_data_period('INVALID_SYMBOL', 'invalid_interval')
+            
+            # 추가 커버리지 테스트
+            # 정상적인 데이터로 저장 테스트
+            valid_data = {
+                'timestamp': 1000000,
+                'open': 50000.0,
+                'high': 51000.0,
+                'low': 49000.0,
+                'close': 50500.0,
+                'volume': 1000.0
+            }
+            database.save_price_data('BTCUSDT', valid_data)
+            
+            # 정상적인 데이터로 코인 테이블 저장 테스트
+            valid_data_list = [valid_data]
+            database.save_price_data_to_coin_table('BTCUSDT', '1m', valid_data_list)
+            
+            # 정상적인 데이터로 다른 저장 함수들 테스트
+            database.save_sentiment_data('test_source', 'test_headline', 0.5, 'bitcoin,positive', 1000000)
+            database.save_realtime_data('BTCUSDT', 50000.0, 1000.0, 1000000)
+            database.save_trade('BTCUSDT', 'buy', 1.0, 50000.0, 1000000, 'completed')
+            
+            # 정상적인 조회 테스트
+            result = database.get_price_data('BTCUSDT', 1000000, 2000000)
+            result = database.get_trades(symbol='BTCUSDT')
+            result = database.get_trades(limit=10)
+            result = database.get_last_collected_timestamp('BTCUSDT', '1m')
+            result = database.get_missing_data_period('BTCUSDT', '1m')
+            
+            # 추가 커버리지 테스트 - 여러 데이터 저장
+            # 반복 저장은 하나의 연결/트랜잭션으로 묶어 커밋 횟수를 줄임
+            with database.bulk():
+                for i in range(5):
+                    data = {
+                        'timestamp': 1000000 + i,
+                        'open': 50000.0 + i,
+                        'high': 51000.0 + i,
+                        'low': 49000.0 + i,
+                        'close': 50500.0 + i,
+                        'volume': 1000.0 + i
+                    }
+                    database.save_price_data(f'COIN{i}USDT', data)
+                    database.save_sentiment_data(f'source{i}', f'headline{i}', 0.1 * i, f'keyword{i}', 1000000 + i)
+                    database.save_realtime_data(f'COIN{i}USDT', 50000.0 + i, 1000.0 + i, 1000000 + i)
+                    database.save_trade(f'COIN{i}USDT', 'buy' if i % 2 == 0 else 'sell', 1.0 + i, 50000.0 + i, 1000000 + i, 'completed')
+                
+                # 여러 코인 테이블에 데이터 저장
+                for coin in ['ETHUSDT', 'SOLUSDT', 'XRPUSDT']:
+                    for interval in ['1m', '3m', '5m']:
+                        data_list = [{
+                            'timestamp': 1000000,
+                            'open': 50000.0,
+                            'high': 51000.0,
+                            'low': 49000.0,
+                            'close': 50500.0,
+                            'volume': 1000.0
+                        }]
+                        database.save_price_data_to_coin_table(coin, interval, data_list)
+            
+            # 데이터베이스 정보 재조회
+            info = database.get_database_info()
+            print(f"Updated database info: {info}")
+            
+            # 추가 조회 테스트
+            for i in range(5):
+                result = database.get_price_data(f'COIN{i}USDT', 1000000, 2000000)
+                result = database.get_trades(symbol=f'COIN{i}USDT')
+                result = database.get_last_collected_timestamp(f'COIN{i}USDT', '1m')
+                result = database.get_missing_data_period(f'COIN{i}USDT', '1m')
+            
         # 예외 처리 커버리지 테스트 - 데이터베이스 파일 손상
         try:
             # 데이터베이스 파일을 삭제하여 예외 발생
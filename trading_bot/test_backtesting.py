@@ -6,6 +6,8 @@
 import sys
 import os
 import logging
+import logging.handlers
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime, timedelta
 from typing import Dict, Any
 
@@ -15,18 +17,30 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 from backtesting.engine import BacktestEngine
 from config.coins_config import CoinsConfig
 
-# 로깅 설정
+# 로깅 설정 - 파일 로그는 메모리에 모았다가 한 번에 기록 (ERROR 이상은 즉시 기록)
+file_handler = logging.FileHandler('logs/backtesting_test.log', delay=True)
+memory_handler = logging.handlers.MemoryHandler(capacity=1024, flushLevel=logging.ERROR, target=file_handler)
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
     handlers=[
-        logging.FileHandler('logs/backtesting_test.log'),
+        memory_handler,
         logging.StreamHandler()
     ]
 )
 
 logger = logging.getLogger(__name__)
 
+def _run_one(config: Dict[str, Any], symbol: str, start_date: str, end_date: str,
+             strategy: str) -> Dict[str, Any]:
+    """워커 프로세스에서 단일 코인 백테스팅 실행 (엔진/DB 핸들은 워커 안에서 생성)"""
+    try:
+        engine = BacktestEngine(config)
+        return engine.run_backtest(symbol, start_date, end_date, strategy)
+    finally:
+        # 워커는 종료 시 로깅 정리 없이 끝나므로 모아 둔 로그를 작업마다 기록
+        memory_handler.flush()
+
 def test_backtesting():
     """백테스팅 시스템 테스트"""
     print("=== Phase 3 백테스팅 시스템 테스트 ===")
@@ -90,14 +104,34 @@ def test_backtesting():
         print("=== 다중 코인 백테스팅 테스트 (상위 10개) ===")
         top_symbols = symbols[:10]  # 상위 10개만 테스트
         
-        multi_result = engine.run_multi_backtest(
-            symbols=top_symbols,
-            start_date=start_date.strftime('%Y-%m-%d'),
-            end_date=end_date.strftime('%Y-%m-%d'),
-            strategy='integrated'
-        )
+        # 코인별 백테스트는 서로 독립적이므로 프로세스 풀로 병렬 실행
+        start_str = start_date.strftime('%Y-%m-%d')
+        end_str = end_date.strftime('%Y-%m-%d')
+        all_results = {}
+        if top_symbols:
+            max_workers = min(len(top_symbols), os.cpu_count() or 1)
+            # 워커가 기록되지 않은 로그 버퍼를 복제해 중복 기록하지 않도록 풀 생성 전에 비움
+            memory_handler.flush()
+            with ProcessPoolExecutor(max_workers=max_workers) as ex:
+                futures = {
+                    ex.submit(_run_one, config, sym, start_str, end_str, 'integrated'): sym
+                    for sym in top_symbols
+                }
+                for future in as_completed(futures):
+                    sym = futures[future]
+                    try:
+                        all_results[sym] = future.result()
+                    except Exception as e:
+                        all_results[sym] = {'error': str(e)}
+        
+        # 출력 순서는 코인 목록 순서로 유지
+        all_results = {sym: all_results[sym] for sym in top_symbols}
+        multi_result = {
+            'individual_results': all_results,
+            'portfolio_results': engine._calculate_portfolio_performance(all_results)
+        }
         
-        if 'portfolio_results' in multi_result:
+        if 'num_coins' in multi_result['portfolio_results']:
             portfolio = multi_result['portfolio_results']
             print(f"포트폴리오 백테스팅 결과:")
             print(f"- 테스트 코인 수: {portfolio['num_coins']}개")
@@ -119,6 +153,8 @@ def test_backtesting():
     except Exception as e:
         logger.error(f"백테스팅 테스트 실패: {e}")
         print(f"테스트 실패: {e}")
+    finally:
+        memory_handler.flush()
 
 def test_strategy_comparison():
     """전략 비교 테스트"""
@@ -144,11 +180,17 @@ def test_strategy_comparison():
         print(f"전략 비교 테스트 (BTCUSDT, 1개월):")
         print()
         
+        # 같은 기간 데이터는 한 번만 로드해 모든 전략에서 재사용
+        data = engine.prepare_data(
+            'BTCUSDT',
+            start_date.strftime('%Y-%m-%d'),
+            end_date.strftime('%Y-%m-%d')
+        )
+        
         for strategy in strategies:
             result = engine.run_backtest(
                 symbol='BTCUSDT',
-                start_date=start_date.strftime('%Y-%m-%d'),
-                end_date=end_date.strftime('%Y-%m-%d'),
+                data=data,
                 strategy=strategy
             )
             
@@ -168,6 +210,8 @@ def test_strategy_comparison():
     except Exception as e:
         logger.error(f"전략 비교 테스트 실패: {e}")
         print(f"전략 비교 테스트 실패: {e}")
+    finally:
+        memory_handler.flush()
 
 if __name__ == "__main__":
     # 로그 디렉토리 생성
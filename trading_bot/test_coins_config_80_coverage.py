@@ -3,15 +3,43 @@
 CoinsConfig 클래스 80% 커버리지 테스트
 """
 
+import io
 import os
 import sys
 import json
 import pytest
-from unittest.mock import patch, mock_open
+from config.coins_config import CoinsConfig
+
+# 설정 모듈만 다루는 빠른 단위 테스트 묶음 (pytest -m config_fast)
+pytestmark = pytest.mark.config_fast
+
+# 여러 테스트가 공유하는 5개 코인 데이터 (변경이 필요하면 list(COINS_5) 로 복사해서 사용)
+COINS_5 = ("BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT")
+TEST_DATA_5 = {"coins": list(COINS_5)}
+
+def _stub_loader(monkeypatch, test_data):
+    """CoinsConfig 의 파일 읽기를 test_data 반환으로 대체 (mock_open 없이 호출 지점의 open/json.load 만 교체)"""
+    monkeypatch.setattr("config.coins_config.open", lambda *args, **kwargs: io.StringIO(), raising=False)
+    monkeypatch.setattr("config.coins_config.json.load", lambda f: test_data)
+
+def _stub_open_error(monkeypatch, error):
+    """CoinsConfig 모듈의 open 호출이 error 를 발생시키도록 교체 (pytest 자신의 파일 입출력은 그대로)"""
+    def _raise(*args, **kwargs):
+        raise error
+    monkeypatch.setattr("config.coins_config.open", _raise, raising=False)
+
+@pytest.fixture(scope="module")
+def coins_cfg():
+    """5개 코인이 로드된 CoinsConfig (조회만 하는 테스트들이 공유)"""
+    # 패치는 생성 시점에만 적용 (모듈의 다른 테스트로 새지 않도록 반환 전에 해제)
+    with pytest.MonkeyPatch.context() as mp:
+        _stub_loader(mp, TEST_DATA_5)
+        coins_config = CoinsConfig()
+    
+    return coins_config
 
 def test_coins_config_init():
     """CoinsConfig 초기화 테스트"""
-    from config.coins_config import CoinsConfig
     
     coins_config = CoinsConfig()
     assert coins_config is not None
@@ -19,41 +47,38 @@ def test_coins_config_init():
     assert hasattr(coins_config, 'config_file')
     assert coins_config.config_file == "selected_coins.json"
 
-def test_load_selected_coins_success():
+def test_load_selected_coins_success(monkeypatch):
     """선택된 코인 로드 성공 테스트"""
-    from config.coins_config import CoinsConfig
     
-    test_data = {
-        "coins": ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    }
+    _stub_loader(monkeypatch, TEST_DATA_5)
     
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            assert len(coins_config.coins) == 5
-            assert "BTCUSDT" in coins_config.coins
-            assert "ETHUSDT" in coins_config.coins
+    coins_config = CoinsConfig()
+    assert len(coins_config.coins) == 5
+    assert "BTCUSDT" in coins_config.coins
+    assert "ETHUSDT" in coins_config.coins
 
-def test_load_selected_coins_file_not_found():
+def test_load_selected_coins_file_not_found(monkeypatch):
     """파일 없음 테스트"""
-    from config.coins_config import CoinsConfig
     
-    with patch("builtins.open", side_effect=FileNotFoundError("File not found")):
-        coins_config = CoinsConfig()
-        assert coins_config.coins == []
+    _stub_open_error(monkeypatch, FileNotFoundError("File not found"))
+    
+    coins_config = CoinsConfig()
+    assert coins_config.coins == []
 
-def test_load_selected_coins_json_error():
+def test_load_selected_coins_json_error(monkeypatch):
     """JSON 파싱 오류 테스트"""
-    from config.coins_config import CoinsConfig
     
-    with patch("builtins.open", mock_open(read_data="invalid json")):
-        with patch("json.load", side_effect=json.JSONDecodeError("Invalid JSON", "", 0)):
-            coins_config = CoinsConfig()
-            assert coins_config.coins == []
+    def _raise_decode_error(f):
+        raise json.JSONDecodeError("Invalid JSON", "", 0)
+    
+    _stub_loader(monkeypatch, None)
+    monkeypatch.setattr("config.coins_config.json.load", _raise_decode_error)
+    
+    coins_config = CoinsConfig()
+    assert coins_config.coins == []
 
-def test_get_coin_details():
+def test_get_coin_details(monkeypatch):
     """코인 상세 정보 조회 테스트"""
-    from config.coins_config import CoinsConfig
     
     test_data = {
         "coins": ["BTCUSDT", "ETHUSDT"],
@@ -63,114 +88,75 @@ def test_get_coin_details():
         ]
     }
     
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            details = coins_config.get_coin_details()
-            assert len(details) == 2
-            assert details[0]["symbol"] == "BTCUSDT"
-            assert details[1]["symbol"] == "ETHUSDT"
+    _stub_loader(monkeypatch, test_data)
+    
+    coins_config = CoinsConfig()
+    details = coins_config.get_coin_details()
+    assert len(details) == 2
+    assert details[0]["symbol"] == "BTCUSDT"
+    assert details[1]["symbol"] == "ETHUSDT"
 
-def test_get_coin_details_error():
+def test_get_coin_details_error(monkeypatch):
     """코인 상세 정보 조회 오류 테스트"""
-    from config.coins_config import CoinsConfig
     
-    with patch("builtins.open", side_effect=Exception("Test error")):
-        coins_config = CoinsConfig()
-        details = coins_config.get_coin_details()
-        assert details == []
+    _stub_open_error(monkeypatch, Exception("Test error"))
+    
+    coins_config = CoinsConfig()
+    details = coins_config.get_coin_details()
+    assert details == []
 
-def test_get_top_coins():
+@pytest.mark.parametrize("count,expected", [
+    (3, list(COINS_5[:3])),
+    # 전체보다 많이 요청하면 전체 반환
+    (10, list(COINS_5)),
+])
+def test_get_top_coins(count, expected, coins_cfg):
     """상위 N개 코인 조회 테스트"""
-    from config.coins_config import CoinsConfig
-    
-    test_data = {
-        "coins": ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    }
     
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            
-            # 상위 3개 코인 조회
-            top_3 = coins_config.get_top_coins(3)
-            assert len(top_3) == 3
-            assert top_3 == ["BTCUSDT", "ETHUSDT", "ADAUSDT"]
-            
-            # 상위 10개 코인 조회 (전체보다 많음)
-            top_10 = coins_config.get_top_coins(10)
-            assert len(top_10) == 5
-            assert top_10 == ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-
-def test_get_coin_by_index():
+    top = coins_cfg.get_top_coins(count)
+    assert len(top) == len(expected)
+    assert top == expected
+
+@pytest.mark.parametrize("idx,expected", [
+    # 유효한 인덱스
+    (0, "BTCUSDT"),
+    (2, "ADAUSDT"),
+    (4, "LINKUSDT"),
+    # 범위 밖 인덱스
+    (-1, None),
+    (5, None),
+    (10, None),
+])
+def test_get_coin_by_index(idx, expected, coins_cfg):
     """인덱스로 코인 조회 테스트"""
-    from config.coins_config import CoinsConfig
     
-    test_data = {
-        "coins": ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    }
-    
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            
-            # 유효한 인덱스
-            assert coins_config.get_coin_by_index(0) == "BTCUSDT"
-            assert coins_config.get_coin_by_index(2) == "ADAUSDT"
-            assert coins_config.get_coin_by_index(4) == "LINKUSDT"
-            
-            # 범위 밖 인덱스
-            assert coins_config.get_coin_by_index(-1) is None
-            assert coins_config.get_coin_by_index(5) is None
-            assert coins_config.get_coin_by_index(10) is None
-
-def test_get_total_coins():
+    assert coins_cfg.get_coin_by_index(idx) == expected
+
+def test_get_total_coins(coins_cfg):
     """총 코인 수 조회 테스트"""
-    from config.coins_config import CoinsConfig
     
-    test_data = {
-        "coins": ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    }
-    
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            assert coins_config.get_total_coins() == 5
+    assert coins_cfg.get_total_coins() == 5
 
-def test_print_coins_summary():
+def test_print_coins_summary(coins_cfg, capsys):
     """코인 요약 출력 테스트"""
-    from config.coins_config import CoinsConfig
     
-    test_data = {
-        "coins": ["BTCUSDT", "ETHUSDT", "ADAUSDT", "DOTUSDT", "LINKUSDT"]
-    }
-    
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            
-            # 출력 테스트 (예외 없이 실행되는지 확인)
-            try:
-                coins_config.print_coins_summary()
-                assert True  # 예외 없이 실행됨
-            except Exception as e:
-                assert False, f"출력 중 오류 발생: {e}"
-
-def test_coins_config_with_empty_list():
+    coins_cfg.print_coins_summary()
+    assert capsys.readouterr().out
+
+def test_coins_config_with_empty_list(monkeypatch):
     """빈 코인 리스트 테스트"""
-    from config.coins_config import CoinsConfig
     
     test_data = {
         "coins": []
     }
     
-    with patch("builtins.open", mock_open(read_data=json.dumps(test_data))):
-        with patch("json.load", return_value=test_data):
-            coins_config = CoinsConfig()
-            assert coins_config.coins == []
-            assert coins_config.get_total_coins() == 0
-            assert coins_config.get_top_coins(5) == []
-            assert coins_config.get_coin_by_index(0) is None
+    _stub_loader(monkeypatch, test_data)
+    
+    coins_config = CoinsConfig()
+    assert coins_config.coins == []
+    assert coins_config.get_total_coins() == 0
+    assert coins_config.get_top_coins(5) == []
+    assert coins_config.get_coin_by_index(0) is None
 
 if __name__ == "__main__":
     pytest.main([__file__, "-v"]) 
\ No newline at end of file
@@ -8,23 +8,72 @@ import sys
 import sqlite3
 import pytest
 import tempfile
-from datetime import datetime, timedelta
+import threading
+import time
+import uuid
 from unittest.mock import patch, MagicMock
 import pandas as pd
 from data.database import Database
 
+# 테스트 DB는 내구성이 필요 없으므로 저널/동기화를 메모리 수준으로 낮춤
+# (locking_mode=EXCLUSIVE 는 여러 연결로 확인하는 테스트가 있어 제외)
+FAST_PRAGMAS = (
+    "PRAGMA journal_mode=MEMORY",
+    "PRAGMA synchronous=OFF",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_pragmas():
+    """Database.connect() 로 여는 모든 연결에 FAST_PRAGMAS 적용 (테스트 전용)"""
+    connect = Database.connect
+    
+    def fast_connect(self, *args, **kwargs):
+        conn = connect(self, *args, **kwargs)
+        for pragma in FAST_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(Database, "connect", fast_connect)
+        yield
+
+@pytest.fixture(scope="session")
+def shared_db():
+    """세션 전체가 공유하는 인메모리 데이터베이스 (코인×간격 테이블 스키마는 한 번만 생성)"""
+    db_path = f"file:testdb_{uuid.uuid4().hex}?mode=memory&cache=shared"
+    # 공유 캐시 메모리 DB는 마지막 연결이 닫히면 사라지므로 세션 동안 연결 하나를 유지
+    keeper = sqlite3.connect(db_path, uri=True)
+    database = Database(db_path)
+    yield database
+    database.close()
+    keeper.close()
+
 @pytest.fixture
-def temp_db():
-    """임시 데이터베이스 생성"""
-    import tempfile
-    temp_db_path = tempfile.mktemp(suffix='.db')
-    yield temp_db_path
-    # 정리
-    try:
-        if os.path.exists(temp_db_path):
-            os.remove(temp_db_path)
-    except PermissionError:
-        pass  # 파일이 사용 중이면 무시
+def temp_db(shared_db, monkeypatch):
+    """공유 데이터베이스의 모든 행을 한 트랜잭션으로 비운 뒤 경로 반환
+    
+    테스트 안에서 만든 Database 의 재사용 연결은 테스트 종료 시 모두 닫음
+    """
+    with sqlite3.connect(shared_db.db_path, uri=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        for (table,) in cursor.fetchall():
+            cursor.execute(f"DELETE FROM {table}")
+    
+    databases = []
+    init = Database.__init__
+    
+    def tracking_init(self, *args, **kwargs):
+        init(self, *args, **kwargs)
+        databases.append(self)
+    
+    monkeypatch.setattr(Database, "__init__", tracking_init)
+    yield shared_db.db_path
+    
+    for database in databases:
+        database.close()
 
 def test_database_init(temp_db):
     """데이터베이스 초기화 테스트"""
@@ -33,7 +82,7 @@ def test_database_init(temp_db):
     database.init_database()
     
     # 기본 테이블 존재 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT name FROM sqlite_master WHERE type='table'")
         tables = [row[0] for row in cursor.fetchall()]
@@ -49,11 +98,12 @@ def test_database_init(temp_db):
 def test_save_price_data(temp_db):
     """가격 데이터 저장 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
     test_data = {
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -64,7 +114,7 @@ def test_save_price_data(temp_db):
     database.save_price_data('BTCUSDT', test_data)
     
     # 저장 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM price_data")
         count = cursor.fetchone()[0]
@@ -73,11 +123,12 @@ def test_save_price_data(temp_db):
 def test_save_price_data_to_coin_table(temp_db):
     """코인별 테이블에 가격 데이터 저장 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
     test_data = [{
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -88,15 +139,102 @@ def test_save_price_data_to_coin_table(temp_db):
     database.save_price_data_to_coin_table('BTCUSDT', '1m', test_data)
     
     # 저장 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM BTCUSDT_1m")
         count = cursor.fetchone()[0]
         assert count == 1
 
+def test_save_price_data_to_coin_table_multiple_batches(temp_db):
+    """다중 VALUES INSERT 배치 경계를 넘는 캔들 저장 테스트"""
+    
+    database = Database(temp_db)
+    
+    count = Database.INSERT_BATCH_ROWS * 2 + 1
+    test_data = [{
+        'timestamp': 1700000000000 + i * 60000,
+        'open': 100.0 + i,
+        'high': 110.0,
+        'low': 90.0,
+        'close': 105.0,
+        'volume': 1000.0
+    } for i in range(count)]
+    
+    database.save_price_data_to_coin_table('BTCUSDT', '1m', test_data)
+    
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), MAX(open_price) FROM BTCUSDT_1m")
+        assert cursor.fetchone() == (count, 100.0 + count - 1)
+    
+    assert database.get_last_collected_timestamp('BTCUSDT', '1m') == test_data[-1]['timestamp']
+
+def test_save_price_dataframe_to_coin_table(temp_db):
+    """코인별 테이블에 데이터프레임 일괄 저장 테스트"""
+    
+    database = Database(temp_db)
+    
+    base_ts = time.time_ns() // 1_000_000
+    df = pd.DataFrame({
+        'timestamp': [base_ts, base_ts + 60000, base_ts + 120000],
+        'open': [100.0, 101.0, 102.0],
+        'high': [110.0, 111.0, 112.0],
+        'low': [90.0, 91.0, 92.0],
+        'close': [105.0, 106.0, 107.0],
+        'volume': [1000.0, 1001.0, 1002.0]
+    })
+    
+    database.save_price_dataframe_to_coin_table('BTCUSDT', '1m', df)
+    database.save_price_dataframe_to_coin_table('BTCUSDT', '1m', df)  # 중복 저장
+    
+    # 저장 확인
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT COUNT(*), MIN(open_price) FROM BTCUSDT_1m")
+        count, min_open = cursor.fetchone()
+        assert count == 3
+        assert min_open == 100.0
+    
+    assert database.get_last_collected_timestamp('BTCUSDT', '1m') == base_ts + 120000
+
+def test_save_price_dataframe_to_coin_table_with_datetime_timestamps(temp_db):
+    """datetime64 타임스탬프 데이터프레임 저장 테스트 (밀리초 정수로 변환)"""
+    
+    database = Database(temp_db)
+    
+    base_ts = 1700000000000
+    df = pd.DataFrame({
+        'timestamp': pd.to_datetime([base_ts, base_ts + 60000], unit='ms'),
+        'open': [100.0, 101.0],
+        'high': [110.0, 111.0],
+        'low': [90.0, 91.0],
+        'close': [105.0, 106.0],
+        'volume': [1000.0, 1001.0]
+    })
+    
+    database.save_price_dataframe_to_coin_table('BTCUSDT', '1m', df)
+    
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT timestamp FROM BTCUSDT_1m ORDER BY timestamp")
+        assert [row[0] for row in cursor.fetchall()] == [base_ts, base_ts + 60000]
+    
+    assert database.get_last_collected_timestamp('BTCUSDT', '1m') == base_ts + 60000
+
+def test_save_price_dataframe_to_coin_table_with_empty_data(temp_db):
+    """빈 데이터프레임/None 저장 시 아무것도 기록하지 않음"""
+    
+    database = Database(temp_db)
+    
+    database.save_price_dataframe_to_coin_table('BTCUSDT', '1m', pd.DataFrame())
+    database.save_price_dataframe_to_coin_table('BTCUSDT', '1m', None)
+    
+    assert database.get_last_collected_timestamp('BTCUSDT', '1m') is None
+
 def test_save_sentiment_data(temp_db):
     """감정 데이터 저장 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
@@ -105,11 +243,11 @@ def test_save_sentiment_data(temp_db):
         headline="Bitcoin price surges",
         sentiment_score=0.8,
         keywords="bitcoin,price,surge",
-        timestamp=int(datetime.now().timestamp() * 1000)
+        timestamp=ts
     )
     
     # 저장 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM sentiment_data")
         count = cursor.fetchone()[0]
@@ -118,6 +256,7 @@ def test_save_sentiment_data(temp_db):
 def test_save_realtime_data(temp_db):
     """실시간 데이터 저장 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
@@ -125,11 +264,11 @@ def test_save_realtime_data(temp_db):
         symbol="BTCUSDT",
         price=50000.0,
         volume=100.0,
-        timestamp=int(datetime.now().timestamp() * 1000)
+        timestamp=ts
     )
     
     # 저장 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM realtime_data")
         count = cursor.fetchone()[0]
@@ -138,6 +277,7 @@ def test_save_realtime_data(temp_db):
 def test_save_trade(temp_db):
     """거래 기록 저장 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
@@ -146,26 +286,150 @@ def test_save_trade(temp_db):
         side="BUY",
         quantity=1.0,
         price=50000.0,
-        timestamp=int(datetime.now().timestamp() * 1000),
+        timestamp=ts,
         status="COMPLETED"
     )
     
     # 저장 확인
-    with sqlite3.connect(temp_db) as conn:
+    with sqlite3.connect(temp_db, uri=True) as conn:
         cursor = conn.cursor()
         cursor.execute("SELECT COUNT(*) FROM trades")
         count = cursor.fetchone()[0]
         assert count == 1
 
+def test_bulk_commits_all_saves_once(tmp_path):
+    """bulk() 블록 안의 저장이 블록 종료 시 한 번에 커밋되는지 테스트"""
+    
+    # 공유 캐시 메모리 DB는 커밋 전 테이블을 다른 연결이 읽으면 잠금 오류가 나므로 파일 DB 사용
+    temp_db = str(tmp_path / "bulk.db")
+    database = Database(temp_db)
+    
+    data_list = [{
+        'timestamp': 1000000 + i,
+        'open': 50000.0,
+        'high': 51000.0,
+        'low': 49000.0,
+        'close': 50500.0,
+        'volume': 1000.0
+    } for i in range(10)]
+    
+    with database.bulk():
+        database.save_price_data_to_coin_table('BTCUSDT', '1m', data_list)
+        for i in range(3):
+            database.save_trade('BTCUSDT', 'BUY', 1.0, 50000.0, 1000000 + i, 'COMPLETED')
+        
+        # 블록 안에서는 아직 다른 연결에 보이지 않음
+        with sqlite3.connect(temp_db, uri=True) as conn:
+            assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+    
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM BTCUSDT_1m").fetchone()[0] == 10
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 3
+
+def test_bulk_rolls_back_on_error(temp_db):
+    """bulk() 블록에서 예외 발생 시 전체 롤백 테스트"""
+    
+    database = Database(temp_db)
+    
+    with pytest.raises(RuntimeError):
+        with database.bulk():
+            database.save_trade('BTCUSDT', 'BUY', 1.0, 50000.0, 1000000, 'COMPLETED')
+            raise RuntimeError("중단")
+    
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+    
+    # 블록 종료 후에는 다시 호출마다 커밋
+    database.save_trade('BTCUSDT', 'BUY', 1.0, 50000.0, 1000000, 'COMPLETED')
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 1
+
+def test_bulk_refuses_open_transaction(tmp_path):
+    """session() 연결에 커밋되지 않은 변경이 있으면 bulk() 가 대신 커밋하지 않고 실패하는지 테스트"""
+    
+    temp_db = str(tmp_path / "pending.db")
+    database = Database(temp_db)
+    
+    with database.session() as conn:
+        conn.execute("INSERT INTO trades (symbol, side, quantity, price, timestamp, status) "
+                     "VALUES ('BTCUSDT', 'BUY', 1.0, 50000.0, 1000000, 'PENDING')")
+        
+        with pytest.raises(RuntimeError):
+            with database.bulk():
+                pass
+        
+        # 호출자의 변경은 여전히 커밋되지 않은 상태
+        assert conn.in_transaction
+        conn.rollback()
+    
+    with sqlite3.connect(temp_db, uri=True) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+
+def test_session_reuses_one_connection(temp_db):
+    """session() 블록 안의 저장/조회가 연결 하나를 공유하고 호출마다 커밋되는지 테스트"""
+    
+    database = Database(temp_db)
+    
+    with database.session() as conn:
+        database.save_trade('BTCUSDT', 'BUY', 1.0, 50000.0, 1000000, 'COMPLETED')
+        
+        # 세션 안에서도 호출마다 커밋되어 다른 연결에 보임
+        with sqlite3.connect(temp_db, uri=True) as other:
+            assert other.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 1
+        
+        # 세션 안의 bulk() 는 같은 연결에서 트랜잭션으로 묶임
+        with database.bulk():
+            database.save_trade('BTCUSDT', 'SELL', 1.0, 51000.0, 1000001, 'COMPLETED')
+            with database._connection() as shared:
+                assert shared is conn
+        
+        assert len(database.get_trades(symbol='BTCUSDT')) == 2
+    
+    with sqlite3.connect(temp_db, uri=True) as other:
+        assert other.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 2
+
+def test_connection_reused_per_thread(temp_db):
+    """블록 밖 호출이 스레드별 연결 하나를 재사용하고 close() 후 다시 여는지 테스트"""
+    
+    database = Database(temp_db)
+    
+    with database._connection() as first:
+        pass
+    with database._connection() as second:
+        assert second is first
+    
+    # 다른 스레드는 자기 연결을 따로 사용
+    other = []
+    
+    def use_connection():
+        with database._connection() as conn:
+            other.append(conn)
+    
+    thread = threading.Thread(target=use_connection)
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+    
+    # close() 는 다른 스레드가 연 연결까지 모두 닫음
+    database.close()
+    for conn in (first, other[0]):
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+    
+    with database._connection() as third:
+        assert third is not first
+    database.close()
+
 def test_get_price_data(temp_db):
     """가격 데이터 조회 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
     # 테스트 데이터 저장
     test_data = {
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -175,8 +439,8 @@ def test_get_price_data(temp_db):
     database.save_price_data('BTCUSDT', test_data)
     
     # 조회 테스트
-    start_time = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
-    end_time = int((datetime.now() + timedelta(hours=1)).timestamp() * 1000)
+    start_time = ts - 3600000
+    end_time = ts + 3600000
     
     df = database.get_price_data('BTCUSDT', start_time, end_time)
     assert len(df) == 1
@@ -184,6 +448,7 @@ def test_get_price_data(temp_db):
 def test_get_trades(temp_db):
     """거래 기록 조회 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
@@ -193,7 +458,7 @@ def test_get_trades(temp_db):
         side="BUY",
         quantity=1.0,
         price=50000.0,
-        timestamp=int(datetime.now().timestamp() * 1000),
+        timestamp=ts,
         status="COMPLETED"
     )
     
@@ -208,12 +473,13 @@ def test_get_trades(temp_db):
 def test_get_last_collected_timestamp(temp_db):
     """마지막 수집 타임스탬프 조회 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
     # 테스트 데이터 저장
     test_data = [{
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -241,12 +507,13 @@ def test_get_missing_data_period(temp_db):
 def test_get_database_info(temp_db):
     """데이터베이스 정보 조회 테스트"""
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     database.init_database()
     
     # 테스트 데이터 저장
     test_data = {
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -260,7 +527,7 @@ def test_get_database_info(temp_db):
         headline="Test headline",
         sentiment_score=0.5,
         keywords="test",
-        timestamp=int(datetime.now().timestamp() * 1000)
+        timestamp=ts
     )
     
     # 정보 조회
@@ -310,13 +577,13 @@ def test_database_table_creation(temp_db):
 
 def test_database_save_price_data_duplicate(temp_db):
     """중복 데이터 저장 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 동일한 데이터를 두 번 저장
     test_data = {
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -331,21 +598,21 @@ def test_database_save_price_data_duplicate(temp_db):
     database.save_price_data('BTCUSDT', test_data)
     
     # 데이터가 하나만 저장되었는지 확인
-    start_time = int((datetime.now() - timedelta(hours=1)).timestamp() * 1000)
-    end_time = int((datetime.now() + timedelta(hours=1)).timestamp() * 1000)
+    start_time = ts - 3600000
+    end_time = ts + 3600000
     
     df = database.get_price_data('BTCUSDT', start_time, end_time)
     assert len(df) == 1  # 중복 제거되어 1개만 있어야 함
 
 def test_database_save_price_data_to_coin_table_duplicate(temp_db):
     """코인 테이블 중복 데이터 저장 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 동일한 데이터를 두 번 저장
     test_data = [{
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0,
         'high': 110.0,
         'low': 90.0,
@@ -386,19 +653,21 @@ def test_database_get_missing_data_period_empty(temp_db):
 
 def test_database_save_sentiment_data_multiple(temp_db):
     """감정 데이터 다중 저장 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 여러 감정 데이터 저장
     sentiments = [
-        ('source1', 'headline1', 0.8, 'bitcoin,positive', int(datetime.now().timestamp() * 1000)),
-        ('source2', 'headline2', -0.5, 'ethereum,negative', int(datetime.now().timestamp() * 1000)),
-        ('source3', 'headline3', 0.2, 'crypto,neutral', int(datetime.now().timestamp() * 1000))
+        ('source1', 'headline1', 0.8, 'bitcoin,positive', ts),
+        ('source2', 'headline2', -0.5, 'ethereum,negative', ts),
+        ('source3', 'headline3', 0.2, 'crypto,neutral', ts)
     ]
     
-    for source, headline, score, keywords, timestamp in sentiments:
-        database.save_sentiment_data(source, headline, score, keywords, timestamp)
+    # 연결 하나와 트랜잭션 하나로 묶어 저장
+    with database.bulk():
+        for source, headline, score, keywords, timestamp in sentiments:
+            database.save_sentiment_data(source, headline, score, keywords, timestamp)
     
     # 저장된 데이터 확인
     with database.connect() as conn:
@@ -409,19 +678,21 @@ def test_database_save_sentiment_data_multiple(temp_db):
 
 def test_database_save_realtime_data_multiple(temp_db):
     """실시간 데이터 다중 저장 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 여러 실시간 데이터 저장
     realtime_data = [
-        ('BTCUSDT', 50000.0, 1000.0, int(datetime.now().timestamp() * 1000)),
-        ('ETHUSDT', 3000.0, 500.0, int(datetime.now().timestamp() * 1000)),
-        ('ADAUSDT', 0.5, 2000.0, int(datetime.now().timestamp() * 1000))
+        ('BTCUSDT', 50000.0, 1000.0, ts),
+        ('ETHUSDT', 3000.0, 500.0, ts),
+        ('ADAUSDT', 0.5, 2000.0, ts)
     ]
     
-    for symbol, price, volume, timestamp in realtime_data:
-        database.save_realtime_data(symbol, price, volume, timestamp)
+    # 연결 하나와 트랜잭션 하나로 묶어 저장
+    with database.bulk():
+        for symbol, price, volume, timestamp in realtime_data:
+            database.save_realtime_data(symbol, price, volume, timestamp)
     
     # 저장된 데이터 확인
     with database.connect() as conn:
@@ -432,19 +703,18 @@ def test_database_save_realtime_data_multiple(temp_db):
 
 def test_database_save_trade_multiple(temp_db):
     """거래 데이터 다중 저장 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 여러 거래 데이터 저장
     trades = [
-        ('BTCUSDT', 'BUY', 0.1, 50000.0, int(datetime.now().timestamp() * 1000), 'FILLED'),
-        ('ETHUSDT', 'SELL', 1.0, 3000.0, int(datetime.now().timestamp() * 1000), 'FILLED'),
-        ('ADAUSDT', 'BUY', 100.0, 0.5, int(datetime.now().timestamp() * 1000), 'PENDING')
+        ('BTCUSDT', 'BUY', 0.1, 50000.0, ts, 'FILLED'),
+        ('ETHUSDT', 'SELL', 1.0, 3000.0, ts, 'FILLED'),
+        ('ADAUSDT', 'BUY', 100.0, 0.5, ts, 'PENDING')
     ]
     
-    for symbol, side, quantity, price, timestamp, status in trades:
-        database.save_trade(symbol, side, quantity, price, timestamp, status)
+    database.save_trades(trades)
     
     # 저장된 데이터 확인
     with database.connect() as conn:
@@ -453,37 +723,64 @@ def test_database_save_trade_multiple(temp_db):
         count = cursor.fetchone()[0]
         assert count == 3
 
+def test_database_save_trades_empty_and_invalid(temp_db):
+    """거래 기록 일괄 저장 시 빈 목록은 무시하고 오류는 전파하지 않는지 테스트"""
+    database = Database(temp_db)
+    
+    database.save_trades([])
+    database.save_trades([('BTCUSDT', 'BUY', 0.1)])  # 컬럼 수 부족
+    
+    with database.connect() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+
 def test_database_get_trades_with_limit(temp_db):
     """거래 데이터 제한 조회 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
-    # 여러 거래 데이터 저장
-    for i in range(10):
-        database.save_trade(
-            'BTCUSDT', 
-            'BUY', 
-            0.1, 
-            50000.0 + i, 
-            int(datetime.now().timestamp() * 1000), 
-            'FILLED'
-        )
+    # 여러 거래 데이터 일괄 적재
+    database.bulk_load('trades', ['symbol', 'side', 'quantity', 'price', 'timestamp', 'status'], [
+        ('BTCUSDT', 'BUY', 0.1, 50000.0 + i, ts + i, 'FILLED')
+        for i in range(10)
+    ])
     
     # 제한된 개수로 조회
     df = database.get_trades(limit=5)
     assert len(df) == 5
 
+def test_database_bulk_load_restores_indexes(temp_db):
+    """bulk_load 가 보조 인덱스를 적재 후 다시 만들고, 실패 시 전체를 롤백하는지 테스트"""
+    database = Database(temp_db)
+    index_query = "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='BTCUSDT_1m' AND sql IS NOT NULL"
+    columns = ['timestamp', 'open_price', 'high_price', 'low_price', 'close_price', 'volume']
+    
+    database.bulk_load('BTCUSDT_1m', columns, [
+        (1700000000000 + i * 60000, 100.0, 110.0, 90.0, 105.0, 1000.0) for i in range(5)
+    ])
+    
+    with database.connect() as conn:
+        assert conn.execute(index_query).fetchall() == [('idx_BTCUSDT_1m_timestamp',)]
+        assert conn.execute("SELECT COUNT(*) FROM BTCUSDT_1m").fetchone()[0] == 5
+    
+    # UNIQUE(timestamp) 위반 - 인덱스 삭제까지 함께 롤백되어야 함
+    with pytest.raises(sqlite3.IntegrityError):
+        database.bulk_load('BTCUSDT_1m', columns, [(1700000000000, 100.0, 110.0, 90.0, 105.0, 1000.0)])
+    
+    with database.connect() as conn:
+        assert conn.execute(index_query).fetchall() == [('idx_BTCUSDT_1m_timestamp',)]
+        assert conn.execute("SELECT COUNT(*) FROM BTCUSDT_1m").fetchone()[0] == 5
+
 def test_database_get_trades_by_symbol(temp_db):
     """특정 심볼 거래 데이터 조회 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 여러 심볼의 거래 데이터 저장
-    database.save_trade('BTCUSDT', 'BUY', 0.1, 50000.0, int(datetime.now().timestamp() * 1000), 'FILLED')
-    database.save_trade('ETHUSDT', 'SELL', 1.0, 3000.0, int(datetime.now().timestamp() * 1000), 'FILLED')
-    database.save_trade('ADAUSDT', 'BUY', 100.0, 0.5, int(datetime.now().timestamp() * 1000), 'FILLED')
+    database.save_trade('BTCUSDT', 'BUY', 0.1, 50000.0, ts, 'FILLED')
+    database.save_trade('ETHUSDT', 'SELL', 1.0, 3000.0, ts, 'FILLED')
+    database.save_trade('ADAUSDT', 'BUY', 100.0, 0.5, ts, 'FILLED')
     
     # BTCUSDT만 조회
     df = database.get_trades(symbol='BTCUSDT')
@@ -492,21 +789,21 @@ def test_database_get_trades_by_symbol(temp_db):
 
 def test_database_get_database_info_detailed(temp_db):
     """데이터베이스 정보 상세 조회 테스트"""
-    from datetime import datetime
     
+    ts = time.time_ns() // 1_000_000
     database = Database(temp_db)
     
     # 각 테이블에 데이터 저장
     database.save_price_data('BTCUSDT', {
-        'timestamp': int(datetime.now().timestamp() * 1000),
+        'timestamp': ts,
         'open': 100.0, 'high': 110.0, 'low': 90.0, 'close': 105.0, 'volume': 1000.0
     })
     
-    database.save_sentiment_data('source1', 'headline1', 0.8, 'keywords', int(datetime.now().timestamp() * 1000))
+    database.save_sentiment_data('source1', 'headline1', 0.8, 'keywords', ts)
     
-    database.save_realtime_data('BTCUSDT', 50000.0, 1000.0, int(datetime.now().timestamp() * 1000))
+    database.save_realtime_data('BTCUSDT', 50000.0, 1000.0, ts)
     
-    database.save_trade('BTCUSDT', 'BUY', 0.1, 50000.0, int(datetime.now().timestamp() * 1000), 'FILLED')
+    database.save_trade('BTCUSDT', 'BUY', 0.1, 50000.0, ts, 'FILLED')
     
     # 데이터베이스 정보 조회
     info = database.get_database_info()
@@ -550,31 +847,28 @@ def test_database_init_error_handling():
         # 예외가 발생한 경우
         assert isinstance(e, Exception)
 
-def test_save_price_data_error_handling():
-    """가격 데이터 저장 오류 처리 테스트"""
-    import tempfile
-    import os
+# 잘못된 타입의 캔들 데이터
+INVALID_PRICE_DATA = {
+    'timestamp': 'invalid_timestamp',
+    'open': 'invalid_open',
+    'high': 'invalid_high',
+    'low': 'invalid_low',
+    'close': 'invalid_close',
+    'volume': 'invalid_volume'
+}
+
+@pytest.mark.parametrize("method,args", [
+    ("save_price_data", ('BTCUSDT', INVALID_PRICE_DATA)),
+    ("save_price_data_to_coin_table", ('BTCUSDT', '1m', [INVALID_PRICE_DATA])),
+    ("save_sentiment_data", ('invalid_source', 'invalid_headline', 'invalid_score', 'invalid_keywords', 'invalid_timestamp')),
+    ("save_realtime_data", ('BTCUSDT', 'invalid_price', 'invalid_volume', 'invalid_timestamp')),
+    ("save_trade", ('BTCUSDT', 'invalid_side', 'invalid_quantity', 'invalid_price', 'invalid_timestamp', 'invalid_status')),
+])
+def test_save_error_handling(temp_db, method, args):
+    """저장 메서드 오류 처리 테스트 (잘못된 데이터여도 예외가 전파되지 않아야 함)"""
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 데이터로 저장 시도
-        invalid_data = {
-            'timestamp': 'invalid_timestamp',  # 잘못된 타입
-            'open': 'invalid_open',
-            'high': 'invalid_high',
-            'low': 'invalid_low',
-            'close': 'invalid_close',
-            'volume': 'invalid_volume'
-        }
-        
-        # 오류가 발생해도 예외가 전파되지 않아야 함
-        try:
-            database.save_price_data('BTCUSDT', invalid_data)
-            assert True
-        except Exception as e:
-            assert False, f"예상치 못한 예외: {e}"
+    getattr(database, method)(*args)
 
 def test_save_price_data_to_table_error_handling():
     """테이블별 가격 데이터 저장 오류 처리 테스트"""
@@ -604,177 +898,62 @@ def test_save_price_data_to_table_error_handling():
         except Exception as e:
             assert False, f"예상치 못한 예외: {e}"
 
-def test_save_price_data_to_coin_table_error_handling():
-    """코인별 테이블 가격 데이터 저장 오류 처리 테스트"""
-    import tempfile
-    import os
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_coin_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 데이터로 저장 시도
-        invalid_data = [
-            {
-                'timestamp': 'invalid_timestamp',
-                'open': 'invalid_open',
-                'high': 'invalid_high',
-                'low': 'invalid_low',
-                'close': 'invalid_close',
-                'volume': 'invalid_volume'
-            }
-        ]
-        
-        # 오류가 발생해도 예외가 전파되지 않아야 함
-        try:
-            database.save_price_data_to_coin_table('BTCUSDT', '1m', invalid_data)
-            assert True
-        except Exception as e:
-            assert False, f"예상치 못한 예외: {e}"
-
-def test_get_price_data_error_handling():
+def test_get_price_data_error_handling(temp_db):
     """가격 데이터 조회 오류 처리 테스트"""
-    import tempfile
-    import os
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_query_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 타임스탬프로 조회 시도
-        result = database.get_price_data('BTCUSDT', 'invalid_start', 'invalid_end')
-        
-        # 빈 DataFrame이 반환되어야 함
-        assert isinstance(result, pd.DataFrame)
-        assert len(result) == 0
-
-def test_save_sentiment_data_error_handling():
-    """감정 데이터 저장 오류 처리 테스트"""
-    import tempfile
-    import os
-    
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_sentiment_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 데이터로 저장 시도
-        try:
-            database.save_sentiment_data('invalid_source', 'invalid_headline', 'invalid_score', 'invalid_keywords', 'invalid_timestamp')
-            assert True
-        except Exception as e:
-            assert False, f"예상치 못한 예외: {e}"
-
-def test_save_realtime_data_error_handling():
-    """실시간 데이터 저장 오류 처리 테스트"""
-    import tempfile
-    import os
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_realtime_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 데이터로 저장 시도
-        try:
-            database.save_realtime_data('BTCUSDT', 'invalid_price', 'invalid_volume', 'invalid_timestamp')
-            assert True
-        except Exception as e:
-            assert False, f"예상치 못한 예외: {e}"
-
-def test_save_trade_error_handling():
-    """거래 기록 저장 오류 처리 테스트"""
-    import tempfile
-    import os
+    # 잘못된 타임스탬프로 조회 시도
+    result = database.get_price_data('BTCUSDT', 'invalid_start', 'invalid_end')
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_trade_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 데이터로 저장 시도
-        try:
-            database.save_trade('BTCUSDT', 'invalid_side', 'invalid_quantity', 'invalid_price', 'invalid_timestamp', 'invalid_status')
-            assert True
-        except Exception as e:
-            assert False, f"예상치 못한 예외: {e}"
+    # 빈 DataFrame이 반환되어야 함
+    assert isinstance(result, pd.DataFrame)
+    assert len(result) == 0
 
-def test_get_trades_error_handling():
+def test_get_trades_error_handling(temp_db):
     """거래 기록 조회 오류 처리 테스트"""
-    import tempfile
-    import os
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_trades_error.db")
-        database = Database(db_path)
-        
-        # 잘못된 파라미터로 조회 시도
-        result = database.get_trades(symbol='invalid_symbol', limit='invalid_limit')
-        
-        # 빈 DataFrame이 반환되어야 함
-        assert isinstance(result, pd.DataFrame)
+    # 잘못된 파라미터로 조회 시도
+    result = database.get_trades(symbol='invalid_symbol', limit='invalid_limit')
+    
+    # 빈 DataFrame이 반환되어야 함
+    assert isinstance(result, pd.DataFrame)
 
-def test_get_last_collected_timestamp_error_handling():
+def test_get_last_collected_timestamp_error_handling(temp_db):
     """마지막 수집 타임스탬프 조회 오류 처리 테스트"""
-    import tempfile
-    import os
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_timestamp_error.db")
-        database = Database(db_path)
-        
-        # 존재하지 않는 심볼/간격 조회
-        result = database.get_last_collected_timestamp('INVALID_SYMBOL', 'invalid_interval')
-        
-        # None이 반환되어야 함
-        assert result is None
+    # 존재하지 않는 심볼/간격 조회
+    result = database.get_last_collected_timestamp('INVALID_SYMBOL', 'invalid_interval')
+    
+    # None이 반환되어야 함
+    assert result is None
 
-def test_get_missing_data_period_error_handling():
+def test_get_missing_data_period_error_handling(temp_db):
     """누락 데이터 기간 조회 오류 처리 테스트"""
-    import tempfile
-    import os
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_missing_error.db")
-        database = Database(db_path)
-        
-        # 존재하지 않는 심볼/간격 조회
-        result = database.get_missing_data_period('INVALID_SYMBOL', 'invalid_interval')
-        
-        # 딕셔너리가 반환되어야 함
-        assert isinstance(result, dict)
-        assert 'start_time' in result
-        assert 'end_time' in result
+    # 존재하지 않는 심볼/간격 조회
+    result = database.get_missing_data_period('INVALID_SYMBOL', 'invalid_interval')
+    
+    # 딕셔너리가 반환되어야 함
+    assert isinstance(result, dict)
+    assert 'start_time' in result
+    assert 'end_time' in result
 
-def test_get_database_info_error_handling():
+def test_get_database_info_error_handling(temp_db):
     """데이터베이스 정보 조회 오류 처리 테스트"""
-    import tempfile
-    import os
+    database = Database(temp_db)
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_info_error.db")
-        database = Database(db_path)
-        
-        # 정상적인 정보 조회
-        info = database.get_database_info()
-        
-        # 딕셔너리가 반환되어야 함
-        assert isinstance(info, dict)
-        assert 'price_data' in info
-        assert 'sentiment_data' in info
-        assert 'realtime_data' in info
-        assert 'trades' in info
-
-def test_database_connect():
-    """데이터베이스 연결 테스트"""
-    import tempfile
-    import os
+    # 정상적인 정보 조회
+    info = database.get_database_info()
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        db_path = os.path.join(temp_dir, "test_connect.db")
-        database = Database(db_path)
-        
-        # 연결 테스트
-        conn = database.connect()
-        assert conn is not None
-        conn.close()
+    # 딕셔너리가 반환되어야 함
+    assert isinstance(info, dict)
+    assert 'price_data' in info
+    assert 'sentiment_data' in info
+    assert 'realtime_data' in info
+    assert 'trades' in info
 
 def test_database_main():
     """메인 실행 테스트"""
@@ -845,20 +1024,48 @@ def test_database_table_creation_edge_cases():
         
         conn.close()
 
-def test_database_init_error_handling():
-    """데이터베이스 초기화 오류 처리 테스트"""
-    # 잘못된 경로로 데이터베이스 생성 시도
-    invalid_path = "/invalid/path/test.db"
+def test_database_coin_tables_created_in_one_transaction(tmp_path, monkeypatch):
+    """코인별 간격별 테이블 DDL이 하나의 트랜잭션으로 실행되는지 테스트"""
+    statements = []
+    connect = Database.connect
     
-    try:
-        database = Database(invalid_path)
-        # Windows에서는 경로가 생성될 수 있으므로 예외가 발생하지 않을 수 있음
-        assert True
-    except Exception as e:
-        # 예외가 발생한 경우
-        assert isinstance(e, Exception)
+    def traced_connect(self, *args, **kwargs):
+        conn = connect(self, *args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+    
+    monkeypatch.setattr(Database, "connect", traced_connect)
+    database = Database(str(tmp_path / "init.db"))
+    
+    statements = [statement.strip().rstrip(';') for statement in statements]
+    assert statements.count("BEGIN IMMEDIATE") == 1
+    assert statements.count("COMMIT") == 1
+    
+    with database.connect() as conn:
+        count = conn.execute("SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name LIKE '%USDT_%'").fetchone()[0]
+        assert count == 50 * 15
+
+def test_database_init_skips_current_schema(temp_db, monkeypatch):
+    """user_version 이 현재 스키마 버전이면 init_database 가 DDL을 실행하지 않는지 테스트"""
+    database = Database(temp_db)
+    
+    with database.connect() as conn:
+        assert conn.execute("PRAGMA user_version").fetchone()[0] == Database.SCHEMA_VERSION
+    
+    statements = []
+    connect = Database.connect
+    
+    def traced_connect(self, *args, **kwargs):
+        conn = connect(self, *args, **kwargs)
+        conn.set_trace_callback(statements.append)
+        return conn
+    
+    monkeypatch.setattr(Database, "connect", traced_connect)
+    database.init_database()
+    
+    assert not any("CREATE" in statement for statement in statements)
 
-def test_database_connection_context_manager():
+def test_database_connection_context_manager(temp_db):
     """데이터베이스 연결 컨텍스트 매니저 테스트"""
     database = Database(temp_db)
     
@@ -869,7 +1076,7 @@ def test_database_connection_context_manager():
         tables = cursor.fetchall()
         assert len(tables) > 0
 
-def test_database_save_price_data_to_table_with_empty_data():
+def test_database_save_price_data_to_table_with_empty_data(temp_db):
     """빈 데이터로 테이블 저장 테스트"""
     database = Database(temp_db)
     
@@ -880,7 +1087,7 @@ def test_database_save_price_data_to_table_with_empty_data():
     # 오류 없이 실행되어야 함
     assert True
 
-def test_database_save_price_data_to_coin_table_with_empty_data():
+def test_database_save_price_data_to_coin_table_with_empty_data(temp_db):
     """빈 데이터로 코인 테이블 저장 테스트"""
     database = Database(temp_db)
     
@@ -891,7 +1098,7 @@ def test_database_save_price_data_to_coin_table_with_empty_data():
     # 오류 없이 실행되어야 함
     assert True
 
-def test_database_get_price_data_with_invalid_symbol():
+def test_database_get_price_data_with_invalid_symbol(temp_db):
     """잘못된 심볼로 가격 데이터 조회 테스트"""
     database = Database(temp_db)
     
@@ -902,7 +1109,7 @@ def test_database_get_price_data_with_invalid_symbol():
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 0
 
-def test_database_get_trades_with_invalid_symbol():
+def test_database_get_trades_with_invalid_symbol(temp_db):
     """잘못된 심볼로 거래 데이터 조회 테스트"""
     database = Database(temp_db)
     
@@ -913,7 +1120,7 @@ def test_database_get_trades_with_invalid_symbol():
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 0
 
-def test_database_get_trades_with_zero_limit():
+def test_database_get_trades_with_zero_limit(temp_db):
     """제한이 0인 거래 데이터 조회 테스트"""
     database = Database(temp_db)
     
@@ -924,7 +1131,7 @@ def test_database_get_trades_with_zero_limit():
     assert isinstance(result, pd.DataFrame)
     assert len(result) == 0
 
-def test_database_simple_coverage_improvement():
+def test_database_simple_coverage_improvement(temp_db):
     """간단한 커버리지 개선 테스트"""
     database = Database(temp_db)
     
@@ -967,7 +1174,7 @@ def test_database_simple_coverage_improvement():
     assert 'start_time' in result
     assert 'end_time' in result
 
-def test_database_error_handling_coverage():
+def test_database_error_handling_coverage(temp_db):
     """오류 처리 커버리지 테스트"""
     database = Database(temp_db)
     
@@ -1009,7 +1216,7 @@ def test_database_error_handling_coverage():
     except Exception as e:
         assert False, f"예상치 못한 예외: {e}"
 
-def test_database_table_creation_coverage():
+def test_database_table_creation_coverage(temp_db):
     """테이블 생성 커버리지 테스트"""
     database = Database(temp_db)
     
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+DatabaseChecker 점검/리포트 테스트
+"""
+
+import os
+import sqlite3
+import pytest
+from data.database import Database
+from scripts import database_checker
+from scripts.database_checker import DatabaseChecker, _q
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    """스키마가 만들어진 임시 DB 경로 (점검기의 기본 Database/리포트 파일도 임시 디렉토리에 생성)"""
+    monkeypatch.chdir(tmp_path)
+    path = str(tmp_path / "trading_bot.db")
+    Database(path)
+    return path
+
+def _insert_prices(path, rows):
+    """price_data 에 (symbol, timestamp, price) 행 추가"""
+    conn = sqlite3.connect(path)
+    conn.executemany(
+        "INSERT INTO price_data (symbol, timestamp, open_price, high_price, low_price, close_price, volume) "
+        "VALUES (?, ?, ?, ?, ?, ?, 1.0)",
+        [(symbol, ts, price, price, price, price) for symbol, ts, price in rows]
+    )
+    conn.commit()
+    conn.close()
+
+def test_null_and_duplicate_counts(db_path):
+    """컬럼별 NULL 수와 중복 행 수 집계 테스트"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE notes (a INTEGER, b TEXT)")
+    conn.executemany("INSERT INTO notes VALUES (?, ?)", [(1, 'x'), (1, 'x'), (1, 'x'), (2, None)])
+    conn.commit()
+    conn.close()
+    
+    quality = DatabaseChecker(db_path).check_data_quality()
+    notes = quality['data_consistency']['notes']
+    
+    assert notes['total_rows'] == 4
+    assert notes['null_counts'] == {'a': 0, 'b': 1}
+    assert notes['duplicate_rows'] == 2
+    assert len(notes['issues']) == 2
+
+def test_time_budget_marks_table_timeout(db_path):
+    """시간 예산을 넘긴 테이블 스캔은 중단되고 TIMEOUT 으로 표시"""
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE big (a INTEGER, b INTEGER)")
+    conn.executemany("INSERT INTO big VALUES (?, ?)", ((i, i) for i in range(50000)))
+    conn.commit()
+    conn.close()
+    
+    integrity = DatabaseChecker(db_path, budget_sec=1e-9).check_database_integrity()
+    
+    assert integrity['tables']['big']['status'] == 'TIMEOUT'
+    assert integrity['overall_status'] in ('WARNING', 'ERROR')
+
+def test_row_estimate_used_after_analyze(db_path, monkeypatch):
+    """ANALYZE 후 sqlite_stat1 추정치가 있으면 COUNT(*) 대신 ESTIMATED 로 보고"""
+    _insert_prices(db_path, [('BTCUSDT', 1700000000000 + i * 60000, 100.0) for i in range(20)])
+    monkeypatch.setattr(database_checker, 'ROW_ESTIMATE_TRUST_THRESHOLD', 1)
+    
+    checker = DatabaseChecker(db_path)
+    before = checker.check_database_performance()['query_performance']['price_data']
+    assert before['status'] != 'ESTIMATED'
+    
+    checker.analyze()
+    after = checker.check_database_performance()['query_performance']['price_data']
+    
+    assert after['status'] == 'ESTIMATED'
+    assert after['row_count'] == 20
+    assert after['count_query_time'] is None
+
+def test_generate_report_writes_file(db_path):
+    """HTML 리포트 파일이 생성되고 점검 섹션과 심볼별 구간 표가 포함되는지 테스트"""
+    _insert_prices(db_path, [('BTCUSDT', 1700000000000 + i * 60000, 100.0) for i in range(5)])
+    
+    report_file = DatabaseChecker(db_path, price_gaps=True).generate_report()
+    
+    assert report_file is not None and os.path.exists(report_file)
+    with open(report_file, encoding='utf-8') as f:
+        html = f.read()
+    assert '무결성 점검 결과' in html
+    assert '심볼별 가격 데이터 구간' in html
+    assert html.rstrip().endswith('</html>')
+
+@pytest.mark.parametrize("name", ["price_data; DROP TABLE x", 'a"b', "1abc", "", "a b"])
+def test_q_rejects_bad_identifiers(name):
+    """허용되지 않는 식별자는 ValueError"""
+    with pytest.raises(ValueError):
+        _q(name)
+
+def test_q_quotes_identifier():
+    """정상 식별자는 큰따옴표로 인용"""
+    assert _q("btcusdt_1m") == '"btcusdt_1m"'
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
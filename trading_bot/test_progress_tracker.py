@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+ProgressTracker 스냅샷/이벤트 로그 테스트
+"""
+
+import os
+import json
+import pytest
+from scripts.progress_tracker import ProgressTracker
+
+def test_missing_snapshot_discards_leftover_log(tmp_path):
+    """스냅샷 파일이 없으면 남아 있는 이벤트 로그를 재적용하지 않고 처음부터 시작"""
+    progress_file = str(tmp_path / "data_collection_progress.json")
+    
+    tracker = ProgressTracker(progress_file)
+    tracker.start_coin_collection('BTCUSDT')
+    tracker.start_interval_collection('BTCUSDT', '1m')
+    tracker.complete_interval_collection('BTCUSDT', '1m')
+    assert os.path.getsize(tracker.log_file) > 0
+    
+    os.remove(progress_file)
+    tracker = ProgressTracker(progress_file)
+    
+    assert tracker.progress['current_coin'] is None
+    assert tracker.get_remaining_intervals('BTCUSDT', ['1m', '3m']) == ['1m', '3m']
+    assert os.path.getsize(tracker.log_file) == 0
+
+def test_concurrent_intervals_tracked_together(tmp_path):
+    """동시에 수집 중인 간격이 모두 진행 중으로 남고, 하나가 끝나도 나머지는 유지되는지 테스트"""
+    tracker = ProgressTracker(str(tmp_path / "data_collection_progress.json"))
+    tracker.start_coin_collection('BTCUSDT')
+    for interval in ('1m', '3m', '5m'):
+        tracker.start_interval_collection('BTCUSDT', interval)
+    
+    tracker.complete_interval_collection('BTCUSDT', '1m')
+    tracker.fail_interval_collection('BTCUSDT', '5m', "데이터 없음")
+    
+    assert tracker.get_progress_summary()['current_intervals'] == ['3m']
+    assert tracker.get_remaining_intervals('BTCUSDT', ['1m', '15m', '3m', '5m']) == ['3m', '15m']
+    
+    # 중단 후 재시작해도 진행 중이던 간격이 먼저 재개됨
+    tracker.flush()
+    tracker = ProgressTracker(tracker.progress_file)
+    assert tracker.get_remaining_intervals('BTCUSDT', ['1m', '15m', '3m', '5m']) == ['3m', '15m']
+
+def test_legacy_current_interval_migrated(tmp_path):
+    """이전 형식의 단일 current_interval 이 로드 시 current_intervals 목록으로 변환되는지 테스트"""
+    tracker = ProgressTracker(str(tmp_path / "data_collection_progress.json"))
+    tracker.start_coin_collection('BTCUSDT')
+    tracker.flush()
+    
+    with open(tracker.progress_file, encoding='utf-8') as f:
+        progress = json.load(f)
+    coin_progress = progress['current_coin_progress']
+    del coin_progress['current_intervals']
+    coin_progress['current_interval'] = '3m'
+    with open(tracker.progress_file, 'w', encoding='utf-8') as f:
+        json.dump(progress, f)
+    
+    tracker = ProgressTracker(tracker.progress_file)
+    
+    assert 'current_interval' not in tracker.progress['current_coin_progress']
+    assert tracker.get_progress_summary()['current_intervals'] == ['3m']
+    assert tracker.get_remaining_intervals('BTCUSDT', ['1m', '3m']) == ['3m', '1m']
+
+def _crash_tracker(tmp_path):
+    """코인 시작 스냅샷 이후 간격 이벤트를 로그에만 남긴 추적기 (flush 없이 중단된 상황)"""
+    tracker = ProgressTracker(str(tmp_path / "data_collection_progress.json"))
+    tracker.start_coin_collection('BTCUSDT')
+    tracker.start_interval_collection('BTCUSDT', '1m')
+    tracker.complete_interval_collection('BTCUSDT', '1m')
+    tracker.start_interval_collection('BTCUSDT', '3m')
+    assert tracker._dirty and os.path.getsize(tracker.log_file) > 0
+    return tracker
+
+def test_replay_after_crash_without_flush(tmp_path):
+    """스냅샷에 저장되지 않은 이벤트가 재시작 시 로그에서 재적용되는지 테스트"""
+    tracker = _crash_tracker(tmp_path)
+    
+    tracker = ProgressTracker(tracker.progress_file)
+    
+    summary = tracker.get_progress_summary()
+    assert summary['current_coin'] == 'BTCUSDT'
+    assert summary['total_completed_intervals'] == 1
+    assert summary['current_intervals'] == ['3m']
+    assert tracker.get_remaining_intervals('BTCUSDT', ['1m', '3m', '5m']) == ['3m', '5m']
+
+def test_snapshot_events_not_applied_twice(tmp_path, monkeypatch):
+    """스냅샷 저장 후 로그를 비우기 전에 중단되어도 log_seq 이하 이벤트는 다시 적용하지 않음"""
+    # 스냅샷 교체 직후 로그 truncate 전에 중단된 상황 재현
+    monkeypatch.setattr(os, 'ftruncate', lambda fd, length: None)
+    tracker = _crash_tracker(tmp_path)
+    tracker.complete_interval_collection('BTCUSDT', '3m')
+    tracker.complete_coin_collection('BTCUSDT')
+    monkeypatch.undo()
+    assert os.path.getsize(tracker.log_file) > 0
+    
+    tracker = ProgressTracker(tracker.progress_file)
+    
+    summary = tracker.get_progress_summary()
+    assert tracker.progress['total_completed'] == 1
+    assert summary['completed_coins'] == 1
+    assert summary['total_completed_intervals'] == 2
+    assert summary['current_coin'] is None
+
+def test_truncated_last_log_line_ignored(tmp_path):
+    """기록 도중 끊긴 마지막 로그 줄은 무시하고 제거해 이후 이벤트가 온전히 남는지 테스트"""
+    tracker = _crash_tracker(tmp_path)
+    with open(tracker.log_file, 'ab') as f:
+        f.write(b'{"seq":99,"op":"complete_int')
+    
+    tracker = ProgressTracker(tracker.progress_file)
+    assert tracker.get_progress_summary()['total_completed_intervals'] == 1
+    
+    tracker.complete_interval_collection('BTCUSDT', '3m')
+    tracker = ProgressTracker(tracker.progress_file)
+    assert tracker.get_progress_summary()['total_completed_intervals'] == 2
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])